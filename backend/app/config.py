@@ -19,6 +19,16 @@ class Settings(BaseSettings):
 
     # AI
     GEMINI_API_KEY: str = ""
+    AI_CLIENT: str = "gemini"  # "gemini" | "fake" (외부 호출 없는 로컬/테스트용)
+    # AI 요약 사전 생성 — 최근 AI_PRECOMPUTE_ACTIVE_DAYS 일 안에 조회된 (사용자, 워크스페이스, 범위)를
+    # 매일 AI_PRECOMPUTE_HOUR_KST 시(KST)에 미리 만들어 아침 첫 조회도 캐시에서 바로 나가게 한다
+    AI_PRECOMPUTE_ENABLED: bool = False
+    AI_PRECOMPUTE_HOUR_KST: int = 6
+    AI_PRECOMPUTE_ACTIVE_DAYS: int = 14
+    AI_PRECOMPUTE_CONCURRENCY: int = 2
+    # 업무 보고서 결과 캐시 — 같은 프롬프트(같은 작업 데이터/양식)면 AI 를 다시 부르지 않음
+    AI_EXPORT_CACHE_TTL: int = 600
+    AI_EXPORT_CACHE_MAX_ENTRIES: int = 200
 
     # Social auth
     GOOGLE_CLIENT_ID: str = ""
@@ -32,6 +42,31 @@ class Settings(BaseSettings):
     # Mattermost (채널 Incoming Webhook URL — 관리자가 생성한 것)
     MATTERMOST_WEBHOOK_URL: str = ""
 
+    # WebSocket 백플레인: "memory"(단일 워커) | "postgres"(LISTEN/NOTIFY, 멀티 워커/노드)
+    WS_BACKPLANE: str = "memory"
+
+    # 인증 캐시 (get_current_user) — 사용자 스냅샷 / JWT 디코드 결과 보관 시간(초)
+    AUTH_USER_CACHE_TTL: int = 60
+    AUTH_TOKEN_CACHE_TTL: int = 300
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    # 사용자별 접근 가능 프로젝트 id 캐시 (초)
+    ACCESS_CACHE_TTL: int = 60
+
+    # 응답 직렬화/압축 — JSON_RESPONSE: "orjson" | "std"
+    JSON_RESPONSE: str = "orjson"
+    COMPRESSION_MIN_SIZE: int = 1024  # 이 크기(바이트) 미만 응답은 압축하지 않음
+    GZIP_LEVEL: int = 6
+    BROTLI_QUALITY: int = 4
+
+    # GitHub API 클라이언트 — 공용 커넥션 풀 + 응답 캐시(ETag 재검증)
+    GITHUB_API_URL: str = "https://api.github.com"
+    GITHUB_CACHE_MAX_ENTRIES: int = 2000
+    GITHUB_CACHE_TTL: int = 3600  # ETag 재검증용으로 응답을 보관하는 시간(초)
+    GITHUB_CACHE_FRESH_SECONDS: int = 30  # 이 시간 안의 같은 요청은 GitHub 에 묻지 않음 (응답 max-age 가 더 짧으면 그쪽)
+    # GitHub 웹훅 (POST /api/github/webhook) — 레포 Webhook 설정의 Secret 과 같은 값. 비어 있으면 수신 거부
+    GITHUB_WEBHOOK_SECRET: str = ""
+    GITHUB_WEBHOOK_FRESH_SECONDS: int = 600  # 웹훅이 오는 레포는 변경 시 무효화되므로 캐시를 더 오래 신뢰
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -2,6 +2,7 @@
 데이터베이스 연결 설정
 """
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
@@ -13,6 +14,9 @@ DATABASE_URL = (
     f"@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
 )
 
+# 비동기 드라이버(asyncpg)용 연결 문자열 — 이벤트 루프를 막지 않는 라우터에서 사용
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
 # 디버깅: 연결 정보 출력 (비밀번호는 숨김)
 print(f"[Database] Connecting to: postgresql://{settings.DB_USER}:***@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}")
 
@@ -30,6 +34,25 @@ engine = create_engine(
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 — 동기 엔진과 별도의 커넥션 풀을 가진다
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=5,
+    max_overflow=5,
+    pool_timeout=30,
+    pool_recycle=1800,
+)
+
+# 비동기 세션 팩토리
+# expire_on_commit=False: 커밋 후 속성 접근 시 lazy load(= 암묵적 I/O)가 일어나지 않도록 함
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base 클래스 (모든 모델이 상속받을 클래스)
 Base = declarative_base()
 
@@ -45,3 +68,12 @@ def get_db():
     finally:
         db.close()
 
+
+
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션 의존성 함수
+    await db.execute(select(...)) 형태로 사용하며, 쿼리 중에도 이벤트 루프를 양보한다.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
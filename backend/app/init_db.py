@@ -2,93 +2,19 @@
 
 import uuid
 
-from sqlalchemy import inspect, text
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.database import Base, SessionLocal, engine
-from app.models.comment_reaction import CommentReaction  # noqa: F401
-from app.models.message_reaction import MessageReaction  # noqa: F401
-from app.models.sprint import Sprint  # noqa: F401
+from app.database import SessionLocal, engine
+from app.migrations import upgrade
 from app.models.user import User
 from app.utils.security import get_password_hash
+from app.utils.startup import report, startup_phase
 
-# Create tables for new environments.
-Base.metadata.create_all(bind=engine)
-
-
-def run_migrations():
-    """Add missing columns/indexes for existing environments."""
-    inspector = inspect(engine)
 
+def approve_pending_users():
+    """Approve non-admin users that are still pending (runs on every boot)."""
     with engine.connect() as conn:
-        if "tasks" in inspector.get_table_names():
-            columns = [col["name"] for col in inspector.get_columns("tasks")]
-            if "display_order" not in columns:
-                conn.execute(
-                    text(
-                        "ALTER TABLE tasks "
-                        "ADD COLUMN display_order INTEGER DEFAULT 0 NOT NULL"
-                    )
-                )
-                conn.commit()
-                print("[migration] added tasks.display_order")
-            if "sprint_id" not in columns:
-                conn.execute(text("ALTER TABLE tasks ADD COLUMN sprint_id VARCHAR"))
-                conn.commit()
-                print("[migration] added tasks.sprint_id")
-            conn.execute(
-                text(
-                    "CREATE INDEX IF NOT EXISTS ix_tasks_sprint_id "
-                    "ON tasks(sprint_id)"
-                )
-            )
-            conn.commit()
-            if "parent_task_id" not in columns:
-                conn.execute(text("ALTER TABLE tasks ADD COLUMN parent_task_id VARCHAR"))
-                conn.commit()
-                print("[migration] added tasks.parent_task_id")
-            conn.execute(
-                text(
-                    "CREATE INDEX IF NOT EXISTS ix_tasks_parent_task_id "
-                    "ON tasks(parent_task_id)"
-                )
-            )
-            conn.commit()
-            if "site_tags" not in columns:
-                conn.execute(
-                    text(
-                        "ALTER TABLE tasks "
-                        "ADD COLUMN site_tags VARCHAR[] DEFAULT '{}' NOT NULL"
-                    )
-                )
-                conn.commit()
-                print("[migration] added tasks.site_tags")
-
-        if "projects" in inspector.get_table_names():
-            columns = [col["name"] for col in inspector.get_columns("projects")]
-            if "workspace_id" not in columns:
-                conn.execute(text("ALTER TABLE projects ADD COLUMN workspace_id VARCHAR"))
-                conn.commit()
-                print("[migration] added projects.workspace_id")
-            if "creator_id" not in columns:
-                conn.execute(text("ALTER TABLE projects ADD COLUMN creator_id VARCHAR"))
-                conn.commit()
-                print("[migration] added projects.creator_id")
-
-        if "chat_rooms" in inspector.get_table_names():
-            columns = [col["name"] for col in inspector.get_columns("chat_rooms")]
-            if "workspace_id" not in columns:
-                conn.execute(text("ALTER TABLE chat_rooms ADD COLUMN workspace_id VARCHAR"))
-                conn.commit()
-                print("[migration] added chat_rooms.workspace_id")
-            conn.execute(
-                text(
-                    "CREATE INDEX IF NOT EXISTS "
-                    "ix_chat_rooms_workspace_id ON chat_rooms(workspace_id)"
-                )
-            )
-            conn.commit()
-
         try:
             conn.execute(
                 text(
@@ -103,9 +29,6 @@ def run_migrations():
             pass
 
 
-run_migrations()
-
-
 def init_db():
     """Create default admin user if missing."""
     db: Session = SessionLocal()
@@ -134,4 +57,11 @@ def init_db():
 
 
 if __name__ == "__main__":
-    init_db()
+    # Schema migrations run once here, before the API workers start.
+    with startup_phase("migrations"):
+        upgrade()
+    with startup_phase("approve users"):
+        approve_pending_users()
+    with startup_phase("seed admin"):
+        init_db()
+    report("init_db")
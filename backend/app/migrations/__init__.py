@@ -0,0 +1,4 @@
+"""버전 기반 스키마 마이그레이션 (app.migrations.runner / app.migrations.versions)"""
+from app.migrations.runner import pending_migrations, status, upgrade
+
+__all__ = ["pending_migrations", "status", "upgrade"]
@@ -0,0 +1,60 @@
+"""
+스키마 마이그레이션 / 데이터 백필 CLI
+
+Usage:
+  cd backend
+  python -m app.migrations            # upgrade
+  python -m app.migrations upgrade
+  python -m app.migrations status
+  python -m app.migrations backfill   # 등록된 백필 목록
+  python -m app.migrations backfill <name> [--batch-size 1000] [--pause 0.1] [--restart]
+"""
+import argparse
+import sys
+
+from app.migrations.runner import status, upgrade
+
+
+def _backfill(args) -> None:
+    from app.migrations.backfill import BACKFILLS, BackfillLocked, run_backfill
+
+    if not args.name:
+        for backfill in BACKFILLS.values():
+            print(f"{backfill.name:<32} {backfill.description}")
+        return
+    backfill = BACKFILLS.get(args.name)
+    if backfill is None:
+        sys.exit(f"[backfill] unknown backfill: {args.name} (available: {', '.join(BACKFILLS)})")
+    try:
+        run_backfill(backfill, batch_size=args.batch_size, restart=args.restart, pause=args.pause)
+    except BackfillLocked as e:
+        sys.exit(f"[backfill] {e}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.migrations")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("upgrade")
+    commands.add_parser("status")
+    backfill = commands.add_parser("backfill")
+    backfill.add_argument("name", nargs="?")
+    backfill.add_argument("--batch-size", type=int, default=1000)
+    backfill.add_argument("--pause", type=float, default=0.0, help="청크 사이 대기 (초)")
+    backfill.add_argument("--restart", action="store_true", help="진행 기록을 지우고 처음부터")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        pending = status()
+        if not pending:
+            print("[migrate] schema is up to date")
+        for migration in pending:
+            print(f"[migrate] pending {migration.version:03d} {migration.name}")
+        return
+    if args.command == "backfill":
+        _backfill(args)
+        return
+    upgrade()
+
+
+if __name__ == "__main__":
+    main()
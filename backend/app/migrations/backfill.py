@@ -0,0 +1,153 @@
+"""
+청크 단위 데이터 백필
+
+큰 테이블을 한 번에 UPDATE 하면 긴 트랜잭션 동안 행 잠금과 WAL 이 쌓인다.
+Backfill 은 key 컬럼 순서로 batch_size 행씩 나눠 실행하고 청크마다 커밋한다.
+
+- 재개 가능: 마지막으로 처리한 key 를 backfill_progress 에 기록한다. 중간에 멈춰도 다시 실행하면 이어서 한다.
+- 진행 표시: 청크마다 처리 행 수 / 전체 / 변경 행 수 / 속도를 출력한다.
+- 동시 실행 방지: 백필 이름별 pg_try_advisory_lock.
+
+key 는 유일한 문자열 컬럼(보통 id)이다.
+sql 은 (:lo, :hi] 범위의 key 만 건드리는 문장이어야 하고 rowcount 가 "변경된 행 수" 로 집계된다.
+이미 처리된 행을 다시 만나도 결과가 같도록(멱등) 작성한다.
+
+    python -m app.migrations backfill                       # 등록된 백필 목록
+    python -m app.migrations backfill workspace_owner_observers --batch-size 2000
+    python -m app.migrations backfill workspace_owner_observers --restart
+"""
+import time
+from typing import Dict, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+
+class Backfill(NamedTuple):
+    name: str
+    table: str
+    key: str
+    sql: str
+    description: str = ""
+
+
+class BackfillLocked(Exception):
+    """같은 백필이 다른 프로세스에서 실행 중"""
+
+
+# 워크스페이스 오너를 그 워크스페이스 작업의 참조자로 추가 (마이그레이션 028 과 같은 UPDATE 의 청크 버전)
+# 스키마 백필이므로 updated_at 은 건드리지 않는다 — 사용자 수정처럼 보이면 최근 완료 목록/ETag 가 흔들린다
+WORKSPACE_OWNER_OBSERVERS_SQL = """
+    UPDATE tasks t
+    SET observer_ids = array_append(t.observer_ids, w.owner_id)
+    FROM projects p
+    JOIN workspaces w ON w.id = p.workspace_id
+    WHERE t.project_id = p.id
+      AND NOT (w.owner_id = ANY(t.observer_ids))
+"""
+
+# 이미 적용된 DB 인지 — 작업 생성 시 오너를 참조자로 넣는 코드와 예전 기동 시 백필이 돌았던 DB 에는
+# 오너가 참조자인 작업이 있다. 그 뒤 사용자가 일부러 뺀 참조자를 다시 넣지 않도록 이때는 건너뛴다.
+WORKSPACE_OWNER_OBSERVERS_APPLIED_SQL = """
+    SELECT EXISTS (
+        SELECT 1
+        FROM tasks t
+        JOIN projects p ON p.id = t.project_id
+        JOIN workspaces w ON w.id = p.workspace_id
+        WHERE w.owner_id = ANY(t.observer_ids)
+    )
+"""
+
+BACKFILLS: Dict[str, Backfill] = {
+    backfill.name: backfill
+    for backfill in [
+        Backfill(
+            "workspace_owner_observers",
+            table="tasks",
+            key="id",
+            sql=WORKSPACE_OWNER_OBSERVERS_SQL + "      AND t.id > :lo AND t.id <= :hi\n",
+            description="워크스페이스 오너를 작업 참조자(observer_ids)에 추가",
+        ),
+    ]
+}
+
+
+def _progress(conn: Connection, name: str) -> Optional[str]:
+    return conn.execute(
+        text("SELECT last_key FROM backfill_progress WHERE name = :name AND finished_at IS NULL"),
+        {"name": name},
+    ).scalar()
+
+
+def _save_progress(conn: Connection, name: str, last_key: Optional[str], rows: int, finished: bool) -> None:
+    conn.execute(text("""
+        INSERT INTO backfill_progress (name, last_key, rows_done, finished_at, updated_at)
+        VALUES (:name, :last_key, :rows, CASE WHEN :finished THEN now() END, now())
+        ON CONFLICT (name) DO UPDATE SET
+            last_key = EXCLUDED.last_key,
+            rows_done = backfill_progress.rows_done + :rows,
+            finished_at = EXCLUDED.finished_at,
+            updated_at = now()
+    """), {"name": name, "last_key": last_key, "rows": rows, "finished": finished})
+
+
+def run_backfill(
+    backfill: Backfill,
+    engine: Engine = None,
+    batch_size: int = 1000,
+    restart: bool = False,
+    pause: float = 0.0,
+) -> int:
+    """백필 실행. 변경된 행 수 합계를 돌려준다. pause 초만큼 청크 사이에 쉬어 운영 DB 부하를 낮춘다."""
+    if engine is None:
+        from app.database import engine
+
+    table, key = backfill.table, backfill.key
+    next_chunk = text(f"""
+        SELECT max({key}), count(*) FROM (
+            SELECT {key} FROM {table} WHERE {key} > :lo ORDER BY {key} LIMIT :limit
+        ) chunk
+    """)
+
+    with engine.connect() as conn:
+        if not conn.execute(text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": backfill.name}).scalar():
+            raise BackfillLocked(f"backfill {backfill.name} is already running")
+        try:
+            # 끝난 기록(또는 --restart)은 지우고 처음부터, 진행 중 기록이 있으면 그 key 다음부터
+            conn.execute(
+                text("DELETE FROM backfill_progress WHERE name = :name AND (finished_at IS NOT NULL OR :restart)"),
+                {"name": backfill.name, "restart": restart},
+            )
+            # key 는 문자열 id — 모든 값이 '' 보다 크다
+            lo = _progress(conn, backfill.name) or ""
+            total = conn.execute(text(f"SELECT count(*) FROM {table} WHERE {key} > :lo"), {"lo": lo}).scalar()
+            conn.commit()
+            if lo:
+                print(f"[backfill] {backfill.name}: resuming after {key}={lo}")
+
+            scanned = changed = 0
+            started = time.perf_counter()
+            while True:
+                with conn.begin():
+                    hi, count = conn.execute(next_chunk, {"lo": lo, "limit": batch_size}).one()
+                    if hi is None:
+                        _save_progress(conn, backfill.name, lo, 0, finished=True)
+                        break
+                    rows = conn.execute(text(backfill.sql), {"lo": lo, "hi": hi}).rowcount
+                    _save_progress(conn, backfill.name, hi, rows, finished=False)
+                lo = hi
+                scanned += count
+                changed += rows
+                elapsed = time.perf_counter() - started
+                percent = min(scanned * 100 / total, 100) if total else 100
+                print(
+                    f"[backfill] {backfill.name}: {scanned:,}/{total:,} ({percent:.0f}%) "
+                    f"changed {changed:,}, {scanned / elapsed if elapsed else 0:,.0f} rows/s"
+                )
+                if pause:
+                    time.sleep(pause)
+            print(f"[backfill] {backfill.name}: done, changed {changed:,} rows ({time.perf_counter() - started:.1f}s)")
+            return changed
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(hashtext(:name))"), {"name": backfill.name})
+            conn.commit()
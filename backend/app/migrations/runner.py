@@ -0,0 +1,86 @@
+"""
+버전 기반 마이그레이션 러너
+
+schema_version 테이블에 적용한 버전을 기록하고, 아직 적용하지 않은 마이그레이션만 순서대로 실행한다.
+워커(uvicorn)가 뜨기 전에 한 번 실행한다: python -m app.migrations upgrade (또는 python app/init_db.py).
+
+- 여러 프로세스가 동시에 실행해도 pg_advisory_lock 으로 한 번에 하나만 진행한다.
+- 마이그레이션마다 한 트랜잭션: 적용 + schema_version 기록을 함께 커밋한다.
+  실패하면 롤백 후 예외를 올리고 멈춘다 (이후 버전은 실행하지 않는다).
+"""
+import time
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.migrations.versions import MIGRATIONS, Migration
+
+# pg_advisory_lock 키 (임의의 고정 정수)
+LOCK_KEY = 72_0418_0001
+
+
+def ensure_version_table(conn: Connection) -> None:
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name VARCHAR NOT NULL,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """))
+
+
+def applied_versions(conn: Connection) -> set:
+    if conn.execute(text("SELECT to_regclass('public.schema_version')")).scalar() is None:
+        return set()
+    return {version for (version,) in conn.execute(text("SELECT version FROM schema_version"))}
+
+
+def pending_migrations(conn: Connection) -> List[Migration]:
+    applied = applied_versions(conn)
+    return [m for m in MIGRATIONS if m.version not in applied]
+
+
+def upgrade(engine: Engine = None) -> int:
+    """미적용 마이그레이션을 모두 실행하고 적용한 개수를 돌려준다."""
+    if engine is None:
+        from app.database import engine
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": LOCK_KEY})
+        conn.commit()
+        try:
+            ensure_version_table(conn)
+            conn.commit()
+            # 락을 기다리는 동안 다른 프로세스가 적용했을 수 있으므로 락을 잡은 뒤에 다시 읽는다
+            pending = pending_migrations(conn)
+            conn.commit()
+            for migration in pending:
+                started = time.perf_counter()
+                try:
+                    with conn.begin():
+                        migration.apply(conn)
+                        conn.execute(
+                            text("INSERT INTO schema_version (version, name) VALUES (:version, :name)"),
+                            {"version": migration.version, "name": migration.name},
+                        )
+                except Exception as e:
+                    print(f"[migrate] {migration.version:03d} {migration.name} failed: {e}")
+                    raise
+                elapsed = (time.perf_counter() - started) * 1000
+                print(f"[migrate] {migration.version:03d} {migration.name} ({elapsed:.0f} ms)")
+            if not pending:
+                print("[migrate] schema is up to date")
+            return len(pending)
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": LOCK_KEY})
+            conn.commit()
+
+
+def status(engine: Engine = None) -> List[Migration]:
+    """미적용 마이그레이션 목록"""
+    if engine is None:
+        from app.database import engine
+
+    with engine.connect() as conn:
+        return pending_migrations(conn)
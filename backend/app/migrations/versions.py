@@ -0,0 +1,570 @@
+"""
+스키마 마이그레이션 목록
+
+예전에 app/main.py 와 init_db.py 가 import 시점마다 실행하던 ensure_* / migrate_* 함수를
+순서 그대로 옮겼다. 각 함수는 러너가 연 연결(conn) 한 트랜잭션 안에서 실행되고,
+성공하면 schema_version 행과 함께 커밋된다 — 실패하면 기록되지 않고 다음 실행에서 다시 시도한다.
+
+기존 DB 에서도 처음 한 번은 모두 실행되므로, 옛 함수들의 "이미 있으면 건너뜀" 검사는 남겨 두었다.
+
+새 마이그레이션은 MIGRATIONS 끝에 다음 번호로 추가한다 (이미 배포된 번호/내용은 바꾸지 않는다).
+새 모델 테이블은 create_tables(conn, Model) 로 만든다.
+"""
+from copy import deepcopy
+from typing import Callable, List, NamedTuple
+
+from sqlalchemy import func, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+def table_exists(conn: Connection, table: str) -> bool:
+    return conn.execute(text("SELECT to_regclass(:name)"), {"name": f"public.{table}"}).scalar() is not None
+
+
+def column_exists(conn: Connection, table: str, column: str) -> bool:
+    return conn.execute(text("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = :table AND column_name = :column
+    """), {"table": table, "column": column}).fetchone() is not None
+
+
+def create_tables(conn: Connection, *models) -> None:
+    """모델 테이블(인덱스 포함)을 없으면 생성"""
+    for model in models:
+        model.__table__.create(conn, checkfirst=True)
+
+
+# --- 001 ~ 002: 기본 스키마 -------------------------------------------------
+
+def create_base_schema(conn: Connection) -> None:
+    """모델 전체 테이블 생성 (신규 환경). tasks.display_id 기본값이 참조하는 시퀀스를 먼저 만든다."""
+    import app.models  # noqa: F401 — 모든 모델을 Base.metadata 에 등록
+    from app.database import Base
+
+    conn.execute(text("CREATE SEQUENCE IF NOT EXISTS tasks_display_id_seq"))
+    Base.metadata.create_all(bind=conn)
+
+
+def add_init_db_columns(conn: Connection) -> None:
+    """init_db.py 의 run_migrations — tasks/projects/chat_rooms 초기 컬럼."""
+    if table_exists(conn, "tasks"):
+        conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS display_order INTEGER DEFAULT 0 NOT NULL"))
+        conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS sprint_id VARCHAR"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_sprint_id ON tasks(sprint_id)"))
+        conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS parent_task_id VARCHAR"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_parent_task_id ON tasks(parent_task_id)"))
+        conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS site_tags VARCHAR[] DEFAULT '{}' NOT NULL"))
+    if table_exists(conn, "projects"):
+        conn.execute(text("ALTER TABLE projects ADD COLUMN IF NOT EXISTS workspace_id VARCHAR"))
+        conn.execute(text("ALTER TABLE projects ADD COLUMN IF NOT EXISTS creator_id VARCHAR"))
+    if table_exists(conn, "chat_rooms"):
+        conn.execute(text("ALTER TABLE chat_rooms ADD COLUMN IF NOT EXISTS workspace_id VARCHAR"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_chat_rooms_workspace_id ON chat_rooms(workspace_id)"))
+
+
+# --- 003 ~: app/main.py 의 ensure_* (실행 순서 유지) --------------------------
+
+def add_comments_image_urls(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE comments ADD COLUMN IF NOT EXISTS image_urls VARCHAR[] DEFAULT '{}' NOT NULL"))
+
+
+def add_tasks_site_tags(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS site_tags VARCHAR[] DEFAULT '{}' NOT NULL"))
+
+
+def add_notification_cascades(conn: Connection) -> None:
+    """notifications 테이블 FK에 ON DELETE CASCADE 적용."""
+    fk_targets = [
+        ("notifications_user_id_fkey", "user_id", "users", "id"),
+        ("notifications_project_id_fkey", "project_id", "projects", "id"),
+        ("notifications_task_id_fkey", "task_id", "tasks", "id"),
+        ("notifications_comment_id_fkey", "comment_id", "comments", "id"),
+    ]
+    for constraint_name, col, ref_table, ref_col in fk_targets:
+        row = conn.execute(text("""
+            SELECT rc.delete_rule
+            FROM information_schema.referential_constraints rc
+            JOIN information_schema.key_column_usage kcu
+              ON kcu.constraint_name = rc.constraint_name
+            WHERE kcu.table_name = 'notifications'
+              AND kcu.column_name = :col
+        """), {"col": col}).fetchone()
+        if row and row[0] == "CASCADE":
+            continue
+        conn.execute(text(f"ALTER TABLE notifications DROP CONSTRAINT IF EXISTS {constraint_name}"))
+        conn.execute(text(
+            f"ALTER TABLE notifications ADD CONSTRAINT {constraint_name} "
+            f"FOREIGN KEY ({col}) REFERENCES {ref_table}({ref_col}) ON DELETE CASCADE"
+        ))
+
+
+def create_checklist_tables(conn: Connection) -> None:
+    if not table_exists(conn, "checklists"):
+        conn.execute(text("""
+            CREATE TABLE checklists (
+                id VARCHAR PRIMARY KEY,
+                task_id VARCHAR NOT NULL,
+                title VARCHAR NOT NULL DEFAULT 'Checklist',
+                created_by VARCHAR NOT NULL,
+                created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+        """))
+        conn.execute(text("CREATE INDEX ix_checklists_task_id ON checklists(task_id)"))
+        conn.execute(text("CREATE INDEX ix_checklists_id ON checklists(id)"))
+    if not table_exists(conn, "checklist_items"):
+        conn.execute(text("""
+            CREATE TABLE checklist_items (
+                id VARCHAR PRIMARY KEY,
+                checklist_id VARCHAR NOT NULL,
+                task_id VARCHAR NOT NULL,
+                content VARCHAR NOT NULL,
+                is_checked BOOLEAN NOT NULL DEFAULT FALSE,
+                assignee_id VARCHAR,
+                due_date TIMESTAMPTZ,
+                display_order INTEGER NOT NULL DEFAULT 0,
+                created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+        """))
+        conn.execute(text("CREATE INDEX ix_checklist_items_checklist_id ON checklist_items(checklist_id)"))
+        conn.execute(text("CREATE INDEX ix_checklist_items_id ON checklist_items(id)"))
+
+
+def create_project_github_table(conn: Connection) -> None:
+    if table_exists(conn, "project_github"):
+        return
+    conn.execute(text("""
+        CREATE TABLE project_github (
+            id VARCHAR PRIMARY KEY,
+            project_id VARCHAR NOT NULL UNIQUE,
+            repo_owner VARCHAR NOT NULL,
+            repo_name VARCHAR NOT NULL,
+            access_token VARCHAR,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """))
+    conn.execute(text("CREATE INDEX ix_project_github_project_id ON project_github(project_id)"))
+    conn.execute(text("CREATE INDEX ix_project_github_id ON project_github(id)"))
+
+
+def create_user_github_tokens_table(conn: Connection) -> None:
+    if table_exists(conn, "user_github_tokens"):
+        return
+    conn.execute(text("""
+        CREATE TABLE user_github_tokens (
+            id VARCHAR PRIMARY KEY,
+            user_id VARCHAR NOT NULL UNIQUE,
+            access_token VARCHAR NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """))
+    conn.execute(text("CREATE INDEX ix_user_github_tokens_user_id ON user_github_tokens(user_id)"))
+    conn.execute(text("CREATE INDEX ix_user_github_tokens_id ON user_github_tokens(id)"))
+
+
+def create_user_mattermost_settings_table(conn: Connection) -> None:
+    if not table_exists(conn, "user_mattermost_settings"):
+        conn.execute(text("""
+            CREATE TABLE user_mattermost_settings (
+                id VARCHAR PRIMARY KEY,
+                user_id VARCHAR NOT NULL UNIQUE,
+                mattermost_username VARCHAR,
+                webhook_url VARCHAR,
+                is_enabled BOOLEAN NOT NULL DEFAULT TRUE,
+                created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+        """))
+        conn.execute(text("CREATE INDEX ix_user_mattermost_settings_user_id ON user_mattermost_settings(user_id)"))
+        return
+    # mattermost_username 컬럼 추가 (신규 DM 방식), webhook_url NOT NULL 완화
+    conn.execute(text("ALTER TABLE user_mattermost_settings ADD COLUMN IF NOT EXISTS mattermost_username VARCHAR"))
+    conn.execute(text("ALTER TABLE user_mattermost_settings ALTER COLUMN webhook_url DROP NOT NULL"))
+
+
+def create_project_patches_table(conn: Connection) -> None:
+    if table_exists(conn, "project_patches"):
+        return
+    conn.execute(text("""
+        CREATE TABLE project_patches (
+            id VARCHAR PRIMARY KEY,
+            project_id VARCHAR NOT NULL,
+            site VARCHAR NOT NULL,
+            patch_date DATE NOT NULL,
+            version VARCHAR NOT NULL DEFAULT '',
+            content TEXT NOT NULL DEFAULT '',
+            created_by VARCHAR,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """))
+    conn.execute(text("CREATE INDEX ix_project_patches_project_id ON project_patches(project_id)"))
+    conn.execute(text("CREATE INDEX ix_project_patches_site ON project_patches(site)"))
+    conn.execute(text("CREATE INDEX ix_project_patches_patch_date ON project_patches(patch_date)"))
+    conn.execute(text("CREATE INDEX ix_project_patches_id ON project_patches(id)"))
+
+
+def create_project_sites_table(conn: Connection) -> None:
+    if table_exists(conn, "project_sites"):
+        return
+    conn.execute(text("""
+        CREATE TABLE project_sites (
+            id VARCHAR PRIMARY KEY,
+            project_id VARCHAR NOT NULL,
+            name VARCHAR NOT NULL,
+            created_by VARCHAR,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """))
+    conn.execute(text("CREATE INDEX ix_project_sites_project_id ON project_sites(project_id)"))
+    conn.execute(text("CREATE INDEX ix_project_sites_name ON project_sites(name)"))
+    conn.execute(text("CREATE INDEX ix_project_sites_id ON project_sites(id)"))
+
+
+def add_projects_is_global(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE projects ADD COLUMN IF NOT EXISTS is_global BOOLEAN NOT NULL DEFAULT FALSE"))
+
+
+def add_patch_checklist_columns(conn: Connection) -> None:
+    conn.execute(text("""
+        ALTER TABLE project_patches
+            ADD COLUMN IF NOT EXISTS steps JSONB DEFAULT '[]'::jsonb NOT NULL,
+            ADD COLUMN IF NOT EXISTS test_items JSONB DEFAULT '[]'::jsonb NOT NULL,
+            ADD COLUMN IF NOT EXISTS status VARCHAR DEFAULT 'pending' NOT NULL,
+            ADD COLUMN IF NOT EXISTS notes TEXT DEFAULT '' NOT NULL,
+            ADD COLUMN IF NOT EXISTS note_image_urls VARCHAR[] DEFAULT '{}' NOT NULL
+    """))
+
+
+def add_tasks_display_id(conn: Connection) -> None:
+    """tasks.display_id — 자동 증가 정수 (SERIAL 과 같은 구성)."""
+    if not column_exists(conn, "tasks", "display_id"):
+        conn.execute(text("ALTER TABLE tasks ADD COLUMN display_id SERIAL"))
+        return
+    # create_all 로 만든 DB: 컬럼은 있지만 시퀀스가 컬럼에 묶여 있지 않을 수 있다
+    conn.execute(text("CREATE SEQUENCE IF NOT EXISTS tasks_display_id_seq"))
+    conn.execute(text("ALTER TABLE tasks ALTER COLUMN display_id SET DEFAULT nextval('tasks_display_id_seq')"))
+    conn.execute(text("ALTER SEQUENCE tasks_display_id_seq OWNED BY tasks.display_id"))
+
+
+def add_patch_git_tag_and_assignee(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE project_patches ADD COLUMN IF NOT EXISTS git_tag VARCHAR"))
+    conn.execute(text("ALTER TABLE project_patches ADD COLUMN IF NOT EXISTS assignee VARCHAR"))
+
+
+def backfill_patch_assignees(conn: Connection) -> None:
+    """기존 패치 담당자 일괄 설정: 연합뉴스→안성구, 나머지→정보영 (assignee 가 비어 있는 행만)."""
+    conn.execute(text("""
+        UPDATE project_patches
+        SET assignee = CASE WHEN site = '연합뉴스' THEN '안성구' ELSE '정보영' END
+        WHERE assignee IS NULL
+    """))
+
+
+def add_comments_file_urls(conn: Connection) -> None:
+    conn.execute(text("ALTER TABLE comments ADD COLUMN IF NOT EXISTS file_urls VARCHAR[] DEFAULT '{}' NOT NULL"))
+
+
+def add_user_columns(conn: Connection) -> None:
+    """users.favorite_project_ids, users.last_yesterday_review_at (어제 미완료 작업 리뷰를 마지막으로 본 시각)."""
+    conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS favorite_project_ids VARCHAR[] DEFAULT '{}' NOT NULL"))
+    conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS last_yesterday_review_at TIMESTAMPTZ NULL"))
+
+
+def add_projects_is_archived(conn: Connection) -> None:
+    """종료된 프로젝트 보관 플래그 — 데이터는 보존하고 UI 노출만 차단."""
+    conn.execute(text("ALTER TABLE projects ADD COLUMN IF NOT EXISTS is_archived BOOLEAN NOT NULL DEFAULT FALSE"))
+
+
+def add_site_details_name_unique(conn: Connection) -> None:
+    """같은 이름의 SiteDetail 중복 INSERT 방지 (라우터는 IntegrityError 시 기존 행에 project_id 를 추가)."""
+    conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ux_site_details_name ON site_details(name)"))
+
+
+def add_notification_type_values(conn: Connection) -> None:
+    """notificationtype enum 값 추가. SQLAlchemy 는 enum NAME(대문자)을 저장한다."""
+    for value in ("TASK_CREATED", "TASK_DOCUMENT_ADDED", "TASK_CHECKLIST_ADDED", "TASK_CHECKLIST_ITEM_ADDED"):
+        conn.execute(text(f"ALTER TYPE notificationtype ADD VALUE IF NOT EXISTS '{value}'"))
+
+
+def migrate_site_details_project_ids(conn: Connection) -> None:
+    """site_details.project_id (단일) → project_ids (JSON 배열)."""
+    conn.execute(text("ALTER TABLE site_details ADD COLUMN IF NOT EXISTS project_ids JSON DEFAULT '[]'::json"))
+    if column_exists(conn, "site_details", "project_id"):
+        conn.execute(text("""
+            UPDATE site_details
+            SET project_ids = json_build_array(project_id)
+            WHERE project_id IS NOT NULL
+              AND (project_ids IS NULL OR project_ids::text = '[]')
+        """))
+
+
+def migrate_project_sites_to_site_details(conn: Connection) -> None:
+    """project_sites 의 기존 사이트를 site_details 로 복사 (이미 있는 id 는 건너뜀)."""
+    if not table_exists(conn, "project_sites"):
+        return
+    legacy_column = ", project_id" if column_exists(conn, "site_details", "project_id") else ""
+    legacy_value = ", ps.project_id" if legacy_column else ""
+    conn.execute(text(f"""
+        INSERT INTO site_details
+            (id, project_ids, name, description, servers, databases, services, created_at, updated_at{legacy_column})
+        SELECT ps.id, json_build_array(ps.project_id), ps.name, '', '[]'::json, '[]'::json, '[]'::json,
+               now(), now(){legacy_value}
+        FROM project_sites ps
+        WHERE NOT EXISTS (SELECT 1 FROM site_details sd WHERE sd.id = ps.id)
+        ON CONFLICT DO NOTHING
+    """))
+
+
+def create_api_tokens_table(conn: Connection) -> None:
+    if table_exists(conn, "api_tokens"):
+        return
+    conn.execute(text("""
+        CREATE TABLE api_tokens (
+            id VARCHAR PRIMARY KEY,
+            user_id VARCHAR NOT NULL,
+            name VARCHAR NOT NULL,
+            token_hash VARCHAR NOT NULL UNIQUE,
+            token_prefix VARCHAR NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """))
+    conn.execute(text("CREATE INDEX ix_api_tokens_user_id ON api_tokens(user_id)"))
+    conn.execute(text("CREATE INDEX ix_api_tokens_token_hash ON api_tokens(token_hash)"))
+
+
+def create_ai_summary_cache_table(conn: Connection) -> None:
+    if table_exists(conn, "ai_summary_cache"):
+        return
+    conn.execute(text("""
+        CREATE TABLE ai_summary_cache (
+            id VARCHAR PRIMARY KEY,
+            user_id VARCHAR NOT NULL,
+            workspace_id VARCHAR,
+            summary_scope VARCHAR NOT NULL DEFAULT 'all',
+            summary_date DATE NOT NULL,
+            summary_text TEXT NOT NULL,
+            generated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """))
+    conn.execute(text("CREATE INDEX ix_ai_summary_cache_user_id ON ai_summary_cache(user_id)"))
+    conn.execute(text("CREATE INDEX ix_ai_summary_cache_summary_date ON ai_summary_cache(summary_date)"))
+
+
+def add_tasks_observer_and_source_columns(conn: Connection) -> None:
+    """tasks.observer_ids, 회의록 소스 링크(source_meeting_minutes_id / source_line_id) + 인덱스."""
+    conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS observer_ids VARCHAR[] DEFAULT '{}' NOT NULL"))
+    conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS source_meeting_minutes_id VARCHAR"))
+    conn.execute(text("ALTER TABLE tasks ADD COLUMN IF NOT EXISTS source_line_id VARCHAR"))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_source_meeting_minutes_id ON tasks(source_meeting_minutes_id)"
+    ))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_source_line_id ON tasks(source_line_id)"))
+
+
+def seed_mbc_site_details(conn: Connection) -> None:
+    """이름이 MBC인 site_details 의 servers/databases/services 중 비어 있는 항목만 기본 인프라로 채운다."""
+    from app.mbc_site_default_data import MBC_DATABASES, MBC_SERVERS, mbc_services_list
+    from app.models.site_detail import SiteDetail
+
+    db = Session(bind=conn)
+    sites = db.query(SiteDetail).filter(func.lower(SiteDetail.name) == "mbc").all()
+    for site in sites:
+        if not site.servers:
+            site.servers = deepcopy(MBC_SERVERS)
+        if not site.databases:
+            site.databases = deepcopy(MBC_DATABASES)
+        if not site.services:
+            site.services = mbc_services_list()
+    db.flush()
+    db.close()
+
+
+def add_workspace_owner_as_observer(conn: Connection) -> None:
+    """기존 모든 작업에 워크스페이스 오너를 참조자(observer)로 추가 — UPDATE 한 번.
+
+    러너 도입 전 DB 는 첫 upgrade 때 모든 마이그레이션을 다시 거치므로, 예전 기동 시 백필처럼
+    이미 적용된 DB(오너가 참조자인 작업이 있음)는 건너뛴다. updated_at / change_log 는 남기지 않는다.
+    """
+    from app.migrations.backfill import WORKSPACE_OWNER_OBSERVERS_APPLIED_SQL, WORKSPACE_OWNER_OBSERVERS_SQL
+
+    if conn.execute(text(WORKSPACE_OWNER_OBSERVERS_APPLIED_SQL)).scalar():
+        print("[migrate] workspace owner already in observers; skip")
+        return
+    # 러너 도입 전 DB 에는 change_log 트리거가 이미 있다 — 이 트랜잭션 동안만 끈다
+    trigger = conn.execute(text(
+        "SELECT 1 FROM pg_trigger WHERE tgname = 'trg_tasks_change_log' AND tgrelid = 'tasks'::regclass"
+    )).scalar()
+    if trigger:
+        conn.execute(text("ALTER TABLE tasks DISABLE TRIGGER trg_tasks_change_log"))
+    updated = conn.execute(text(WORKSPACE_OWNER_OBSERVERS_SQL)).rowcount
+    if trigger:
+        conn.execute(text("ALTER TABLE tasks ENABLE TRIGGER trg_tasks_change_log"))
+    if updated:
+        print(f"[migrate] added workspace owner as observer to {updated} tasks")
+
+
+def create_meeting_minutes_table(conn: Connection) -> None:
+    if table_exists(conn, "meeting_minutes"):
+        return
+    conn.execute(text("""
+        CREATE TABLE meeting_minutes (
+            id VARCHAR PRIMARY KEY,
+            workspace_id VARCHAR NOT NULL,
+            title VARCHAR NOT NULL,
+            content TEXT NOT NULL DEFAULT '',
+            category VARCHAR DEFAULT '',
+            meeting_date DATE NOT NULL,
+            creator_id VARCHAR NOT NULL,
+            attendee_ids VARCHAR[] DEFAULT '{}' NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """))
+    conn.execute(text("CREATE INDEX ix_meeting_minutes_workspace_id ON meeting_minutes(workspace_id)"))
+    conn.execute(text("CREATE INDEX ix_meeting_minutes_creator_id ON meeting_minutes(creator_id)"))
+
+
+def create_search_vectors(conn: Connection) -> None:
+    """검색용 n-gram 함수와 tasks/comments/meeting_minutes/chat_messages.search_vector 컬럼."""
+    from app.utils.search_index import ensure_search_index
+
+    added = ensure_search_index(conn)
+    if added:
+        print(f"[migrate] added search_vector columns: {', '.join(added)}")
+
+
+def create_pagination_indexes(conn: Connection) -> None:
+    """커서 페이지네이션 정렬 키와 같은 순서의 복합 인덱스."""
+    conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_notifications_user_created_id
+        ON notifications (user_id, created_at DESC, id DESC)
+    """))
+    conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_tasks_project_order_created_id
+        ON tasks (project_id, display_order, created_at DESC, id)
+    """))
+    conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_meeting_minutes_workspace_date_id
+        ON meeting_minutes (workspace_id, meeting_date DESC, created_at DESC, id DESC)
+    """))
+
+
+def create_project_members_gin_index(conn: Connection) -> None:
+    """projects.team_member_ids GIN 인덱스 (접근 가능 프로젝트 조회용 @> 조건)."""
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_projects_team_member_ids ON projects USING gin (team_member_ids)"))
+
+
+def move_task_history_to_events(conn: Connection) -> None:
+    """tasks 의 JSON 이력 컬럼을 task_events 로 옮긴다. 옛 컬럼은 남겨 두되 새 INSERT 가 실패하지 않게 기본값만 준다."""
+    from app.utils.task_history import backfill_task_events, has_legacy_history_columns
+
+    if not has_legacy_history_columns(conn):
+        return
+    for column in ("status_history", "priority_history", "assignment_history"):
+        conn.execute(text(f"ALTER TABLE tasks ALTER COLUMN {column} SET DEFAULT '[]'::json"))
+    if not conn.execute(text("SELECT EXISTS (SELECT 1 FROM task_events)")).scalar():
+        print(f"[migrate] backfilled task_events: {backfill_task_events(conn)} rows")
+
+
+def backfill_task_activity_rollup(conn: Connection) -> None:
+    """task_activity_daily(활동 히트맵 롤업) 가 비어 있으면 기존 태스크/댓글로 채운다."""
+    from app.utils.activity import backfill_task_activity
+
+    if not conn.execute(text("SELECT EXISTS (SELECT 1 FROM task_activity_daily)")).scalar():
+        print(f"[migrate] backfilled task_activity_daily: {backfill_task_activity(conn)} rows")
+
+
+def create_backfill_progress_table(conn: Connection) -> None:
+    """청크 백필(app.migrations.backfill) 진행 기록."""
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS backfill_progress (
+            name VARCHAR PRIMARY KEY,
+            last_key VARCHAR,
+            rows_done BIGINT NOT NULL DEFAULT 0,
+            finished_at TIMESTAMPTZ,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """))
+
+
+def create_change_log_triggers(conn: Connection) -> None:
+    """델타 동기화용 change_log 트리거 (tasks/comments/checklists/sprints)."""
+    from app.utils.change_log import ensure_change_log_triggers
+
+    ensure_change_log_triggers(conn)
+
+
+def create_commit_graph_tables(conn: Connection) -> None:
+    """GitHub 커밋 그래프 캐시 (github_commits, github_branch_heads)."""
+    from app.models.github import GitHubBranchHead, GitHubCommit
+
+    create_tables(conn, GitHubCommit, GitHubBranchHead)
+
+
+def create_github_webhook_events_table(conn: Connection) -> None:
+    from app.models.github import GitHubWebhookEvent
+
+    create_tables(conn, GitHubWebhookEvent)
+
+
+def rebuild_search_vectors_with_term_limit(conn: Connection) -> None:
+    """search_vector 를 컬럼별 용어 수 상한이 있는 식으로 다시 만들고 긴 본문용 부분 인덱스 추가."""
+    from app.utils.search_index import rebuild_search_vectors
+
+    rebuilt = rebuild_search_vectors(conn)
+    print(f"[migrate] rebuilt search_vector columns: {', '.join(rebuilt)}")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "create_base_schema", create_base_schema),
+    Migration(2, "add_init_db_columns", add_init_db_columns),
+    Migration(3, "add_comments_image_urls", add_comments_image_urls),
+    Migration(4, "add_tasks_site_tags", add_tasks_site_tags),
+    Migration(5, "add_notification_cascades", add_notification_cascades),
+    Migration(6, "create_checklist_tables", create_checklist_tables),
+    Migration(7, "create_project_github_table", create_project_github_table),
+    Migration(8, "create_user_github_tokens_table", create_user_github_tokens_table),
+    Migration(9, "create_user_mattermost_settings_table", create_user_mattermost_settings_table),
+    Migration(10, "create_project_patches_table", create_project_patches_table),
+    Migration(11, "create_project_sites_table", create_project_sites_table),
+    Migration(12, "add_projects_is_global", add_projects_is_global),
+    Migration(13, "add_patch_checklist_columns", add_patch_checklist_columns),
+    Migration(14, "add_tasks_display_id", add_tasks_display_id),
+    Migration(15, "add_patch_git_tag_and_assignee", add_patch_git_tag_and_assignee),
+    Migration(16, "backfill_patch_assignees", backfill_patch_assignees),
+    Migration(17, "add_comments_file_urls", add_comments_file_urls),
+    Migration(18, "add_user_columns", add_user_columns),
+    Migration(19, "add_projects_is_archived", add_projects_is_archived),
+    Migration(20, "add_site_details_name_unique", add_site_details_name_unique),
+    Migration(21, "add_notification_type_values", add_notification_type_values),
+    Migration(22, "migrate_site_details_project_ids", migrate_site_details_project_ids),
+    Migration(23, "migrate_project_sites_to_site_details", migrate_project_sites_to_site_details),
+    Migration(24, "create_api_tokens_table", create_api_tokens_table),
+    Migration(25, "create_ai_summary_cache_table", create_ai_summary_cache_table),
+    Migration(26, "add_tasks_observer_and_source_columns", add_tasks_observer_and_source_columns),
+    Migration(27, "seed_mbc_site_details", seed_mbc_site_details),
+    Migration(28, "add_workspace_owner_as_observer", add_workspace_owner_as_observer),
+    Migration(29, "create_meeting_minutes_table", create_meeting_minutes_table),
+    Migration(30, "create_search_vectors", create_search_vectors),
+    Migration(31, "create_pagination_indexes", create_pagination_indexes),
+    Migration(32, "create_project_members_gin_index", create_project_members_gin_index),
+    Migration(33, "move_task_history_to_events", move_task_history_to_events),
+    Migration(34, "backfill_task_activity_rollup", backfill_task_activity_rollup),
+    Migration(35, "create_change_log_triggers", create_change_log_triggers),
+    Migration(36, "create_backfill_progress_table", create_backfill_progress_table),
+    Migration(37, "create_commit_graph_tables", create_commit_graph_tables),
+    Migration(38, "create_github_webhook_events_table", create_github_webhook_events_table),
+    Migration(39, "rebuild_search_vectors_with_term_limit", rebuild_search_vectors_with_term_limit),
+]
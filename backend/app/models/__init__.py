@@ -2,30 +2,43 @@ from app.models.user import User
 from app.models.project import Project
 from app.models.task import Task, TaskStatus, TaskPriority
 from app.models.comment import Comment
+from app.models.checklist import Checklist, ChecklistItem
 from app.models.notification import Notification, NotificationType
 from app.models.chat import ChatRoom, ChatMessage, ChatRoomParticipant, ChatRoomType
 from app.models.message_reaction import MessageReaction
 from app.models.comment_reaction import CommentReaction
 from app.models.workspace import Workspace, WorkspaceMember
 from app.models.sprint import Sprint, SprintStatus
-from app.models.github import ProjectGitHub
+from app.models.github import GitHubBranchHead, GitHubCommit, GitHubWebhookEvent, ProjectGitHub
 from app.models.user_github_token import UserGitHubToken
+from app.models.user_mattermost_setting import UserMattermostSetting
 from app.models.patch import ProjectPatch
 from app.models.project_site import ProjectSite
+from app.models.site_detail import SiteDetail
+from app.models.api_token import ApiToken
 from app.models.ai_summary_cache import AiSummaryCache
 from app.models.meeting_minutes import MeetingMinutes
+from app.models.task_activity import TaskActivityDaily
+from app.models.task_event import TaskEvent
+from app.models.change_log import ChangeLog
 
 __all__ = [
     "User", "Project", "Task", "TaskStatus", "TaskPriority",
-    "Comment", "Notification", "NotificationType",
+    "Comment", "Checklist", "ChecklistItem", "Notification", "NotificationType",
     "ChatRoom", "ChatMessage", "ChatRoomParticipant", "ChatRoomType",
     "MessageReaction", "CommentReaction",
     "Workspace", "WorkspaceMember",
     "Sprint", "SprintStatus",
-    "ProjectGitHub",
+    "ProjectGitHub", "GitHubCommit", "GitHubBranchHead", "GitHubWebhookEvent",
     "UserGitHubToken",
+    "UserMattermostSetting",
     "ProjectPatch",
     "ProjectSite",
+    "SiteDetail",
+    "ApiToken",
     "AiSummaryCache",
     "MeetingMinutes",
+    "TaskActivityDaily",
+    "TaskEvent",
+    "ChangeLog",
 ]
@@ -0,0 +1,33 @@
+"""
+변경 로그 모델 (SQLAlchemy)
+"""
+from sqlalchemy import BigInteger, Column, DateTime, Index, Sequence, String
+from sqlalchemy.sql import func
+from app.database import Base
+
+CHANGE_LOG_SEQ = Sequence("change_log_seq")
+
+
+class ChangeLog(Base):
+    """델타 동기화(GET /api/sync)용 엔티티별 마지막 변경
+
+    tasks / comments / checklists / sprints 의 트리거(dora_record_change)가 채운다.
+    엔티티마다 한 행만 유지하고(삭제는 op='delete' 톰스톤), 변경될 때마다
+    xid(변경한 트랜잭션 id)와 seq 를 새로 받는다. 동기화 커서는 (xid, seq) 순서다.
+    """
+    __tablename__ = "change_log"
+
+    entity = Column(String, primary_key=True)  # "task" | "comment" | "checklist" | "sprint"
+    entity_id = Column(String, primary_key=True)
+    project_id = Column(String, nullable=True, index=True)  # 접근 권한 필터용
+    op = Column(String, nullable=False)  # "upsert" | "delete"
+    xid = Column(BigInteger, nullable=False)
+    seq = Column(BigInteger, CHANGE_LOG_SEQ, server_default=CHANGE_LOG_SEQ.next_value(), nullable=False)
+    changed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_change_log_xid_seq", "xid", "seq"),
+    )
+
+    def __repr__(self):
+        return f"<ChangeLog({self.entity}:{self.entity_id}, op={self.op}, xid={self.xid}, seq={self.seq})>"
@@ -1,5 +1,5 @@
 """GitHub 연동 모델 (SQLAlchemy)"""
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import ARRAY, JSON, Column, DateTime, Index, String, Text
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -18,3 +18,46 @@ class ProjectGitHub(Base):
 
     def __repr__(self):
         return f"<ProjectGitHub(project_id={self.project_id}, repo={self.repo_owner}/{self.repo_name})>"
+
+
+class GitHubCommit(Base):
+    """커밋 그래프 캐시 — 연동 레포의 커밋 (DAG 노드, parents 가 간선)"""
+    __tablename__ = "github_commits"
+
+    project_id = Column(String, primary_key=True)
+    sha = Column(String, primary_key=True)
+    message = Column(Text, nullable=False, default="")
+    author_name = Column(String, nullable=False, default="")
+    author_email = Column(String, nullable=True)
+    author_avatar_url = Column(String, nullable=True)
+    date = Column(String, nullable=False, default="")  # GitHub 응답의 author.date 원문
+    committed_at = Column(DateTime(timezone=True), nullable=True)  # 정렬용 (date 파싱)
+    url = Column(String, nullable=False, default="")
+    parents = Column(ARRAY(String), nullable=False, default=list)
+
+    __table_args__ = (
+        Index("ix_github_commits_project_date", "project_id", "committed_at", "sha"),
+    )
+
+
+class GitHubBranchHead(Base):
+    """커밋 그래프 캐시가 마지막으로 반영한 브랜치 head"""
+    __tablename__ = "github_branch_heads"
+
+    project_id = Column(String, primary_key=True)
+    name = Column(String, primary_key=True)
+    sha = Column(String, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class GitHubWebhookEvent(Base):
+    """수신한 GitHub 웹훅 (delivery id 로 중복 수신 방지)"""
+    __tablename__ = "github_webhook_events"
+
+    delivery_id = Column(String, primary_key=True)
+    event = Column(String, nullable=False)
+    action = Column(String, nullable=True)
+    repo_full_name = Column(String, nullable=False, index=True)
+    project_ids = Column(ARRAY(String), nullable=False, default=list)
+    summary = Column(JSON, nullable=False, default=dict)  # 이벤트 요약 (WebSocket 으로 보낸 data 와 같음)
+    received_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
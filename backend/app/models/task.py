@@ -57,10 +57,7 @@ class Task(Base):
     # 사이트 태그 (문자열 배열)
     site_tags = Column(ARRAY(String), default=[], nullable=False)
 
-    # 히스토리 데이터는 JSON으로 저장
-    status_history = Column(JSON, default=[], nullable=False)
-    assignment_history = Column(JSON, default=[], nullable=False)
-    priority_history = Column(JSON, default=[], nullable=False)
+    # 상태/담당자/중요도 변경 이력은 task_events 테이블 (app/utils/task_history.py)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
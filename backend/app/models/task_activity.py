@@ -0,0 +1,25 @@
+"""
+작업 활동 일별 롤업 모델 (SQLAlchemy)
+"""
+from sqlalchemy import Column, Date, ForeignKey, String
+from app.database import Base
+
+
+class TaskActivityDaily(Base):
+    """(워크스페이스, 일자, 멤버) 별로 그 날 건드린 작업 카드 — 활동 히트맵용 롤업
+
+    한 카드에 같은 날 여러 행동(생성/완료/댓글)이 있어도 한 행만 남으므로
+    count(*) 가 곧 distinct 카드 수다. 기본 키 순서가 (workspace_id, activity_date) 범위 조회에 맞춰져 있다.
+    """
+    __tablename__ = "task_activity_daily"
+
+    workspace_id = Column(String, primary_key=True)
+    activity_date = Column(Date, primary_key=True)  # UTC 기준 날짜
+    user_id = Column(String, primary_key=True)
+    task_id = Column(String, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+    def __repr__(self):
+        return (
+            f"<TaskActivityDaily(workspace={self.workspace_id}, date={self.activity_date}, "
+            f"user={self.user_id}, task={self.task_id})>"
+        )
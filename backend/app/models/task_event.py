@@ -0,0 +1,30 @@
+"""
+태스크 이력 이벤트 모델 (SQLAlchemy)
+"""
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, JSON, String
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class TaskEvent(Base):
+    """태스크 상태/중요도/담당자 변경 이력 (append-only)
+
+    예전에는 tasks.status_history 등 JSON 배열을 통째로 다시 써서 기록했다.
+    data 에는 그 배열의 항목과 같은 모양의 dict 를 그대로 담아 응답 호환을 유지한다.
+    """
+    __tablename__ = "task_events"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    task_id = Column(String, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String, nullable=False)  # "status" | "priority" | "assignment"
+    user_id = Column(String, nullable=True)  # 변경한 사용자
+    at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    data = Column(JSON, nullable=False)
+
+    __table_args__ = (
+        Index("ix_task_events_task_id_at", "task_id", "at"),
+        Index("ix_task_events_user_id_at", "user_id", "at"),
+    )
+
+    def __repr__(self):
+        return f"<TaskEvent(task_id={self.task_id}, kind={self.kind}, at={self.at})>"
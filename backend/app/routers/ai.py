@@ -1,6 +1,5 @@
 """AI manager summary router."""
 
-import asyncio
 import uuid
 from datetime import datetime, timezone, timedelta
 
@@ -11,7 +10,6 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.config import settings
 from app.database import get_db
 from app.models.ai_summary_cache import AiSummaryCache
 from app.models.notification import Notification, NotificationType
@@ -19,18 +17,11 @@ from app.models.project import Project
 from app.models.task import Task, TaskPriority, TaskStatus
 from app.models.user import User
 from app.schemas.ai import AISummaryResponse, AIExportRequest, AIExportResponse
+from app.utils.ai_client import AILibraryError, export_report_cache, get_ai_client
 from app.utils.dependencies import get_current_user
 
 router = APIRouter()
 
-# 2.5가 부하로 503을 자주 내면 순차 시도
-_GEMINI_MODEL_CHAIN: tuple[str, ...] = (
-    "gemini-2.5-flash",
-    "gemini-2.0-flash",
-    "gemini-1.5-flash",
-)
-
-
 def _friendly_gemini_http_detail(exc: BaseException, prefix: str) -> str:
     """클라이언트에 노출할 사용자 친화적 메시지 (내부 스택/원문 최소화).
 
@@ -120,32 +111,6 @@ def _friendly_gemini_http_detail(exc: BaseException, prefix: str) -> str:
     return f"{prefix}: {raw}"
 
 
-async def _generate_with_gemini_model_fallback(
-    client: Any,
-    contents: str,
-) -> str:
-    """여러 Flash 모델을 순서대로 시도 (한 모델이 503이어도 다른 모델이 될 수 있음)."""
-    last_err: Optional[BaseException] = None
-    for i, model in enumerate(_GEMINI_MODEL_CHAIN):
-        try:
-            response = await asyncio.to_thread(
-                client.models.generate_content,
-                model=model,
-                contents=contents,
-            )
-            text = (response.text or "").strip()
-            if text:
-                return text
-            last_err = RuntimeError("빈 응답")
-        except Exception as e:
-            last_err = e
-        if i < len(_GEMINI_MODEL_CHAIN) - 1:
-            await asyncio.sleep(1.0)
-    if last_err is not None:
-        raise last_err
-    raise RuntimeError("AI 응답 없음")
-
-
 def _status_label(status_value: str) -> str:
     mapping = {
         TaskStatus.BACKLOG.value: "백로그",
@@ -296,52 +261,37 @@ def _build_prompt(
     return prompt
 
 
-@router.get("/summary", response_model=AISummaryResponse)
-async def get_ai_summary(
-    workspace_id: Optional[str] = Query(None),
-    summary_scope: str = Query(
-        "all",
-        description="요약 범위: mine(내 할당), others(다른 팀원 할당), all(전체)",
-    ),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    if not settings.GEMINI_API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="GEMINI_API_KEY가 설정되지 않았습니다.",
-        )
+SUMMARY_SCOPES = ("mine", "others", "all")
 
+
+def normalize_summary_scope(summary_scope: Optional[str]) -> str:
     scope = (summary_scope or "all").lower().strip()
-    if scope not in ("mine", "others", "all"):
-        scope = "all"
+    return scope if scope in SUMMARY_SCOPES else "all"
 
-    today = datetime.now(_KST).date()
 
-    # 오늘 이미 생성한 요약이 있으면 무조건 캐시 반환 (새로고침 포함)
-    cached = (
+def find_cached_summary(
+    db: Session, user_id: str, workspace_id: Optional[str], scope: str, day
+) -> Optional[AiSummaryCache]:
+    return (
         db.query(AiSummaryCache)
         .filter(
-            AiSummaryCache.user_id == current_user.id,
+            AiSummaryCache.user_id == user_id,
             AiSummaryCache.workspace_id == (workspace_id or None),
             AiSummaryCache.summary_scope == scope,
-            AiSummaryCache.summary_date == today,
+            AiSummaryCache.summary_date == day,
         )
         .first()
     )
-    if cached:
-        return AISummaryResponse(
-            summary=cached.summary_text,
-            generated_at=cached.generated_at,
-            from_cache=True,
-        )
 
+
+def _summary_prompt(db: Session, user: User, workspace_id: Optional[str], scope: str) -> str:
+    """사용자/워크스페이스/범위별 프로젝트 현황을 모아 요약 프롬프트를 만든다."""
     project_query = db.query(Project)
     if workspace_id:
         project_query = project_query.filter(Project.workspace_id == workspace_id)
 
-    if not current_user.is_admin:
-        project_query = project_query.filter(Project.team_member_ids.any(current_user.id))
+    if not user.is_admin:
+        project_query = project_query.filter(Project.team_member_ids.any(user.id))
 
     projects = project_query.all()
     project_ids = [project.id for project in projects]
@@ -351,7 +301,7 @@ async def get_ai_summary(
     if project_ids:
         tasks = db.query(Task).filter(Task.project_id.in_(project_ids)).all()
 
-    scoped_tasks = _tasks_for_summary_scope(tasks, current_user.id, scope)
+    scoped_tasks = _tasks_for_summary_scope(tasks, user.id, scope)
 
     stats: List[Dict[str, object]] = []
     for project in projects:
@@ -400,7 +350,7 @@ async def get_ai_summary(
     unread_notifications = (
         db.query(Notification)
         .filter(
-            Notification.user_id == current_user.id,
+            Notification.user_id == user.id,
             Notification.is_read.is_(False),
         )
         .order_by(Notification.created_at.desc())
@@ -408,8 +358,8 @@ async def get_ai_summary(
         .all()
     )
 
-    prompt = _build_prompt(
-        username=current_user.username,
+    return _build_prompt(
+        username=user.username,
         project_stats=stats,
         urgent_tasks=urgent_tasks,
         today_due_tasks=today_due_tasks,
@@ -419,39 +369,76 @@ async def get_ai_summary(
         summary_scope=scope,
     )
 
+
+async def generate_summary(
+    db: Session, user: User, workspace_id: Optional[str], scope: str, client=None
+) -> AiSummaryCache:
+    """오늘(KST) 요약을 생성해 캐시에 저장. 그 사이 다른 요청/스케줄러가 만들었으면 그것을 돌려준다."""
+    today = datetime.now(_KST).date()
+    prompt = _summary_prompt(db, user, workspace_id, scope)
+    summary = await (client or get_ai_client()).generate(prompt)
+    if not summary:
+        summary = "오늘 브리핑을 생성하지 못했습니다. 잠시 후 다시 시도해 주세요."
+
+    cached = find_cached_summary(db, user.id, workspace_id, scope, today)
+    if cached:
+        return cached
+    entry = AiSummaryCache(
+        id=str(uuid.uuid4()),
+        user_id=user.id,
+        workspace_id=workspace_id or None,
+        summary_scope=scope,
+        summary_date=today,
+        summary_text=summary,
+        generated_at=datetime.now(timezone.utc),
+    )
+    db.add(entry)
+    db.commit()
+    return entry
+
+
+@router.get("/summary", response_model=AISummaryResponse)
+async def get_ai_summary(
+    workspace_id: Optional[str] = Query(None),
+    summary_scope: str = Query(
+        "all",
+        description="요약 범위: mine(내 할당), others(다른 팀원 할당), all(전체)",
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    client = get_ai_client()
+    if not client.configured:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="GEMINI_API_KEY가 설정되지 않았습니다.",
+        )
+
+    scope = normalize_summary_scope(summary_scope)
+
+    # 오늘 이미 생성한 요약이 있으면 무조건 캐시 반환 (새로고침 포함, 대부분 사전 생성 스케줄러가 만든 것)
+    cached = find_cached_summary(db, current_user.id, workspace_id, scope, datetime.now(_KST).date())
+    if cached:
+        return AISummaryResponse(
+            summary=cached.summary_text,
+            generated_at=cached.generated_at,
+            from_cache=True,
+        )
+
     try:
-        from google import genai
-    except Exception as e:
+        entry = await generate_summary(db, current_user, workspace_id, scope, client)
+    except AILibraryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"AI 라이브러리를 불러오지 못했습니다: {e}",
         ) from e
-
-    try:
-        client = genai.Client(api_key=settings.GEMINI_API_KEY)
-        summary = await _generate_with_gemini_model_fallback(client, prompt)
-        if not summary:
-            summary = "오늘 브리핑을 생성하지 못했습니다. 잠시 후 다시 시도해 주세요."
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=_friendly_gemini_http_detail(e, "AI 요약 생성에 실패했습니다"),
         ) from e
 
-    now_utc = datetime.now(timezone.utc)
-
-    db.add(AiSummaryCache(
-        id=str(uuid.uuid4()),
-        user_id=current_user.id,
-        workspace_id=workspace_id or None,
-        summary_scope=scope,
-        summary_date=today,
-        summary_text=summary,
-        generated_at=now_utc,
-    ))
-    db.commit()
-
-    return AISummaryResponse(summary=summary, generated_at=now_utc, from_cache=False)
+    return AISummaryResponse(summary=entry.summary_text, generated_at=entry.generated_at, from_cache=False)
 
 
 def _build_export_prompt(
@@ -533,7 +520,8 @@ async def generate_export_report(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    if not settings.GEMINI_API_KEY:
+    client = get_ai_client()
+    if not client.configured:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="GEMINI_API_KEY가 설정되지 않았습니다.",
@@ -711,23 +699,20 @@ ECS 테스트 (with 김성빈, 김희웅 연구원)"""
         output_format=req.format,
     )
 
+    # 같은 프롬프트(작업 데이터/양식이 그대로)면 캐시, 동시에 같은 요청이 오면 호출 한 번을 공유
     try:
-        from google import genai
-    except Exception as e:
+        report, generated_at, from_cache = await export_report_cache.generate(client, prompt)
+        if not report:
+            report = "보고서를 생성하지 못했습니다. 잠시 후 다시 시도해 주세요."
+    except AILibraryError as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"AI 라이브러리를 불러오지 못했습니다: {e}",
         ) from e
-
-    try:
-        client = genai.Client(api_key=settings.GEMINI_API_KEY)
-        report = await _generate_with_gemini_model_fallback(client, prompt)
-        if not report:
-            report = "보고서를 생성하지 못했습니다. 잠시 후 다시 시도해 주세요."
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=_friendly_gemini_http_detail(e, "AI 보고서 생성에 실패했습니다"),
         ) from e
 
-    return AIExportResponse(report=report, generated_at=datetime.now(timezone.utc))
+    return AIExportResponse(report=report, generated_at=generated_at, from_cache=from_cache)
@@ -5,10 +5,10 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.chat import ChatMessage, ChatRoom, ChatRoomParticipant, ChatRoomType
 from app.models.message_reaction import MessageReaction
 from app.models.user import User
@@ -27,23 +27,22 @@ from app.utils.dependencies import get_current_user
 router = APIRouter()
 
 
-def _build_message_reactions(db: Session, message_ids: List[str]) -> dict[str, dict[str, list[str]]]:
+async def _build_message_reactions(db: AsyncSession, message_ids: List[str]) -> dict[str, dict[str, list[str]]]:
     if not message_ids:
         return {}
 
-    rows = (
-        db.query(MessageReaction)
-        .filter(MessageReaction.message_id.in_(message_ids))
-        .all()
-    )
+    rows = (await db.scalars(
+        select(MessageReaction)
+        .where(MessageReaction.message_id.in_(message_ids))
+    )).all()
     grouped: dict[str, dict[str, list[str]]] = {}
     for row in rows:
         grouped.setdefault(row.message_id, {}).setdefault(row.emoji, []).append(row.user_id)
     return grouped
 
 
-def _attach_message_reactions(db: Session, messages: List[ChatMessage]) -> None:
-    reaction_map = _build_message_reactions(db, [m.id for m in messages])
+async def _attach_message_reactions(db: AsyncSession, messages: List[ChatMessage]) -> None:
+    reaction_map = await _build_message_reactions(db, [m.id for m in messages])
     for message in messages:
         setattr(message, "reactions", reaction_map.get(message.id, {}))
 
@@ -51,22 +50,31 @@ def _attach_message_reactions(db: Session, messages: List[ChatMessage]) -> None:
 @router.get("/rooms", response_model=List[ChatRoomResponse])
 async def get_rooms(
     workspace_id: Optional[str] = Query(None, description="워크스페이스 ID 필터"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """현재 사용자가 참여한 채팅방 목록 조회"""
-    query = db.query(ChatRoom).filter(ChatRoom.member_ids.any(current_user.id))
+    query = select(ChatRoom).where(ChatRoom.member_ids.any(current_user.id))
     if workspace_id:
-        query = query.filter(ChatRoom.workspace_id == workspace_id)
+        query = query.where(ChatRoom.workspace_id == workspace_id)
+
+    rooms = (
+        await db.scalars(query.order_by(desc(ChatRoom.last_message_at), desc(ChatRoom.created_at)))
+    ).all()
 
-    rooms = query.order_by(desc(ChatRoom.last_message_at), desc(ChatRoom.created_at)).all()
+    # 방마다 참여 정보를 따로 조회하지 않고 한 번에 가져온다
+    room_ids = [room.id for room in rooms]
+    participants = (await db.scalars(
+        select(ChatRoomParticipant).where(
+            ChatRoomParticipant.room_id.in_(room_ids),
+            ChatRoomParticipant.user_id == current_user.id,
+        )
+    )).all() if room_ids else []
+    participant_by_room = {p.room_id: p for p in participants}
 
     result: List[ChatRoomResponse] = []
     for room in rooms:
-        participant = db.query(ChatRoomParticipant).filter(
-            ChatRoomParticipant.room_id == room.id,
-            ChatRoomParticipant.user_id == current_user.id,
-        ).first()
+        participant = participant_by_room.get(room.id)
 
         result.append(
             ChatRoomResponse(
@@ -91,19 +99,17 @@ async def get_rooms(
 @router.post("/rooms", response_model=ChatRoomResponse)
 async def create_room(
     room_data: ChatRoomCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """채팅방 생성 (DM 중복 방지 포함)"""
     member_ids = list(set(room_data.member_ids + [current_user.id]))
 
     if room_data.workspace_id:
-        valid_member_ids = {
-            m.user_id
-            for m in db.query(WorkspaceMember)
-            .filter(WorkspaceMember.workspace_id == room_data.workspace_id)
-            .all()
-        }
+        valid_member_ids = set((await db.scalars(
+            select(WorkspaceMember.user_id)
+            .where(WorkspaceMember.workspace_id == room_data.workspace_id)
+        )).all())
         invalid_member_ids = [uid for uid in member_ids if uid not in valid_member_ids]
         if invalid_member_ids:
             raise HTTPException(
@@ -119,20 +125,20 @@ async def create_room(
             )
 
         sorted_ids = sorted(member_ids)
-        existing_room = (
-            db.query(ChatRoom)
-            .filter(
+        existing_room = await db.scalar(
+            select(ChatRoom)
+            .where(
                 ChatRoom.type == ChatRoomType.DM,
                 ChatRoom.member_ids.contains(sorted_ids),
             )
-            .first()
+            .limit(1)
         )
 
         if existing_room:
-            participant = db.query(ChatRoomParticipant).filter(
+            participant = await db.scalar(select(ChatRoomParticipant).where(
                 ChatRoomParticipant.room_id == existing_room.id,
                 ChatRoomParticipant.user_id == current_user.id,
-            ).first()
+            ))
             return ChatRoomResponse(
                 id=existing_room.id,
                 type=existing_room.type,
@@ -170,8 +176,8 @@ async def create_room(
             )
         )
 
-    db.commit()
-    db.refresh(new_room)
+    await db.commit()
+    await db.refresh(new_room)
 
     asyncio.create_task(
         manager.send_to_users(
@@ -208,15 +214,15 @@ async def create_room(
 
 @router.get("/rooms/unread-count")
 async def get_unread_count(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """전체 읽지 않은 메시지 수"""
-    from sqlalchemy import func
-
-    total = db.query(func.coalesce(func.sum(ChatRoomParticipant.unread_count), 0)).filter(
-        ChatRoomParticipant.user_id == current_user.id
-    ).scalar()
+    total = await db.scalar(
+        select(func.coalesce(func.sum(ChatRoomParticipant.unread_count), 0)).where(
+            ChatRoomParticipant.user_id == current_user.id
+        )
+    )
     return {"count": int(total)}
 
 
@@ -225,11 +231,11 @@ async def get_messages(
     room_id: str,
     limit: int = Query(50, ge=1, le=100),
     before_id: Optional[str] = Query(None, description="해당 메시지 이전 메시지 조회"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """채팅방 메시지 목록 (커서 기반 페이징)"""
-    room = db.query(ChatRoom).filter(ChatRoom.id == room_id).first()
+    room = await db.get(ChatRoom, room_id)
     if not room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -242,15 +248,15 @@ async def get_messages(
             detail="해당 채팅방에 참여하지 않았습니다",
         )
 
-    query = db.query(ChatMessage).filter(ChatMessage.room_id == room_id)
+    query = select(ChatMessage).where(ChatMessage.room_id == room_id)
     if before_id:
-        cursor_msg = db.query(ChatMessage).filter(ChatMessage.id == before_id).first()
+        cursor_msg = await db.get(ChatMessage, before_id)
         if cursor_msg:
-            query = query.filter(ChatMessage.created_at < cursor_msg.created_at)
+            query = query.where(ChatMessage.created_at < cursor_msg.created_at)
 
-    messages = query.order_by(desc(ChatMessage.created_at)).limit(limit).all()
+    messages = list((await db.scalars(query.order_by(desc(ChatMessage.created_at)).limit(limit))).all())
     messages.reverse()
-    _attach_message_reactions(db, messages)
+    await _attach_message_reactions(db, messages)
     return messages
 
 
@@ -258,11 +264,11 @@ async def get_messages(
 async def send_message(
     room_id: str,
     message_data: ChatMessageCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """메시지 전송"""
-    room = db.query(ChatRoom).filter(ChatRoom.id == room_id).first()
+    room = await db.get(ChatRoom, room_id)
     if not room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -298,15 +304,15 @@ async def send_message(
     room.last_message_sender = current_user.username
     room.last_message_at = datetime.now(timezone.utc)
 
-    participants = db.query(ChatRoomParticipant).filter(
+    participants = (await db.scalars(select(ChatRoomParticipant).where(
         ChatRoomParticipant.room_id == room_id,
         ChatRoomParticipant.user_id != current_user.id,
-    ).all()
+    ))).all()
     for participant in participants:
         participant.unread_count = (participant.unread_count or 0) + 1
 
-    db.commit()
-    db.refresh(new_message)
+    await db.commit()
+    await db.refresh(new_message)
 
     target_users = [uid for uid in (room.member_ids or []) if uid != current_user.id]
     if target_users:
@@ -340,11 +346,11 @@ async def update_message(
     room_id: str,
     message_id: str,
     message_data: ChatMessageUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """메시지 수정 (본인 메시지만 가능)"""
-    room = db.query(ChatRoom).filter(ChatRoom.id == room_id).first()
+    room = await db.get(ChatRoom, room_id)
     if not room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -357,10 +363,10 @@ async def update_message(
             detail="해당 채팅방에 참여하지 않았습니다",
         )
 
-    message = db.query(ChatMessage).filter(
+    message = await db.scalar(select(ChatMessage).where(
         ChatMessage.id == message_id,
         ChatMessage.room_id == room_id,
-    ).first()
+    ))
     if not message:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -381,8 +387,8 @@ async def update_message(
         )
 
     message.content = content
-    db.commit()
-    db.refresh(message)
+    await db.commit()
+    await db.refresh(message)
 
     target_users = [uid for uid in (room.member_ids or []) if uid != current_user.id]
     if target_users:
@@ -403,7 +409,7 @@ async def update_message(
             )
         )
 
-    _attach_message_reactions(db, [message])
+    await _attach_message_reactions(db, [message])
     return message
 
 
@@ -411,11 +417,11 @@ async def update_message(
 async def delete_message(
     room_id: str,
     message_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """메시지 삭제 (본인 메시지만 가능)"""
-    room = db.query(ChatRoom).filter(ChatRoom.id == room_id).first()
+    room = await db.get(ChatRoom, room_id)
     if not room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -428,10 +434,10 @@ async def delete_message(
             detail="해당 채팅방에 참여하지 않았습니다",
         )
 
-    message = db.query(ChatMessage).filter(
+    message = await db.scalar(select(ChatMessage).where(
         ChatMessage.id == message_id,
         ChatMessage.room_id == room_id,
-    ).first()
+    ))
     if not message:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -444,8 +450,8 @@ async def delete_message(
             detail="본인이 보낸 메시지만 삭제 가능합니다",
         )
 
-    db.delete(message)
-    db.commit()
+    await db.delete(message)
+    await db.commit()
 
     target_users = [uid for uid in (room.member_ids or []) if uid != current_user.id]
     if target_users:
@@ -467,11 +473,11 @@ async def toggle_message_reaction(
     room_id: str,
     message_id: str,
     payload: MessageReactionToggle,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """메시지 리액션 토글"""
-    room = db.query(ChatRoom).filter(ChatRoom.id == room_id).first()
+    room = await db.get(ChatRoom, room_id)
     if not room:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -484,10 +490,10 @@ async def toggle_message_reaction(
             detail="해당 채팅방에 참여하지 않았습니다",
         )
 
-    message = db.query(ChatMessage).filter(
+    message = await db.scalar(select(ChatMessage).where(
         ChatMessage.id == message_id,
         ChatMessage.room_id == room_id,
-    ).first()
+    ))
     if not message:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -501,14 +507,14 @@ async def toggle_message_reaction(
             detail="유효한 이모지를 입력해주세요",
         )
 
-    existing = db.query(MessageReaction).filter(
+    existing = await db.scalar(select(MessageReaction).where(
         MessageReaction.message_id == message_id,
         MessageReaction.user_id == current_user.id,
         MessageReaction.emoji == emoji,
-    ).first()
+    ))
 
     if existing:
-        db.delete(existing)
+        await db.delete(existing)
     else:
         db.add(
             MessageReaction(
@@ -518,9 +524,9 @@ async def toggle_message_reaction(
             )
         )
 
-    db.commit()
+    await db.commit()
 
-    reaction_map = _build_message_reactions(db, [message_id]).get(message_id, {})
+    reaction_map = (await _build_message_reactions(db, [message_id])).get(message_id, {})
 
     target_users = [uid for uid in (room.member_ids or []) if uid != current_user.id]
     if target_users:
@@ -544,14 +550,14 @@ async def toggle_message_reaction(
 @router.patch("/rooms/{room_id}/read")
 async def mark_room_as_read(
     room_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """채팅방 읽음 처리"""
-    participant = db.query(ChatRoomParticipant).filter(
+    participant = await db.scalar(select(ChatRoomParticipant).where(
         ChatRoomParticipant.room_id == room_id,
         ChatRoomParticipant.user_id == current_user.id,
-    ).first()
+    ))
 
     if not participant:
         raise HTTPException(
@@ -559,14 +565,14 @@ async def mark_room_as_read(
             detail="채팅방 참여 정보를 찾을 수 없습니다",
         )
 
-    last_message = db.query(ChatMessage).filter(
+    last_message = await db.scalar(select(ChatMessage).where(
         ChatMessage.room_id == room_id
-    ).order_by(desc(ChatMessage.created_at)).first()
+    ).order_by(desc(ChatMessage.created_at)).limit(1))
 
     participant.unread_count = 0
     participant.last_read_at = datetime.now(timezone.utc)
     if last_message:
         participant.last_read_message_id = last_message.id
 
-    db.commit()
+    await db.commit()
     return {"message": "읽음 처리 완료"}
@@ -18,6 +18,7 @@ from app.schemas.checklist import (
     ChecklistItemResponse,
 )
 from app.utils.dependencies import get_current_user
+from app.utils.etag import ConditionalGet, row_version
 from app.models.task import Task
 from app.utils.notifications import notify_task_checklist_added, notify_task_checklist_item_added
 
@@ -53,9 +54,22 @@ def _build_checklist_response(checklist: Checklist, items: List[ChecklistItem])
 @router.get("/task/{task_id}", response_model=List[ChecklistResponse])
 async def get_checklists_by_task(
     task_id: str,
+    conditional: ConditionalGet = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    # 체크리스트·항목의 (id, updated_at) 로 ETag 비교
+    version_rows = (
+        db.query(Checklist.id, Checklist.updated_at, ChecklistItem.id, ChecklistItem.updated_at)
+        .outerjoin(ChecklistItem, ChecklistItem.checklist_id == Checklist.id)
+        .filter(Checklist.task_id == task_id)
+        .order_by(Checklist.id, ChecklistItem.id)
+        .all()
+    )
+    not_modified = conditional.check(row_version(version_rows))
+    if not_modified is not None:
+        return not_modified
+
     checklists = (
         db.query(Checklist)
         .filter(Checklist.task_id == task_id)
@@ -5,9 +5,10 @@ import uuid
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.comment import Comment
 from app.models.comment_reaction import CommentReaction
 from app.models.notification import Notification
@@ -20,9 +21,11 @@ from app.schemas.comment import (
     CommentResponse,
     CommentUpdate,
 )
+from app.utils.activity import record_task_activity
 from app.utils.dependencies import get_current_user
+from app.utils.etag import ConditionalGet, row_version
 from app.models.notification import NotificationType
-from app.utils.notifications import create_notification, notify_task_comment_added
+from app.utils.notifications import create_notifications_bulk, notify_task_comment_added
 
 router = APIRouter()
 
@@ -37,23 +40,22 @@ def _safe_list(value) -> List[str]:
     return []
 
 
-def _build_comment_reactions(db: Session, comment_ids: List[str]) -> dict[str, dict[str, list[str]]]:
+async def _build_comment_reactions(db: AsyncSession, comment_ids: List[str]) -> dict[str, dict[str, list[str]]]:
     if not comment_ids:
         return {}
 
-    rows = (
-        db.query(CommentReaction)
-        .filter(CommentReaction.comment_id.in_(comment_ids))
-        .all()
-    )
+    rows = (await db.scalars(
+        select(CommentReaction)
+        .where(CommentReaction.comment_id.in_(comment_ids))
+    )).all()
     grouped: dict[str, dict[str, list[str]]] = {}
     for row in rows:
         grouped.setdefault(row.comment_id, {}).setdefault(row.emoji, []).append(row.user_id)
     return grouped
 
 
-def _attach_comment_reactions(db: Session, comments: List[Comment]) -> None:
-    reaction_map = _build_comment_reactions(db, [c.id for c in comments])
+async def _attach_comment_reactions(db: AsyncSession, comments: List[Comment]) -> None:
+    reaction_map = await _build_comment_reactions(db, [c.id for c in comments])
     for comment in comments:
         setattr(comment, "reactions", reaction_map.get(comment.id, {}))
 
@@ -61,33 +63,45 @@ def _attach_comment_reactions(db: Session, comments: List[Comment]) -> None:
 @router.get("/task/{task_id}", response_model=List[CommentResponse])
 async def get_comments_by_task(
     task_id: str,
-    db: Session = Depends(get_db),
+    conditional: ConditionalGet = Depends(),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
+    # 댓글 (id, updated_at) + 리액션 id 로 ETag 비교
+    version_rows = (await db.execute(
+        select(Comment.id, Comment.updated_at, CommentReaction.id)
+        .outerjoin(CommentReaction, CommentReaction.comment_id == Comment.id)
+        .where(Comment.task_id == task_id)
+        .order_by(Comment.id, CommentReaction.id)
+    )).all()
+    not_modified = conditional.check(row_version(version_rows))
+    if not_modified is not None:
+        return not_modified
+
     comments = (
-        db.query(Comment).filter(Comment.task_id == task_id).order_by(Comment.created_at).all()
-    )
-    _attach_comment_reactions(db, comments)
+        await db.scalars(select(Comment).where(Comment.task_id == task_id).order_by(Comment.created_at))
+    ).all()
+    await _attach_comment_reactions(db, comments)
     return comments
 
 
 @router.get("/{comment_id}", response_model=CommentResponse)
 async def get_comment(
     comment_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    comment = await db.get(Comment, comment_id)
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="댓글을 찾을 수 없습니다")
-    _attach_comment_reactions(db, [comment])
+    await _attach_comment_reactions(db, [comment])
     return comment
 
 
 @router.post("/", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
 async def create_comment(
     comment_data: CommentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
@@ -101,13 +115,13 @@ async def create_comment(
                 detail="댓글 내용 또는 첨부파일이 필요합니다",
             )
 
-        task = db.query(Task).filter(Task.id == comment_data.task_id).first()
+        task = await db.get(Task, comment_data.task_id)
         if not task:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="태스크를 찾을 수 없습니다"
             )
 
-        project = db.query(Project).filter(Project.id == task.project_id).first()
+        project = await db.get(Project, task.project_id)
         if not current_user.is_admin and not current_user.is_pm:
             if not project or (current_user.id != project.creator_id and current_user.id not in (project.team_member_ids or [])):
                 raise HTTPException(
@@ -125,6 +139,7 @@ async def create_comment(
             file_urls=file_urls,
         )
         db.add(new_comment)
+        await db.execute(record_task_activity(task.project_id, current_user.id, task.id))
 
         try:
             comment_ids_list = _safe_list(task.comment_ids)
@@ -136,34 +151,34 @@ async def create_comment(
             task.comment_ids = [new_comment.id]
 
         try:
-            db.commit()
-            db.refresh(new_comment)
+            await db.commit()
+            await db.refresh(new_comment)
 
-            notify_task_comment_added(db, task, current_user, new_comment.id)
+            await db.run_sync(notify_task_comment_added, task, current_user, new_comment.id)
 
             # Handle @mention notifications in comment content.
             mention_pattern = re.compile(r"@([A-Za-z0-9_]+)")
             mentioned_usernames = set(mention_pattern.findall(content))
             if mentioned_usernames:
-                mentioned_users = (
-                    db.query(User)
-                    .filter(User.username.in_(list(mentioned_usernames)), User.id != current_user.id)
-                    .all()
-                )
+                mentioned_users = (await db.scalars(
+                    select(User)
+                    .where(User.username.in_(list(mentioned_usernames)), User.id != current_user.id)
+                )).all()
                 team_member_ids = set(project.team_member_ids or []) if project else set()
-                for mentioned_user in mentioned_users:
-                    if team_member_ids and mentioned_user.id not in team_member_ids:
-                        continue
-                    create_notification(
-                        db=db,
-                        notification_type=NotificationType.TASK_MENTIONED,
-                        user_id=mentioned_user.id,
-                        title=f"'{task.title}'에서 멘션되었습니다",
-                        message=f"{current_user.username}님이 댓글에서 회원님을 언급했습니다",
-                        project_id=task.project_id,
-                        task_id=task.id,
-                        comment_id=new_comment.id,
-                    )
+                mentioned_ids = [
+                    u.id for u in mentioned_users
+                    if not team_member_ids or u.id in team_member_ids
+                ]
+                await db.run_sync(
+                    create_notifications_bulk,
+                    notification_type=NotificationType.TASK_MENTIONED,
+                    user_ids=mentioned_ids,
+                    title=f"'{task.title}'에서 멘션되었습니다",
+                    message=f"{current_user.username}님이 댓글에서 회원님을 언급했습니다",
+                    project_id=task.project_id,
+                    task_id=task.id,
+                    comment_id=new_comment.id,
+                )
 
             import asyncio
 
@@ -193,13 +208,13 @@ async def create_comment(
             setattr(new_comment, "reactions", {})
             return new_comment
         except Exception as commit_error:
-            db.rollback()
+            await db.rollback()
             print(f"[ERROR] db commit failed: {commit_error}")
             raise
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"[ERROR] create_comment failed: {e}")
         print(f"[ERROR] task_id={comment_data.task_id}, user_id={current_user.id}")
         print(f"[ERROR] content={comment_data.content}, image_urls={comment_data.image_urls}")
@@ -213,10 +228,10 @@ async def create_comment(
 async def update_comment(
     comment_id: str,
     comment_data: CommentUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    comment = await db.get(Comment, comment_id)
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="댓글을 찾을 수 없습니다")
 
@@ -230,9 +245,9 @@ async def update_comment(
         comment.image_urls = comment_data.image_urls
     if comment_data.file_urls is not None:
         comment.file_urls = comment_data.file_urls
-    db.commit()
-    db.refresh(comment)
-    _attach_comment_reactions(db, [comment])
+    await db.commit()
+    await db.refresh(comment)
+    await _attach_comment_reactions(db, [comment])
     return comment
 
 
@@ -240,10 +255,10 @@ async def update_comment(
 async def toggle_comment_reaction(
     comment_id: str,
     payload: CommentReactionToggle,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    comment = await db.get(Comment, comment_id)
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="댓글을 찾을 수 없습니다")
 
@@ -254,14 +269,14 @@ async def toggle_comment_reaction(
             detail="지원하지 않는 리액션입니다",
         )
 
-    existing = db.query(CommentReaction).filter(
+    existing = await db.scalar(select(CommentReaction).where(
         CommentReaction.comment_id == comment_id,
         CommentReaction.user_id == current_user.id,
         CommentReaction.emoji == emoji,
-    ).first()
+    ))
 
     if existing:
-        db.delete(existing)
+        await db.delete(existing)
     else:
         db.add(
             CommentReaction(
@@ -271,18 +286,18 @@ async def toggle_comment_reaction(
             )
         )
 
-    db.commit()
-    reaction_map = _build_comment_reactions(db, [comment_id]).get(comment_id, {})
+    await db.commit()
+    reaction_map = (await _build_comment_reactions(db, [comment_id])).get(comment_id, {})
     return {"reactions": reaction_map}
 
 
 @router.delete("/{comment_id}")
 async def delete_comment(
     comment_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    comment = db.query(Comment).filter(Comment.id == comment_id).first()
+    comment = await db.get(Comment, comment_id)
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="댓글을 찾을 수 없습니다")
 
@@ -291,7 +306,7 @@ async def delete_comment(
             status_code=status.HTTP_403_FORBIDDEN, detail="댓글을 삭제할 권한이 없습니다"
         )
 
-    task = db.query(Task).filter(Task.id == comment.task_id).first()
+    task = await db.get(Task, comment.task_id)
     if task:
         try:
             comment_ids_list = _safe_list(task.comment_ids)
@@ -301,10 +316,10 @@ async def delete_comment(
             print(f"[ERROR] failed to update task.comment_ids on delete: {e}")
 
     # 댓글을 참조하는 알림의 comment_id를 NULL로 설정 (FK 제약 위반 방지)
-    db.query(Notification).filter(Notification.comment_id == comment_id).update(
-        {"comment_id": None}
+    await db.execute(
+        update(Notification).where(Notification.comment_id == comment_id).values(comment_id=None)
     )
 
-    db.delete(comment)
-    db.commit()
+    await db.delete(comment)
+    await db.commit()
     return {"message": "댓글이 삭제되었습니다"}
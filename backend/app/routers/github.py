@@ -1,17 +1,20 @@
 """GitHub 연동 API router."""
 
 import asyncio
+import json
 import re
 import uuid
 from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.models.github import ProjectGitHub
 from app.models.project import Project
 from app.models.user import User
+from app.routers.websocket import manager
 from app.schemas.github import (
     GitHubBranchResponse,
     GitHubCommitResponse,
@@ -29,10 +32,12 @@ from app.schemas.github import (
     GitHubTagCreate,
     GitHubTagResponse,
 )
-from app.utils.dependencies import get_current_user
+from app.utils.commit_graph import ORDER_DATE, ORDER_TOPO, clear_commit_graph, graph_page, sync_commit_graph
+from app.utils.dependencies import get_current_admin_user, get_current_user
 from app.utils.github_api import (
     GitHubApiError,
     compare_commits,
+    github,
     get_branches,
     get_commits,
     get_issues,
@@ -44,6 +49,7 @@ from app.utils.github_api import (
     get_user_repos,
     validate_repo,
 )
+from app.utils import github_webhook
 from app.models.user_github_token import UserGitHubToken
 
 router = APIRouter()
@@ -102,6 +108,72 @@ def _to_repo_response(gh: ProjectGitHub) -> GitHubRepoResponse:
     )
 
 
+# ── 클라이언트 메트릭 ─────────────────────────────────────
+
+@router.get("/metrics")
+async def get_github_client_metrics(
+    _: User = Depends(get_current_admin_user),
+):
+    """GitHub API 클라이언트 상태 (요청 수, 캐시 적중/304 재검증, 토큰별 rate limit 잔량) — 관리자 전용"""
+    return github.stats()
+
+
+# ── 웹훅 수신 ─────────────────────────────────────────────
+
+@router.post("/webhook")
+async def receive_github_webhook(
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    """GitHub 웹훅 수신 — 서명 검증 후 캐시 무효화/재적재, 프로젝트 멤버에게 github_event 전송 (인증 대신 서명)"""
+    if not settings.GITHUB_WEBHOOK_SECRET:
+        raise HTTPException(status_code=503, detail="GitHub webhook secret is not configured")
+    body = await request.body()
+    if not github_webhook.verify_signature(
+        settings.GITHUB_WEBHOOK_SECRET, body, request.headers.get("X-Hub-Signature-256")
+    ):
+        raise HTTPException(status_code=401, detail="Invalid signature")
+
+    event = request.headers.get("X-GitHub-Event", "")
+    if event == "ping":
+        return {"status": "pong"}
+    if event not in github_webhook.SUPPORTED_EVENTS:
+        return {"status": "ignored"}
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    repo = github_webhook.repo_of(payload)
+    if repo is None:
+        return {"status": "ignored"}
+    owner, name = repo
+    links = github_webhook.linked_repos(db, owner, name)
+    if not links:
+        return {"status": "ignored"}
+
+    project_ids = [gh.project_id for gh in links]
+    summary = github_webhook.summarize(event, payload)
+    delivery_id = request.headers.get("X-GitHub-Delivery") or str(uuid.uuid4())
+    if not github_webhook.record_delivery(
+        db, delivery_id, event, payload, f"{owner}/{name}", project_ids, summary
+    ):
+        return {"status": "duplicate"}
+    member_ids = github_webhook.project_member_ids(db, project_ids)
+    db.commit()
+
+    github_webhook.invalidate_caches(owner, name, event)
+    asyncio.create_task(github_webhook.refresh_after_webhook(project_ids, event))
+    for project_id in project_ids:
+        asyncio.create_task(manager.send_to_users(
+            {
+                "type": "github_event",
+                "data": {"project_id": project_id, "event": event, "action": payload.get("action"), **summary},
+            },
+            member_ids,
+        ))
+    return {"status": "accepted"}
+
+
 # ── 내 레포 목록 ──────────────────────────────────────────
 
 @router.get("/my-repos")
@@ -147,6 +219,8 @@ async def connect_repo(
     # 이미 연결된 레포가 있으면 교체 (upsert)
     existing = db.query(ProjectGitHub).filter(ProjectGitHub.project_id == project_id).first()
     if existing:
+        if (existing.repo_owner, existing.repo_name) != (body.repo_owner, body.repo_name):
+            clear_commit_graph(db, project_id)
         existing.repo_owner = body.repo_owner
         existing.repo_name = body.repo_name
         existing.access_token = None
@@ -181,6 +255,7 @@ async def disconnect_repo(
     if not gh:
         raise HTTPException(status_code=404, detail="No GitHub repository connected")
 
+    clear_commit_graph(db, project_id)
     db.delete(gh)
     db.commit()
 
@@ -336,14 +411,18 @@ async def get_commit_graph(
     project_id: str,
     page: int = Query(1, ge=1),
     per_page: int = Query(100, ge=1, le=100),
+    order: str = Query(ORDER_DATE, regex=f"^({ORDER_DATE}|{ORDER_TOPO})$"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """전체 브랜치 커밋 그래프. 브랜치별 커밋을 병렬 fetch → 중복 제거 → 날짜순 정렬."""
+    """전체 브랜치 커밋 그래프. head 가 바뀐 브랜치만 가져와 커밋 DAG 캐시를 갱신한 뒤 캐시에서 페이지를 만든다.
+
+    order: date(날짜 내림차순) | topo(자식이 부모보다 먼저, 같은 단계는 최신순)
+    """
     gh = _get_github_record(db, project_id, current_user)
     token = _get_user_token(db, current_user) or gh.access_token
 
-    # 브랜치/태그 목록
+    # 브랜치/태그 목록 (클라이언트 캐시 — 변경이 없으면 304)
     try:
         branches_raw, tags_raw = await asyncio.gather(
             get_branches(gh.repo_owner, gh.repo_name, token),
@@ -362,59 +441,30 @@ async def get_commit_graph(
         sha = t.get("commit", {}).get("sha", "")
         tag_sha_to_names.setdefault(sha, []).append(t.get("name", ""))
 
-    branch_names = [b.get("name", "") for b in branches_raw]
-    if not branch_names:
+    if not branches_raw:
         return GitHubGraphResponse(commits=[], has_more=False)
 
-    # 브랜치별 커밋 병렬 fetch
-    async def _fetch(branch: str):
-        try:
-            return await get_commits(gh.repo_owner, gh.repo_name, token, branch, page, per_page)
-        except GitHubApiError:
-            return []
-
-    results = await asyncio.gather(*[_fetch(b) for b in branch_names])
-
-    # 중복 제거 (SHA 기준)
-    seen: set[str] = set()
-    merged: list[dict] = []
-    for commits_list in results:
-        for item in commits_list:
-            sha = item.get("sha", "")
-            if sha and sha not in seen:
-                seen.add(sha)
-                merged.append(item)
-
-    # 날짜 내림차순 정렬
-    def _date_key(item: dict) -> str:
-        return item.get("commit", {}).get("author", {}).get("date", "")
-
-    merged.sort(key=_date_key, reverse=True)
-
-    has_more = len(merged) >= per_page
-    commits_page = merged[:per_page]
-
-    result_commits = []
-    for item in commits_page:
-        commit = item.get("commit", {})
-        author = commit.get("author", {})
-        gh_author = item.get("author") or {}
-        sha = item.get("sha", "")
-        parent_shas = [p.get("sha", "") for p in item.get("parents", [])]
-        result_commits.append(GitHubGraphCommitResponse(
-            sha=sha,
-            message=commit.get("message", ""),
-            author_name=author.get("name", ""),
-            author_email=author.get("email"),
-            author_avatar_url=gh_author.get("avatar_url"),
-            date=author.get("date", ""),
-            url=item.get("html_url", ""),
-            parents=parent_shas,
-            branch_names=branch_sha_to_names.get(sha, []),
-            tag_names=tag_sha_to_names.get(sha, []),
-        ))
-
-    return GitHubGraphResponse(commits=result_commits, has_more=has_more)
+    await sync_commit_graph(db, gh, token, branches_raw)
+    commits_page, has_more = await graph_page(db, gh, token, page, per_page, order)
+
+    return GitHubGraphResponse(
+        commits=[
+            GitHubGraphCommitResponse(
+                sha=c.sha,
+                message=c.message,
+                author_name=c.author_name,
+                author_email=c.author_email,
+                author_avatar_url=c.author_avatar_url,
+                date=c.date,
+                url=c.url,
+                parents=list(c.parents or []),
+                branch_names=branch_sha_to_names.get(c.sha, []),
+                tag_names=tag_sha_to_names.get(c.sha, []),
+            )
+            for c in commits_page
+        ],
+        has_more=has_more,
+    )
 
 
 @router.get("/{project_id}/releases", response_model=List[GitHubReleaseResponse])
@@ -3,11 +3,12 @@
 import uuid
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, select
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models.meeting_minutes import MeetingMinutes
 from app.models.user import User
 from app.schemas.meeting_minutes import (
@@ -16,26 +17,51 @@ from app.schemas.meeting_minutes import (
     MeetingMinutesResponse,
 )
 from app.utils.dependencies import get_current_user
+from app.utils.pagination import TOTAL_NONE, apply_keyset, count_rows, split_page
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[MeetingMinutesResponse])
 async def list_meeting_minutes(
+    response: Response,
     workspace_id: str = Query(...),
     category: Optional[str] = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (첫 페이지는 빈 값, 다음 커서는 X-Next-Cursor 헤더)"),
+    total: Optional[str] = Query(None, description="X-Total-Count 헤더 계산 방식 (exact, approx, none)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """워크스페이스의 회의록 목록 조회."""
-    query = db.query(MeetingMinutes).filter(
+    query = select(MeetingMinutes).where(
         MeetingMinutes.workspace_id == workspace_id
     )
     if category:
-        query = query.filter(MeetingMinutes.category == category)
-    items = query.order_by(desc(MeetingMinutes.meeting_date), desc(MeetingMinutes.created_at)).offset(skip).limit(limit).all()
+        query = query.where(MeetingMinutes.category == category)
+
+    if total and total != TOTAL_NONE:
+        total_count = await count_rows(db, query, total)
+        if total_count is not None:
+            response.headers["X-Total-Count"] = str(total_count)
+
+    if cursor is not None:
+        # 커서 모드: (meeting_date, created_at, id) 최신순 키셋
+        order = [
+            (MeetingMinutes.meeting_date, True),
+            (MeetingMinutes.created_at, True),
+            (MeetingMinutes.id, True),
+        ]
+        rows = (await db.scalars(apply_keyset(query, order, cursor).limit(limit + 1))).all()
+        items, next_cursor = split_page(rows, limit, order)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return items
+
+    items = (await db.scalars(
+        query.order_by(desc(MeetingMinutes.meeting_date), desc(MeetingMinutes.created_at)).offset(skip).limit(limit)
+    )).all()
     return items
 
 
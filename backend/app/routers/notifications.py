@@ -2,13 +2,15 @@
 알림 관리 API 라우터
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.database import get_db
+from app.database import get_async_db
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.notification import NotificationResponse, NotificationUpdate
 from app.utils.dependencies import get_current_user
+from app.utils.pagination import TOTAL_EXACT, TOTAL_NONE, apply_keyset, count_rows, split_page
 
 router = APIRouter()
 
@@ -19,11 +21,13 @@ async def get_notifications(
     unread_only: Optional[bool] = Query(False, description="읽지 않은 알림만"),
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(50, ge=1, le=200, description="가져올 항목 수"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 next_cursor)"),
+    total: Optional[str] = Query(None, description="전체 개수 계산 방식 (exact, approx, none). 커서 모드 기본값 none"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """알림 목록 가져오기 (페이지네이션 지원)"""
-    query = db.query(Notification)
+    query = select(Notification)
 
     # 현재 사용자의 알림만 가져오기 (user_id가 지정되지 않은 경우)
     if user_id is None:
@@ -36,22 +40,42 @@ async def get_notifications(
                 detail="다른 사용자의 알림을 조회할 권한이 없습니다"
             )
 
-    query = query.filter(Notification.user_id == user_id)
+    query = query.where(Notification.user_id == user_id)
 
     if unread_only:
-        query = query.filter(Notification.is_read == False)
+        query = query.where(Notification.is_read == False)
+
+    if cursor is not None:
+        # 커서 모드: (created_at, id) 최신순 키셋 — 깊이와 무관하게 페이지 크기만큼만 읽는다
+        order = [(Notification.created_at, True), (Notification.id, True)]
+        rows = (await db.scalars(apply_keyset(query, order, cursor).limit(limit + 1))).all()
+        notifications, next_cursor = split_page(rows, limit, order)
+        return {
+            "items": [NotificationResponse.model_validate(n) for n in notifications],
+            "total": await count_rows(db, query, total or TOTAL_NONE),
+            "limit": limit,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+        }
 
     # 전체 개수
-    total = query.count()
+    total_count = await count_rows(db, query, total or TOTAL_EXACT)
 
     # 최신순 정렬 + 페이지네이션
-    notifications = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
+    rows = (
+        await db.scalars(
+            query.order_by(Notification.created_at.desc(), Notification.id.desc())
+            .offset(skip)
+            .limit(limit + 1)
+        )
+    ).all()
+    notifications = rows[:limit]
     return {
         "items": [NotificationResponse.model_validate(n) for n in notifications],
-        "total": total,
+        "total": total_count,
         "skip": skip,
         "limit": limit,
-        "has_more": (skip + limit) < total,
+        "has_more": len(rows) > limit,
     }
 
 
@@ -59,11 +83,11 @@ async def get_notifications(
 async def get_notification_count(
     user_id: Optional[str] = Query(None, description="사용자 ID"),
     unread_only: Optional[bool] = Query(True, description="읽지 않은 알림만"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """알림 개수 가져오기"""
-    query = db.query(Notification)
+    query = select(func.count(Notification.id))
     
     if user_id is None:
         user_id = current_user.id
@@ -74,23 +98,23 @@ async def get_notification_count(
                 detail="다른 사용자의 알림을 조회할 권한이 없습니다"
             )
     
-    query = query.filter(Notification.user_id == user_id)
+    query = query.where(Notification.user_id == user_id)
 
     if unread_only:
-        query = query.filter(Notification.is_read == False)
+        query = query.where(Notification.is_read == False)
 
-    count = query.count()
+    count = await db.scalar(query)
     return {"count": count}
 
 
 @router.patch("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_notification_as_read(
     notification_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """알림을 읽음으로 표시"""
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
+    notification = await db.get(Notification, notification_id)
     if not notification:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -105,15 +129,15 @@ async def mark_notification_as_read(
         )
     
     notification.is_read = True
-    db.commit()
-    db.refresh(notification)
+    await db.commit()
+    await db.refresh(notification)
     return notification
 
 
 @router.patch("/read-all", response_model=List[NotificationResponse])
 async def mark_all_notifications_as_read(
     user_id: Optional[str] = Query(None, description="사용자 ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """모든 알림을 읽음으로 표시"""
@@ -126,26 +150,28 @@ async def mark_all_notifications_as_read(
                 detail="다른 사용자의 알림을 수정할 권한이 없습니다"
             )
     
-    notifications = db.query(Notification).filter(
-        Notification.user_id == user_id,
-        Notification.is_read == False
-    ).all()
+    notifications = (await db.scalars(
+        select(Notification).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        )
+    )).all()
     
     for notification in notifications:
         notification.is_read = True
     
-    db.commit()
+    await db.commit()
     return notifications
 
 
 @router.delete("/{notification_id}")
 async def delete_notification(
     notification_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """알림 삭제"""
-    notification = db.query(Notification).filter(Notification.id == notification_id).first()
+    notification = await db.get(Notification, notification_id)
     if not notification:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -159,17 +185,17 @@ async def delete_notification(
             detail="다른 사용자의 알림을 삭제할 권한이 없습니다"
         )
     
-    db.delete(notification)
-    db.commit()
+    await db.delete(notification)
+    await db.commit()
     return {"message": "알림이 삭제되었습니다"}
 
 
 @router.delete("/")
 async def delete_all_notifications(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """모든 알림 삭제"""
-    db.query(Notification).filter(Notification.user_id == current_user.id).delete()
-    db.commit()
+    await db.execute(delete(Notification).where(Notification.user_id == current_user.id))
+    await db.commit()
     return {"message": "모든 알림이 삭제되었습니다"}
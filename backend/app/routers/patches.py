@@ -12,6 +12,7 @@ from app.models.patch import ProjectPatch
 from app.models.project import Project
 from app.models.user import User
 from app.schemas.patch import PatchCreate, PatchUpdate, PatchResponse
+from app.utils.access import accessible_project_ids_query, can_access_project
 from app.utils.dependencies import get_current_user
 
 
@@ -22,19 +23,11 @@ def _get_project_or_403(db: Session, project_id: str, user: User) -> Project:
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로젝트를 찾을 수 없습니다")
-    if not user.is_admin and user.id != project.creator_id and user.id not in (project.team_member_ids or []):
+    if not can_access_project(project, user):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="이 프로젝트에 접근 권한이 없습니다")
     return project
 
 
-def _accessible_project_ids(db: Session, user: User):
-    all_projects = db.query(Project).all()
-    return [
-        p.id for p in all_projects
-        if user.is_admin or p.creator_id == user.id or user.id in (p.team_member_ids or [])
-    ]
-
-
 @router.get("/", response_model=List[PatchResponse])
 async def list_patches(
     project_id: Optional[str] = Query(None, description="프로젝트 ID"),
@@ -44,14 +37,10 @@ async def list_patches(
 ):
     if site_name:
         # 사이트명으로 전체 접근 가능 프로젝트의 패치 조회
-        accessible = set(_accessible_project_ids(db, current_user))
-        patches = (
-            db.query(ProjectPatch)
-            .filter(ProjectPatch.site == site_name)
-            .order_by(ProjectPatch.patch_date.desc(), ProjectPatch.created_at.desc())
-            .all()
-        )
-        return [p for p in patches if p.project_id in accessible]
+        query = db.query(ProjectPatch).filter(ProjectPatch.site == site_name)
+        if not current_user.is_admin:
+            query = query.filter(ProjectPatch.project_id.in_(accessible_project_ids_query(current_user)))
+        return query.order_by(ProjectPatch.patch_date.desc(), ProjectPatch.created_at.desc()).all()
 
     if not project_id:
         raise HTTPException(status_code=400, detail="project_id 또는 site_name이 필요합니다")
@@ -11,7 +11,9 @@ from app.models.project import Project
 from app.models.user import User
 from app.models.workspace import WorkspaceMember
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.utils.access import can_access_project, invalidate_project_access, project_access_clause
 from app.utils.dependencies import get_current_user
+from app.utils.etag import ConditionalGet, row_version
 from app.utils.notifications import notify_project_member_added
 from app.routers.websocket import manager
 
@@ -37,6 +39,7 @@ async def get_all_projects(
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(100, ge=1, le=500, description="최대 항목 수"),
     workspace_id: Optional[str] = Query(None, description="워크스페이스 ID 필터"),
+    conditional: ConditionalGet = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -49,8 +52,7 @@ async def get_all_projects(
         query = db.query(Project).filter(
             or_(
                 Project.is_global == True,
-                Project.creator_id == current_user.id,
-                Project.team_member_ids.any(current_user.id),
+                project_access_clause(current_user),
             )
         )
 
@@ -63,7 +65,12 @@ async def get_all_projects(
             )
         )
 
-    projects = query.offset(skip).limit(limit).all()
+    query = query.order_by(Project.created_at, Project.id).offset(skip).limit(limit)
+    not_modified = conditional.check(row_version(query.with_entities(Project.id, Project.updated_at).all()))
+    if not_modified is not None:
+        return not_modified
+
+    projects = query.all()
     return projects
 
 
@@ -80,12 +87,11 @@ async def get_project(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="프로젝트를 찾을 수 없습니다"
         )
-    if not current_user.is_admin:
-        if current_user.id != project.creator_id and current_user.id not in (project.team_member_ids or []):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="이 프로젝트에 접근 권한이 없습니다"
-            )
+    if not can_access_project(project, current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 프로젝트에 접근 권한이 없습니다"
+        )
     return project
 
 
@@ -116,6 +122,7 @@ async def create_project(
     db.add(new_project)
     db.commit()
     db.refresh(new_project)
+    invalidate_project_access()
 
     asyncio.create_task(manager.broadcast({
         "type": "project_created",
@@ -146,7 +153,9 @@ async def update_project(
             detail="프로젝트 PM 또는 관리자만 수정할 수 있습니다"
         )
 
+    changed_member_ids = set()
     if project_data.team_member_ids is not None:
+        changed_member_ids = set(project.team_member_ids or []) ^ set(project_data.team_member_ids)
         project.team_member_ids = project_data.team_member_ids
     if project_data.name is not None:
         project.name = project_data.name
@@ -164,6 +173,8 @@ async def update_project(
 
     db.commit()
     db.refresh(project)
+    if changed_member_ids:
+        invalidate_project_access(changed_member_ids)
 
     asyncio.create_task(manager.broadcast({
         "type": "project_updated",
@@ -195,6 +206,7 @@ async def delete_project(
 
     db.delete(project)
     db.commit()
+    invalidate_project_access()
     return {"message": "프로젝트가 삭제되었습니다"}
 
 
@@ -294,6 +306,7 @@ async def add_team_member(
         project.team_member_ids = list(project.team_member_ids) + [user_id]
         db.commit()
         db.refresh(project)
+        invalidate_project_access([user_id])
 
         notify_project_member_added(db, project, user_id, current_user)
 
@@ -330,5 +343,6 @@ async def remove_team_member(
         project.team_member_ids = [uid for uid in project.team_member_ids if uid != user_id]
         db.commit()
         db.refresh(project)
+        invalidate_project_access([user_id])
 
     return project
@@ -3,15 +3,19 @@ request-issue 앱 연동 API 라우터
 외부 앱에서 Sync에 태스크(이슈)를 등록하기 위한 엔드포인트
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import uuid
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models.task import Task, TaskStatus, TaskPriority
 from app.models.user import User
 from app.models.project import Project
 from app.models.workspace import Workspace, WorkspaceMember
+from app.routers.tasks import apply_bulk_task_updates
+from app.schemas.task import TaskBulkUpdateRequest
+from app.utils.activity import record_task_activity
 from app.utils.dependencies import get_user_by_api_token
 from app.utils.notifications import notify_task_created
 from pydantic import BaseModel
@@ -109,11 +113,10 @@ async def create_issue(
             detail_image_urls=[],
             document_links=[],
             site_tags=[],
-            status_history=[],
-            assignment_history=[],
-            priority_history=[],
         )
         db.add(new_task)
+        db.flush()
+        db.execute(record_task_activity(new_task.project_id, current_user.id, new_task.id))
         db.commit()
         db.refresh(new_task)
     except Exception:
@@ -128,6 +131,17 @@ async def create_issue(
     return {"id": new_task.id, "title": new_task.title, "url": ""}
 
 
+@router.post("/issues/bulk")
+async def bulk_update_issues(
+    request: TaskBulkUpdateRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_user_by_api_token),
+):
+    """이슈(태스크) 일괄 수정 — POST /api/tasks/bulk 와 같은 규칙 (전부 적용되거나 전부 취소)"""
+    tasks = await apply_bulk_task_updates(db, request.updates, current_user)
+    return {"updated": [{"id": t.id, "title": t.title, "status": t.status.value} for t in tasks]}
+
+
 @router.get("/workspaces")
 async def get_workspaces(
     db: Session = Depends(get_db),
@@ -3,16 +3,23 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import get_async_db
+from app.models.chat import ChatMessage, ChatRoom
 from app.models.comment import Comment
+from app.models.meeting_minutes import MeetingMinutes
 from app.models.project import Project
 from app.models.task import Task
 from app.models.user import User
+from app.models.workspace import WorkspaceMember
 from app.schemas.search import SearchResponse
+from app.utils.access import project_access_clause
 from app.utils.dependencies import get_current_user
+from app.utils.pagination import TOTAL_NONE, apply_keyset, count_rows, split_page
+from app.utils.search_index import build_snippet, query_terms, search_match, search_rank
+from app.utils.task_history import attach_task_history
 
 router = APIRouter()
 
@@ -24,6 +31,26 @@ TASK_SORT_COLUMNS = {
 }
 
 
+def _snippet(field: str, content: Optional[str], terms):
+    snippet = build_snippet(content, terms)
+    if snippet is None:
+        return None
+    return {"field": field, **snippet}
+
+
+def _task_snippets(tasks, terms) -> dict:
+    snippets = {}
+    for task in tasks:
+        snippet = (
+            _snippet("title", task.title, terms)
+            or _snippet("description", task.description, terms)
+            or _snippet("detail", task.detail, terms)
+        )
+        if snippet:
+            snippets[task.id] = snippet
+    return snippets
+
+
 @router.get("/", response_model=SearchResponse)
 async def search(
     q: str = Query(..., min_length=1),
@@ -31,84 +58,194 @@ async def search(
     project_id: Optional[str] = Query(None),
     task_status: Optional[str] = Query(None, description="태스크 상태 필터 (예: backlog, in_progress)"),
     task_priority: Optional[str] = Query(None, description="태스크 우선순위 필터 (예: high, medium)"),
-    sort_by: Optional[str] = Query("updated_at", description="정렬 기준 (updated_at, created_at, title)"),
+    sort_by: Optional[str] = Query("relevance", description="정렬 기준 (relevance, updated_at, created_at, title)"),
     sort_order: Optional[str] = Query("desc", description="정렬 방향 (asc, desc)"),
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(30, ge=1, le=100, description="가져올 항목 수"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="태스크 커서 페이지네이션 (첫 페이지는 빈 값, 이후 next_cursor)"),
+    total: Optional[str] = Query(None, description="커서 모드의 task_total 계산 방식 (exact, approx, none)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    like_query = f"%{q}%"
+    terms = query_terms(q)
+    if not terms:
+        return SearchResponse(query=q, tasks=[], comments=[])
 
-    task_query = db.query(Task).join(Project, Project.id == Task.project_id)
-    if project_id:
-        task_query = task_query.filter(Task.project_id == project_id)
-    if workspace_id:
-        task_query = task_query.filter(Project.workspace_id == workspace_id)
+    is_privileged = current_user.is_admin or current_user.is_pm
 
-    if not current_user.is_admin and not current_user.is_pm:
-        task_query = task_query.filter(Project.team_member_ids.any(current_user.id))
-
-    task_query = task_query.filter(
-        or_(
-            Task.title.ilike(like_query),
-            Task.description.ilike(like_query),
-            Task.detail.ilike(like_query),
-        )
+    # ── 태스크 ──
+    task_query = (
+        select(Task)
+        .join(Project, Project.id == Task.project_id)
+        .where(search_match("tasks", q))
     )
+    if project_id:
+        task_query = task_query.where(Task.project_id == project_id)
+    if workspace_id:
+        task_query = task_query.where(Project.workspace_id == workspace_id)
+    if not is_privileged:
+        task_query = task_query.where(project_access_clause(current_user))
 
     # 상태/우선순위 필터
     if task_status:
-        task_query = task_query.filter(Task.status == task_status)
+        task_query = task_query.where(Task.status == task_status)
     if task_priority:
-        task_query = task_query.filter(Task.priority == task_priority)
+        task_query = task_query.where(Task.priority == task_priority)
 
-    # 정렬
+    task_rank = search_rank("tasks", q)
+    by_relevance = sort_by == "relevance" or sort_by not in TASK_SORT_COLUMNS
     sort_col = TASK_SORT_COLUMNS.get(sort_by, Task.updated_at)
-    if sort_order == "asc":
-        task_query = task_query.order_by(sort_col.asc())
+    next_cursor = None
+
+    if cursor is not None:
+        # 커서 모드: 정렬 키 + id 키셋, 건수는 total 파라미터로 선택
+        if by_relevance:
+            order = [(task_rank, True), (Task.updated_at, True), (Task.id, True)]
+
+            def cursor_key(row):
+                return [row.rank, row[0].updated_at, row[0].id]
+        else:
+            descending = sort_order != "asc"
+            order = [(sort_col, descending), (Task.id, descending)]
+
+            def cursor_key(row):
+                return [getattr(row[0], sort_col.key), row[0].id]
+
+        rows = (await db.execute(
+            apply_keyset(task_query.add_columns(task_rank.label("rank")), order, cursor).limit(limit + 1)
+        )).all()
+        task_rows, next_cursor = split_page(rows, limit, key=cursor_key)
+        tasks = [row[0] for row in task_rows]
+        task_total = await count_rows(db, task_query, total or TOTAL_NONE)
+        has_more = next_cursor is not None
     else:
-        task_query = task_query.order_by(sort_col.desc())
-
-    task_total = task_query.count()
-    tasks = task_query.offset(skip).limit(limit).all()
+        # 전체 건수는 window 함수로 같은 쿼리에서 계산 (별도 count 쿼리 없음)
+        paged_query = task_query.add_columns(task_rank.label("rank"), func.count().over().label("total"))
+        if by_relevance:
+            paged_query = paged_query.order_by(task_rank.desc(), Task.updated_at.desc())
+        else:
+            paged_query = paged_query.order_by(sort_col.asc() if sort_order == "asc" else sort_col.desc())
+
+        task_rows = (await db.execute(paged_query.offset(skip).limit(limit))).all()
+        tasks = [row[0] for row in task_rows]
+        if task_rows:
+            task_total = task_rows[0].total
+        elif skip:
+            # 마지막 페이지를 넘긴 경우에만 건수를 따로 센다
+            task_total = await count_rows(db, task_query)
+        else:
+            task_total = 0
+        has_more = task_total > (skip + limit)
+
+    await attach_task_history(db, tasks)
+
+    if cursor:
+        # 커서로 이어 받는 페이지는 태스크만 — 댓글/회의록/채팅은 첫 페이지의 상위 결과로 제공
+        return SearchResponse(
+            query=q,
+            tasks=tasks,
+            comments=[],
+            snippets=_task_snippets(tasks, terms),
+            task_total=task_total,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
 
-    task_ids = [t.id for t in tasks]
-    comment_query = db.query(Comment).join(Task, Task.id == Comment.task_id).join(
-        Project, Project.id == Task.project_id
+    # ── 댓글 ──
+    comment_query = (
+        select(Comment)
+        .join(Task, Task.id == Comment.task_id)
+        .join(Project, Project.id == Task.project_id)
+        .where(search_match("comments", q))
     )
     if project_id:
-        comment_query = comment_query.filter(Task.project_id == project_id)
+        comment_query = comment_query.where(Task.project_id == project_id)
     if workspace_id:
-        comment_query = comment_query.filter(Project.workspace_id == workspace_id)
-
-    if not current_user.is_admin and not current_user.is_pm:
-        comment_query = comment_query.filter(Project.team_member_ids.any(current_user.id))
+        comment_query = comment_query.where(Project.workspace_id == workspace_id)
+    if not is_privileged:
+        comment_query = comment_query.where(project_access_clause(current_user))
 
-    comments = (
-        comment_query.filter(Comment.content.ilike(like_query))
-        .order_by(Comment.created_at.desc())
+    comments = list((await db.scalars(
+        comment_query
+        .order_by(search_rank("comments", q).desc(), Comment.created_at.desc())
         .offset(skip)
         .limit(limit)
-        .all()
-    )
+    )).all())
 
     # include comments on searched tasks for context if no direct match is enough
+    task_ids = [t.id for t in tasks]
     if len(comments) < limit and task_ids:
-        more_comments = (
-            db.query(Comment)
-            .filter(Comment.task_id.in_(task_ids))
+        more_comments = (await db.scalars(
+            select(Comment)
+            .where(Comment.task_id.in_(task_ids))
             .order_by(Comment.created_at.desc())
             .limit(limit - len(comments))
-            .all()
-        )
+        )).all()
         existing_ids = {c.id for c in comments}
         comments.extend([c for c in more_comments if c.id not in existing_ids])
 
+    # ── 회의록 ── (워크스페이스 단위 문서라 프로젝트 필터가 있으면 제외)
+    minutes = []
+    if not project_id:
+        minutes_query = select(MeetingMinutes).where(search_match("meeting_minutes", q))
+        if workspace_id:
+            minutes_query = minutes_query.where(MeetingMinutes.workspace_id == workspace_id)
+        if not current_user.is_admin:
+            minutes_query = minutes_query.where(
+                MeetingMinutes.workspace_id.in_(
+                    select(WorkspaceMember.workspace_id).where(WorkspaceMember.user_id == current_user.id)
+                )
+            )
+        minutes = (await db.scalars(
+            minutes_query
+            .order_by(search_rank("meeting_minutes", q).desc(), MeetingMinutes.meeting_date.desc())
+            .offset(skip)
+            .limit(limit)
+        )).all()
+
+    # ── 채팅 ── 관리자라도 본인이 참여한 방의 메시지만
+    chat_query = (
+        select(ChatMessage)
+        .join(ChatRoom, ChatRoom.id == ChatMessage.room_id)
+        .where(
+            search_match("chat_messages", q),
+            ChatRoom.member_ids.any(current_user.id),
+        )
+    )
+    if project_id:
+        chat_query = chat_query.where(ChatRoom.project_id == project_id)
+    if workspace_id:
+        chat_query = chat_query.where(ChatRoom.workspace_id == workspace_id)
+    chat_messages = (await db.scalars(
+        chat_query
+        .order_by(search_rank("chat_messages", q).desc(), ChatMessage.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )).all()
+
+    # ── 하이라이트 스니펫 ──
+    snippets = _task_snippets(tasks, terms)
+    for item in comments:
+        snippet = _snippet("content", item.content, terms)
+        if snippet:
+            snippets[item.id] = snippet
+    for item in minutes:
+        snippet = _snippet("title", item.title, terms) or _snippet("content", item.content, terms)
+        if snippet:
+            snippets[item.id] = snippet
+    for item in chat_messages:
+        snippet = _snippet("content", item.content, terms)
+        if snippet:
+            snippets[item.id] = snippet
+
     return SearchResponse(
         query=q,
         tasks=tasks,
         comments=comments,
+        meeting_minutes=minutes,
+        chat_messages=chat_messages,
+        snippets=snippets,
         task_total=task_total,
-        has_more=task_total > (skip + limit),
+        has_more=has_more,
+        next_cursor=next_cursor,
     )
@@ -4,6 +4,8 @@ import uuid
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import cast
+from sqlalchemy.dialects.postgresql import JSONB, array
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -14,57 +16,44 @@ from app.models.task import Task
 from app.models.user import User
 from app.models.project import Project
 from app.schemas.site_detail import SiteDetailCreate, SiteDetailResponse, SiteDetailUpdate
+from app.utils.access import accessible_project_ids, can_access_project
 from app.utils.dependencies import get_current_user
+from app.utils.etag import ConditionalGet, row_version
 
 router = APIRouter()
 
 
-def _can_access_project(project: Project, current_user: User) -> bool:
-    """유저가 해당 프로젝트에 접근 가능한지 확인 (관리자 OR 팀원 OR 생성자)."""
-    if current_user.is_admin:
-        return True
-    if project.creator_id == current_user.id:
-        return True
-    return current_user.id in (project.team_member_ids or [])
-
-
 def _get_project_or_403(db: Session, project_id: str, current_user: User) -> Project:
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
-    if not _can_access_project(project, current_user):
+    if not can_access_project(project, current_user):
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
     return project
 
 
-def _accessible_project_ids(db: Session, current_user: User) -> List[str]:
-    """현재 유저가 접근 가능한 모든 프로젝트 ID 반환."""
-    all_projects = db.query(Project).all()
-    return [
-        p.id for p in all_projects
-        if _can_access_project(p, current_user)
-    ]
-
-
 @router.get("/", response_model=List[SiteDetailResponse])
 async def list_site_details(
     project_id: Optional[str] = Query(None, description="프로젝트 ID (미입력 시 전체)"),
+    conditional: ConditionalGet = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    accessible_ids = set(_accessible_project_ids(db, current_user))
-    all_sites = (
-        db.query(SiteDetail)
-        .order_by(SiteDetail.name.asc(), SiteDetail.created_at.asc())
-        .all()
-    )
+    query = db.query(SiteDetail)
     # 접근 가능한 프로젝트와 연결된 사이트만 반환
     if project_id:
         _get_project_or_403(db, project_id, current_user)
-        sites = [s for s in all_sites if project_id in (s.project_ids or [])]
-    else:
-        sites = [s for s in all_sites if any(pid in accessible_ids for pid in (s.project_ids or []))]
-    return sites
+        query = query.filter(cast(SiteDetail.project_ids, JSONB).op("?")(project_id))
+    elif not current_user.is_admin:
+        accessible_ids = accessible_project_ids(db, current_user)
+        if not accessible_ids:
+            return []
+        query = query.filter(cast(SiteDetail.project_ids, JSONB).op("?|")(array(list(accessible_ids))))
+    query = query.order_by(SiteDetail.name.asc(), SiteDetail.created_at.asc(), SiteDetail.id)
+    not_modified = conditional.check(row_version(query.with_entities(SiteDetail.id, SiteDetail.updated_at).all()))
+    if not_modified is not None:
+        return not_modified
+    return query.all()
 
 
 @router.post("/", response_model=SiteDetailResponse, status_code=status.HTTP_201_CREATED)
@@ -128,7 +117,7 @@ async def update_site_detail(
     if not site:
         raise HTTPException(status_code=404, detail="사이트를 찾을 수 없습니다.")
     # 연결된 프로젝트 중 하나라도 접근 가능하면 편집 허용
-    accessible_ids = set(_accessible_project_ids(db, current_user))
+    accessible_ids = accessible_project_ids(db, current_user)
     if not any(pid in accessible_ids for pid in (site.project_ids or [])):
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
 
@@ -159,7 +148,7 @@ async def delete_site_detail(
     site = db.query(SiteDetail).filter(SiteDetail.id == site_id).first()
     if not site:
         raise HTTPException(status_code=404, detail="사이트를 찾을 수 없습니다.")
-    accessible_ids = set(_accessible_project_ids(db, current_user))
+    accessible_ids = accessible_project_ids(db, current_user)
     if not any(pid in accessible_ids for pid in (site.project_ids or [])):
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
     site_name = site.name
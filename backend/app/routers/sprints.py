@@ -14,6 +14,7 @@ from app.models.task import Task
 from app.models.user import User
 from app.routers.websocket import manager
 from app.schemas.sprint import SprintCreate, SprintResponse, SprintUpdate
+from app.utils.access import accessible_project_ids_query, sees_all_projects
 from app.utils.dependencies import get_current_user
 
 router = APIRouter()
@@ -87,16 +88,10 @@ async def get_sprints(
     query = db.query(Sprint)
     if project_id:
         query = query.filter(Sprint.project_id == project_id)
+    if not sees_all_projects(current_user, pm_sees_all=True):
+        query = query.filter(Sprint.project_id.in_(accessible_project_ids_query(current_user)))
 
-    sprints = query.order_by(Sprint.created_at.desc()).all()
-    if current_user.is_admin or current_user.is_pm:
-        return sprints
-
-    visible_project_ids = {
-        p.id
-        for p in db.query(Project).filter(Project.team_member_ids.any(current_user.id)).all()
-    }
-    return [s for s in sprints if s.project_id in visible_project_ids]
+    return query.order_by(Sprint.created_at.desc()).all()
 
 
 @router.post("/", response_model=SprintResponse, status_code=status.HTTP_201_CREATED)
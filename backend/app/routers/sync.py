@@ -0,0 +1,106 @@
+"""Delta sync API router.
+
+클라이언트는 처음 전체 목록을 받은 직후 since 없이 호출해 시작 커서를 받아 두고,
+이후(재연결, task_updated 등 WebSocket 이벤트 수신 시) GET /api/sync/?since=<cursor> 로
+그 사이 바뀐 태스크/댓글/체크리스트/스프린트와 삭제 목록만 받아 반영한다.
+"""
+
+from collections import defaultdict
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models.change_log import ChangeLog
+from app.models.checklist import Checklist, ChecklistItem
+from app.models.comment import Comment
+from app.models.sprint import Sprint
+from app.models.task import Task
+from app.models.user import User
+from app.routers.checklists import _build_checklist_response
+from app.routers.comments import _attach_comment_reactions
+from app.schemas.sync import SyncDeleted, SyncResponse
+from app.utils.access import accessible_project_ids_query, sees_all_projects
+from app.utils.change_log import CHECKLIST, COMMENT, DELETE, SPRINT, TASK, sync_horizon
+from app.utils.dependencies import get_current_user
+from app.utils.pagination import apply_keyset, decode_cursor, encode_cursor, split_page
+from app.utils.task_history import attach_task_history
+
+router = APIRouter()
+
+SYNC_ORDER = [(ChangeLog.xid, False), (ChangeLog.seq, False)]
+
+
+async def _load_changed(db: AsyncSession, ids_by_entity: dict) -> dict:
+    """엔티티별 변경 id -> 현재 행. 읽는 사이 지워진 행은 빠지고 다음 동기화에서 톰스톤으로 온다"""
+    result = {}
+
+    task_ids = ids_by_entity.get(TASK)
+    tasks = (await db.scalars(select(Task).where(Task.id.in_(task_ids)))).all() if task_ids else []
+    await attach_task_history(db, tasks)
+    result["tasks"] = tasks
+
+    comment_ids = ids_by_entity.get(COMMENT)
+    comments = (await db.scalars(select(Comment).where(Comment.id.in_(comment_ids)))).all() if comment_ids else []
+    await _attach_comment_reactions(db, comments)
+    result["comments"] = comments
+
+    checklist_ids = ids_by_entity.get(CHECKLIST)
+    checklists = []
+    if checklist_ids:
+        checklist_rows = (await db.scalars(select(Checklist).where(Checklist.id.in_(checklist_ids)))).all()
+        items_by_checklist = defaultdict(list)
+        for item in (await db.scalars(
+            select(ChecklistItem)
+            .where(ChecklistItem.checklist_id.in_(checklist_ids))
+            .order_by(ChecklistItem.display_order, ChecklistItem.created_at)
+        )).all():
+            items_by_checklist[item.checklist_id].append(item)
+        checklists = [_build_checklist_response(c, items_by_checklist[c.id]) for c in checklist_rows]
+    result["checklists"] = checklists
+
+    sprint_ids = ids_by_entity.get(SPRINT)
+    result["sprints"] = (await db.scalars(select(Sprint).where(Sprint.id.in_(sprint_ids)))).all() if sprint_ids else []
+    return result
+
+
+@router.get("/", response_model=SyncResponse)
+async def get_changes(
+    since: Optional[str] = Query(None, description="이전 응답의 cursor. 없으면 현재 시점 커서만 반환"),
+    limit: int = Query(500, ge=1, le=2000, description="한 번에 받을 최대 변경 수"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """since 커서 이후 변경된 태스크/댓글/체크리스트/스프린트와 삭제 목록 (접근 가능한 프로젝트만)"""
+    horizon = await sync_horizon(db)
+    start = [horizon, 0]
+    if not since:
+        return SyncResponse(cursor=encode_cursor(start))
+    since_values = decode_cursor(since, len(SYNC_ORDER))
+
+    query = select(ChangeLog).where(ChangeLog.xid < horizon)
+    # GET /api/tasks, /api/sprints 전체 목록과 같은 규칙 (PM 은 모든 프로젝트) — 다르면 PM 의 델타가 빠진다
+    if not sees_all_projects(current_user, pm_sees_all=True):
+        query = query.where(ChangeLog.project_id.in_(accessible_project_ids_query(current_user)))
+    query = apply_keyset(query, SYNC_ORDER, since)
+    rows = (await db.scalars(query.limit(limit + 1))).all()
+    changes, next_cursor = split_page(rows, limit, SYNC_ORDER)
+
+    ids_by_entity = defaultdict(list)
+    deleted = []
+    for change in changes:
+        if change.op == DELETE:
+            deleted.append(SyncDeleted(entity=change.entity, id=change.entity_id))
+        else:
+            ids_by_entity[change.entity].append(change.entity_id)
+    loaded = await _load_changed(db, ids_by_entity)
+
+    return SyncResponse(
+        # 끝까지 읽었으면 horizon 부터 이어 받는다 (그 사이 끝난 트랜잭션이 없으면 since 유지)
+        cursor=next_cursor or encode_cursor(max(start, since_values)),
+        has_more=next_cursor is not None,
+        deleted=deleted,
+        **loaded,
+    )
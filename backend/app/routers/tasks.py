@@ -1,31 +1,44 @@
 """
 태스크 관리 API 라우터
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 import uuid
 import asyncio
 from datetime import datetime, timezone
-from app.database import get_db
+from app.database import get_async_db
 from app.models.task import Task, TaskStatus, TaskPriority
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskReorderRequest
+from app.schemas.task import TaskBulkUpdateRequest, TaskCreate, TaskUpdate, TaskResponse, TaskReorderRequest
+from app.utils.access import accessible_project_ids_query, can_access_project, sees_all_projects
+from app.utils.activity import record_task_activity
 from app.utils.dependencies import get_current_user
+from app.utils.etag import ConditionalGet, row_version
+from app.utils.ordering import plan_reorder
+from app.utils.pagination import TOTAL_NONE, apply_keyset, count_rows, split_page
+from app.utils.task_history import ASSIGNMENT, PRIORITY, STATUS, attach_task_history, task_event
 from app.models.project import Project
 from app.models.workspace import Workspace
 from app.models.notification import Notification
 from app.models.comment import Comment
-from app.utils.notifications import notify_task_assigned, notify_task_option_changed, notify_task_created, notify_task_document_added
-from sqlalchemy import or_
+from app.utils.notifications import (
+    notify_task_assigned_many,
+    notify_task_created,
+    notify_task_document_added,
+    notify_task_option_changed,
+    notify_tasks_bulk_updated,
+)
+from sqlalchemy import Integer, String, column, delete, or_, select, update, values
+from sqlalchemy.orm.attributes import set_committed_value
 from app.routers.websocket import manager
 
 router = APIRouter()
 
 
-def _get_project_or_403(db: Session, project_id: str, user: User) -> Project:
+async def _get_project_or_403(db: AsyncSession, project_id: str, user: User) -> Project:
     """프로젝트 조회 + 접근 권한 검증 (admin 또는 프로젝트 멤버만)"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로젝트를 찾을 수 없습니다")
     if not user.is_admin and user.id != project.creator_id and user.id not in (project.team_member_ids or []):
@@ -33,69 +46,220 @@ def _get_project_or_403(db: Session, project_id: str, user: User) -> Project:
     return project
 
 
+def _added_member_ids(task: Task, task_data: TaskUpdate) -> List[str]:
+    if task_data.assigned_member_ids is None:
+        return []
+    old_member_ids = set(task.assigned_member_ids or [])
+    return [uid for uid in dict.fromkeys(task_data.assigned_member_ids) if uid not in old_member_ids]
+
+
+async def _usernames(db: AsyncSession, user_ids) -> dict:
+    user_ids = list(user_ids)
+    if not user_ids:
+        return {}
+    return dict((await db.execute(select(User.id, User.username).where(User.id.in_(user_ids)))).all())
+
+
+def _apply_task_update(task: Task, task_data: TaskUpdate, current_user: User, username_by_id: dict) -> dict:
+    """task_data 의 값이 있는 필드만 task 에 반영 (DB I/O 없음).
+
+    반환: changed_fields/transitions (옵션 변경 알림용), added_member_ids, doc_title,
+    events (task_events 로 넣을 이력), completed (done 으로 바뀌었는지)
+    """
+    # 변경된 필드 추적 (알림 문구에 이전→이후 값 포함)
+    changed_fields = []
+    changes_detail: dict = {}
+    events = []
+    completed = False
+    doc_title = None
+    added_members = []
+
+    # 업데이트할 필드만 변경
+    if task_data.title is not None:
+        task.title = task_data.title
+    if task_data.description is not None:
+        task.description = task_data.description
+    if task_data.status is not None:
+        # 상태 변경 히스토리 추가
+        old_status = task.status
+        if old_status != task_data.status:
+            changed_fields.append('status')
+            changes_detail['status'] = (old_status.value, task_data.status.value)
+            history_entry = {
+                "fromStatus": old_status.value,
+                "toStatus": task_data.status.value,
+                "userId": current_user.id,
+                "username": current_user.username,
+                "changedAt": datetime.now(timezone.utc).isoformat()
+            }
+            events.append(task_event(task.id, STATUS, current_user.id, history_entry))
+            completed = task_data.status == TaskStatus.DONE
+        task.status = task_data.status
+    if task_data.start_date is not None:
+        old_start = task.start_date.date() if task.start_date else None
+        new_start = task_data.start_date.date() if task_data.start_date else None
+        if old_start != new_start:
+            changed_fields.append('start_date')
+            changes_detail['start_date'] = (task.start_date, task_data.start_date)
+        task.start_date = task_data.start_date
+    if task_data.end_date is not None:
+        old_end = task.end_date.date() if task.end_date else None
+        new_end = task_data.end_date.date() if task_data.end_date else None
+        if old_end != new_end:
+            changed_fields.append('end_date')
+            changes_detail['end_date'] = (task.end_date, task_data.end_date)
+        task.end_date = task_data.end_date
+    if task_data.detail is not None:
+        task.detail = task_data.detail
+    if task_data.detail_image_urls is not None:
+        task.detail_image_urls = task_data.detail_image_urls
+    if task_data.document_links is not None:
+        old_doc_count = len(task.document_links or [])
+        new_docs = task_data.document_links
+        task.document_links = new_docs
+        if len(new_docs) > old_doc_count:
+            added_doc = new_docs[-1]
+            doc_title = added_doc.get('title', '문서') if isinstance(added_doc, dict) else '문서'
+    if task_data.priority is not None:
+        # 중요도 변경 히스토리 추가
+        old_priority = task.priority
+        if old_priority != task_data.priority:
+            changed_fields.append('priority')
+            changes_detail['priority'] = (old_priority.value, task_data.priority.value)
+            history_entry = {
+                "fromPriority": old_priority.value,
+                "toPriority": task_data.priority.value,
+                "userId": current_user.id,
+                "username": current_user.username,
+                "changedAt": datetime.now(timezone.utc).isoformat()
+            }
+            events.append(task_event(task.id, PRIORITY, current_user.id, history_entry))
+        task.priority = task_data.priority
+    if task_data.assigned_member_ids is not None:
+        # 새로 할당된 팀원들에 대해 할당 히스토리 추가
+        added_members = _added_member_ids(task, task_data)
+        for member_id in added_members:
+            history_entry = {
+                "assignedUserId": member_id,
+                "assignedUsername": username_by_id.get(member_id, "Unknown"),
+                "assignedBy": current_user.id,
+                "assignedByUsername": current_user.username,
+                "assignedAt": datetime.now(timezone.utc).isoformat()
+            }
+            events.append(task_event(task.id, ASSIGNMENT, current_user.id, history_entry))
+        task.assigned_member_ids = task_data.assigned_member_ids
+    if task_data.observer_ids is not None:
+        task.observer_ids = task_data.observer_ids
+    if task_data.sprint_id is not None:
+        task.sprint_id = task_data.sprint_id
+    if task_data.parent_task_id is not None:
+        task.parent_task_id = task_data.parent_task_id if task_data.parent_task_id != "" else None
+    if task_data.site_tags is not None:
+        task.site_tags = task_data.site_tags
+
+    return {
+        "changed_fields": changed_fields,
+        "transitions": changes_detail,
+        "added_member_ids": added_members,
+        "doc_title": doc_title,
+        "events": events,
+        "completed": completed,
+    }
+
+
 @router.get("/", response_model=List[TaskResponse])
 async def get_all_tasks(
+    response: Response,
     project_id: Optional[str] = None,
     status: Optional[TaskStatus] = None,
     source_meeting_minutes_id: Optional[str] = Query(None, description="회의록 ID로 필터 (해당 회의록에서 생성된 태스크만)"),
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(200, ge=1, le=1000, description="최대 항목 수"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="커서 페이지네이션 (첫 페이지는 빈 값, 다음 커서는 X-Next-Cursor 헤더)"),
+    total: Optional[str] = Query(None, description="X-Total-Count 헤더 계산 방식 (exact, approx, none)"),
+    include_history: bool = Query(True, description="상태/담당자/중요도 변경 이력 포함 여부"),
+    conditional: ConditionalGet = Depends(),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """태스크 가져오기 (일반 유저: 소속 프로젝트 태스크만)"""
-    query = db.query(Task)
+    query = select(Task)
 
     if project_id:
-        query = query.filter(Task.project_id == project_id)
+        query = query.where(Task.project_id == project_id)
     if status:
-        query = query.filter(Task.status == status)
+        query = query.where(Task.status == status)
     if source_meeting_minutes_id:
-        query = query.filter(Task.source_meeting_minutes_id == source_meeting_minutes_id)
+        query = query.where(Task.source_meeting_minutes_id == source_meeting_minutes_id)
 
     # 일반 유저는 소속 프로젝트의 태스크만 조회 (팀원이거나 프로젝트 생성자)
-    if not current_user.is_admin and not current_user.is_pm:
-        my_projects = db.query(Project.id).filter(
-            or_(
-                Project.team_member_ids.any(current_user.id),
-                Project.creator_id == current_user.id,
-            )
-        ).subquery()
-        query = query.filter(Task.project_id.in_(my_projects))
-
-    tasks = query.order_by(Task.display_order.asc(), Task.created_at.desc()).offset(skip).limit(limit).all()
+    if not sees_all_projects(current_user, pm_sees_all=True):
+        query = query.where(Task.project_id.in_(accessible_project_ids_query(current_user)))
+
+    total_count = None
+    if total and total != TOTAL_NONE:
+        total_count = await count_rows(db, query, total)
+        if total_count is not None:
+            response.headers["X-Total-Count"] = str(total_count)
+
+    if cursor is not None:
+        # 커서 모드: (display_order, created_at, id) 키셋
+        order = [(Task.display_order, False), (Task.created_at, True), (Task.id, False)]
+        page = apply_keyset(query, order, cursor).limit(limit + 1)
+    else:
+        page = query.order_by(Task.display_order.asc(), Task.created_at.desc(), Task.id).offset(skip).limit(limit)
+
+    # 같은 페이지의 (정렬 키, updated_at) 만 먼저 읽어 ETag 를 비교한다
+    keys = (await db.execute(
+        page.with_only_columns(Task.display_order, Task.created_at, Task.id, Task.updated_at)
+    )).all()
+    if cursor is not None:
+        keys, next_cursor = split_page(keys, limit, key=lambda row: row[:3])
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+    not_modified = conditional.check(row_version(keys), total_count)
+    if not_modified is not None:
+        return not_modified
+
+    tasks = (await db.scalars(select(Task).where(Task.id.in_([row.id for row in keys])))).all()
+    task_by_id = {t.id: t for t in tasks}
+    tasks = [task_by_id[row.id] for row in keys if row.id in task_by_id]
+
+    if include_history:
+        await attach_task_history(db, tasks)
     return tasks
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """특정 태스크 정보 가져오기"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="태스크를 찾을 수 없습니다"
         )
+    await attach_task_history(db, [task])
     return task
 
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_data: TaskCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """새 태스크 생성"""
-    project = _get_project_or_403(db, task_data.project_id, current_user)
+    project = await _get_project_or_403(db, task_data.project_id, current_user)
 
     # 워크스페이스 오너를 기본 참조자로 추가
     observer_ids = list(task_data.observer_ids or [])
     if project.workspace_id:
-        ws = db.query(Workspace).filter(Workspace.id == project.workspace_id).first()
+        ws = await db.get(Workspace, project.workspace_id)
         if ws and ws.owner_id and ws.owner_id not in observer_ids:
             observer_ids.append(ws.owner_id)
 
@@ -120,18 +284,17 @@ async def create_task(
             site_tags=task_data.site_tags or [],
             source_meeting_minutes_id=task_data.source_meeting_minutes_id,
             source_line_id=task_data.source_line_id,
-            comment_ids=[],
-            status_history=[],
-            assignment_history=[],
-            priority_history=[]
+            comment_ids=[]
         )
         db.add(new_task)
-        db.commit()
-        db.refresh(new_task)
+        await db.flush()
+        await db.execute(record_task_activity(new_task.project_id, current_user.id, new_task.id))
+        await db.commit()
+        await db.refresh(new_task)
     except Exception as e:
         import traceback
         print(f"[create_task] 태스크 생성 실패: {e}\n{traceback.format_exc()}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"태스크 생성에 실패했습니다: {str(e)}")
 
     # DB 커밋 성공 후 WebSocket 이벤트 전송
@@ -142,11 +305,11 @@ async def create_task(
 
     # 프로젝트 팀원에게 새 작업 알림 (실패해도 태스크 생성에 영향 없음)
     try:
-        notify_task_created(db, new_task, project, current_user)
+        await db.run_sync(notify_task_created, new_task, project, current_user)
     except Exception as e:
         print(f"[notify_task_created] 알림 생성 실패 (무시): {e}")
-        db.rollback()  # 실패한 알림 트랜잭션으로 오염된 세션 복구
-        db.refresh(new_task)  # 태스크 데이터 재로드
+        await db.rollback()  # 실패한 알림 트랜잭션으로 오염된 세션 복구
+        await db.refresh(new_task)  # 태스크 데이터 재로드
 
     return new_task
 
@@ -154,177 +317,234 @@ async def create_task(
 @router.patch("/reorder", response_model=List[TaskResponse])
 async def reorder_tasks(
     request: TaskReorderRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
-    """태스크 순서 변경 (task_ids 배열 순서대로 display_order 설정)"""
-    for index, task_id in enumerate(request.task_ids):
-        task = db.query(Task).filter(Task.id == task_id).first()
-        if task:
-            task.display_order = index
-    db.commit()
-
-    tasks = db.query(Task).filter(Task.id.in_(request.task_ids)).all()
+    """태스크 순서 변경 (task_ids 배열 순서대로 display_order 설정)
+
+    희소 정렬 키를 쓰므로 실제로 자리가 바뀐 카드만 UPDATE 한다 (app/utils/ordering.py).
+    """
+    task_ids = list(dict.fromkeys(request.task_ids))
+    query = select(Task).where(Task.id.in_(task_ids))
+    if not sees_all_projects(current_user, pm_sees_all=True):
+        query = query.where(Task.project_id.in_(accessible_project_ids_query(current_user)))
+    task_by_id = {t.id: t for t in (await db.scalars(query)).all()}
+    tasks = [task_by_id[task_id] for task_id in task_ids if task_id in task_by_id]
+
+    changes = plan_reorder([t.display_order for t in tasks])
+    if changes:
+        new_orders = values(
+            column("id", String), column("display_order", Integer), name="new_orders"
+        ).data([(tasks[i].id, order) for i, order in changes.items()])
+        try:
+            updated = (await db.execute(
+                update(Task)
+                .where(Task.id == new_orders.c.id)
+                .values(display_order=new_orders.c.display_order)
+                .returning(Task.id, Task.display_order, Task.updated_at)
+                .execution_options(synchronize_session=False)
+            )).all()
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="태스크 순서 변경에 실패했습니다")
+
+        # 응답용 인스턴스에 반영 (다시 조회하지 않음)
+        for task_id, display_order, updated_at in updated:
+            set_committed_value(task_by_id[task_id], "display_order", display_order)
+            set_committed_value(task_by_id[task_id], "updated_at", updated_at)
+
+        # 바뀐 위치만 프로젝트 팀원에게 전송
+        changed_by_project: dict = {}
+        for task_id, display_order, _ in updated:
+            changed_by_project.setdefault(task_by_id[task_id].project_id, []).append(
+                {"task_id": task_id, "display_order": display_order}
+            )
+        members_by_project = dict((await db.execute(
+            select(Project.id, Project.team_member_ids).where(Project.id.in_(list(changed_by_project)))
+        )).all())
+        for project_id, orders in changed_by_project.items():
+            asyncio.create_task(manager.send_to_users({
+                "type": "tasks_reordered",
+                "data": {"project_id": project_id, "orders": orders}
+            }, members_by_project.get(project_id) or [], exclude_user_id=current_user.id))
+
+    await attach_task_history(db, tasks)
     return tasks
 
 
+async def apply_bulk_task_updates(db: AsyncSession, updates, current_user: User) -> List[Task]:
+    """여러 태스크 수정을 한 트랜잭션으로 적용 (POST /tasks/bulk, /api/ri/issues/bulk 공용)
+
+    - 태스크/프로젝트/담당자 이름은 각각 한 번의 쿼리로 조회, COMMIT 1회
+    - 하나라도 없거나 권한이 없으면 아무것도 바꾸지 않는다
+    - 알림은 수신자별로 합쳐 한 번에 생성, WebSocket 은 사용자마다 tasks_updated 1건
+    """
+    task_ids = list(dict.fromkeys(item.id for item in updates))
+    task_by_id = {t.id: t for t in (await db.scalars(select(Task).where(Task.id.in_(task_ids)))).all()}
+    missing = [task_id for task_id in task_ids if task_id not in task_by_id]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"태스크를 찾을 수 없습니다: {', '.join(missing[:10])}",
+        )
+    tasks = [task_by_id[task_id] for task_id in task_ids]
+
+    project_by_id = {p.id: p for p in (await db.scalars(
+        select(Project).where(Project.id.in_({t.project_id for t in tasks}))
+    )).all()}
+    for task in tasks:
+        project = project_by_id.get(task.project_id)
+        if not project:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로젝트를 찾을 수 없습니다")
+        if not can_access_project(project, current_user):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="이 프로젝트에 접근 권한이 없습니다")
+
+    username_by_id = await _usernames(db, {
+        uid for item in updates for uid in (item.assigned_member_ids or [])
+    })
+
+    changes = []
+    completed_ids = []
+    for item in updates:
+        task = task_by_id[item.id]
+        change = _apply_task_update(task, item, current_user, username_by_id)
+        db.add_all(change["events"])
+        if change["completed"]:
+            completed_ids.append(task.id)
+        changes.append({"task": task, **change})
+    for task_id in dict.fromkeys(completed_ids):
+        await db.execute(record_task_activity(task_by_id[task_id].project_id, current_user.id, task_id))
+
+    try:
+        await db.commit()
+        # updated_at 등 서버에서 정해진 값 — refresh 를 태스크마다 하지 않고 한 번에 다시 읽는다
+        (await db.scalars(
+            select(Task).where(Task.id.in_(task_ids)).execution_options(populate_existing=True)
+        )).all()
+    except Exception:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="태스크 일괄 수정에 실패했습니다")
+
+    # 알림 (실패해도 수정에는 영향 없음)
+    try:
+        await db.run_sync(notify_tasks_bulk_updated, changes, current_user)
+    except Exception as e:
+        print(f"[notify_tasks_bulk_updated] 알림 생성 실패 (무시): {e}")
+        await db.rollback()  # 실패한 알림 트랜잭션으로 오염된 세션 복구
+        # rollback 이 로드된 객체를 모두 만료시키므로 (수정은 이미 커밋됨) 태스크/프로젝트를 다시 읽는다
+        (await db.scalars(
+            select(Task).where(Task.id.in_(task_ids)).execution_options(populate_existing=True)
+        )).all()
+        (await db.scalars(
+            select(Project).where(Project.id.in_(list(project_by_id))).execution_options(populate_existing=True)
+        )).all()
+
+    # 사용자마다 볼 수 있는 프로젝트의 태스크만 묶어 1건씩
+    entries_by_user: dict = {}
+    for task in tasks:
+        entry = {"task_id": task.id, "project_id": task.project_id}
+        for uid in dict.fromkeys(project_by_id[task.project_id].team_member_ids or []):
+            if uid != current_user.id:
+                entries_by_user.setdefault(uid, []).append(entry)
+    users_by_payload: dict = {}
+    for uid, entries in entries_by_user.items():
+        key = tuple(e["task_id"] for e in entries)
+        users_by_payload.setdefault(key, (entries, []))[1].append(uid)
+    for entries, user_ids in users_by_payload.values():
+        asyncio.create_task(manager.send_to_users({
+            "type": "tasks_updated",
+            "data": {"tasks": entries}
+        }, user_ids))
+
+    await attach_task_history(db, tasks)
+    return tasks
+
+
+@router.post("/bulk", response_model=List[TaskResponse])
+async def bulk_update_tasks(
+    request: TaskBulkUpdateRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user)
+):
+    """태스크 일괄 수정 (다중 선택 상태 변경, 스프린트 이동, 담당자 변경 등)"""
+    return await apply_bulk_task_updates(db, request.updates, current_user)
+
+
 @router.patch("/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: str,
     task_data: TaskUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """태스크 정보 수정"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="태스크를 찾을 수 없습니다")
 
     # 프로젝트 접근 권한 검증
-    _get_project_or_403(db, task.project_id, current_user)
+    project = await _get_project_or_403(db, task.project_id, current_user)
     
-    # 변경된 필드 추적 (알림 문구에 이전→이후 값 포함)
-    changed_fields = []
-    changes_detail: dict = {}
+    # 새로 할당된 담당자 이름 (히스토리 기록용)
+    added_members = _added_member_ids(task, task_data)
+    username_by_id = await _usernames(db, added_members)
+
+    change = _apply_task_update(task, task_data, current_user, username_by_id)
+    db.add_all(change["events"])
+    if change["completed"]:
+        await db.execute(record_task_activity(task.project_id, current_user.id, task.id))
+
+    # 새로 추가된 문서가 있으면 알림
+    if change["doc_title"]:
+        try:
+            await db.run_sync(notify_task_document_added, task, current_user, change["doc_title"])
+        except Exception as e:
+            await db.rollback()
+            print(f"[notify_task_document_added] 알림 생성 실패 (무시): {e}")
+
+    # 작업 할당 알림 (추가된 담당자 일괄)
+    if change["added_member_ids"]:
+        await db.run_sync(notify_task_assigned_many, task, change["added_member_ids"], current_user)
 
-    # 업데이트할 필드만 변경
-    if task_data.title is not None:
-        task.title = task_data.title
-    if task_data.description is not None:
-        task.description = task_data.description
-    if task_data.status is not None:
-        # 상태 변경 히스토리 추가
-        old_status = task.status
-        if old_status != task_data.status:
-            changed_fields.append('status')
-            changes_detail['status'] = (old_status.value, task_data.status.value)
-            history_entry = {
-                "fromStatus": old_status.value,
-                "toStatus": task_data.status.value,
-                "userId": current_user.id,
-                "username": current_user.username,
-                "changedAt": datetime.now(timezone.utc).isoformat()
-            }
-            task.status_history = list(task.status_history) + [history_entry]
-        task.status = task_data.status
-    if task_data.start_date is not None:
-        old_start = task.start_date.date() if task.start_date else None
-        new_start = task_data.start_date.date() if task_data.start_date else None
-        if old_start != new_start:
-            changed_fields.append('start_date')
-            changes_detail['start_date'] = (task.start_date, task_data.start_date)
-        task.start_date = task_data.start_date
-    if task_data.end_date is not None:
-        old_end = task.end_date.date() if task.end_date else None
-        new_end = task_data.end_date.date() if task_data.end_date else None
-        if old_end != new_end:
-            changed_fields.append('end_date')
-            changes_detail['end_date'] = (task.end_date, task_data.end_date)
-        task.end_date = task_data.end_date
-    if task_data.detail is not None:
-        task.detail = task_data.detail
-    if task_data.detail_image_urls is not None:
-        task.detail_image_urls = task_data.detail_image_urls
-    if task_data.document_links is not None:
-        old_doc_count = len(task.document_links or [])
-        new_docs = task_data.document_links
-        task.document_links = new_docs
-        # 새로 추가된 문서가 있으면 알림
-        if len(new_docs) > old_doc_count:
-            added_doc = new_docs[-1]
-            doc_title = added_doc.get('title', '문서') if isinstance(added_doc, dict) else '문서'
-            try:
-                notify_task_document_added(db, task, current_user, doc_title)
-            except Exception as e:
-                db.rollback()
-                print(f"[notify_task_document_added] 알림 생성 실패 (무시): {e}")
-    if task_data.priority is not None:
-        # 중요도 변경 히스토리 추가
-        old_priority = task.priority
-        if old_priority != task_data.priority:
-            changed_fields.append('priority')
-            changes_detail['priority'] = (old_priority.value, task_data.priority.value)
-            history_entry = {
-                "fromPriority": old_priority.value,
-                "toPriority": task_data.priority.value,
-                "userId": current_user.id,
-                "username": current_user.username,
-                "changedAt": datetime.now(timezone.utc).isoformat()
-            }
-            task.priority_history = list(task.priority_history) + [history_entry]
-        task.priority = task_data.priority
-    if task_data.assigned_member_ids is not None:
-        # 할당 변경 히스토리 추가
-        old_member_ids = set(task.assigned_member_ids or [])
-        new_member_ids = set(task_data.assigned_member_ids or [])
-        
-        # 새로 할당된 팀원들에 대해 히스토리 추가 및 알림
-        added_members = new_member_ids - old_member_ids
-        if added_members:
-            for member_id in added_members:
-                # 할당된 사용자 정보 가져오기
-                assigned_user = db.query(User).filter(User.id == member_id).first()
-                assigned_username = assigned_user.username if assigned_user else "Unknown"
-                
-                history_entry = {
-                    "assignedUserId": member_id,
-                    "assignedUsername": assigned_username,
-                    "assignedBy": current_user.id,
-                    "assignedByUsername": current_user.username,
-                    "assignedAt": datetime.now(timezone.utc).isoformat()
-                }
-                task.assignment_history = list(task.assignment_history) + [history_entry]
-                
-                # 작업 할당 알림
-                notify_task_assigned(db, task, member_id, current_user)
-        
-        task.assigned_member_ids = task_data.assigned_member_ids
-    if task_data.observer_ids is not None:
-        task.observer_ids = task_data.observer_ids
-    if task_data.sprint_id is not None:
-        task.sprint_id = task_data.sprint_id
-    if task_data.parent_task_id is not None:
-        task.parent_task_id = task_data.parent_task_id if task_data.parent_task_id != "" else None
-    if task_data.site_tags is not None:
-        task.site_tags = task_data.site_tags
-    
     # 작업 옵션 변경 알림 (중요도, 상태, 날짜 변경 시)
-    if changed_fields:
-        notify_task_option_changed(
-            db, task, current_user, changed_fields, transitions=changes_detail
+    if change["changed_fields"]:
+        await db.run_sync(
+            notify_task_option_changed, task, current_user, change["changed_fields"],
+            transitions=change["transitions"],
         )
     
     try:
-        db.commit()
-        db.refresh(task)
+        await db.commit()
+        await db.refresh(task)
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="태스크 수정에 실패했습니다")
 
-    # DB 커밋 성공 후 WebSocket 이벤트 전송
-    project = db.query(Project).filter(Project.id == task.project_id).first()
+    # DB 커밋 성공 후 WebSocket 이벤트 전송 (권한 검증 때 조회한 프로젝트 재사용)
     if project:
         asyncio.create_task(manager.send_to_users({
             "type": "task_updated",
             "data": {"task_id": task.id, "project_id": task.project_id}
         }, project.team_member_ids, exclude_user_id=current_user.id))
 
+    await attach_task_history(db, [task])
     return task
 
 
 @router.delete("/{task_id}")
 async def delete_task(
     task_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """태스크 삭제"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="태스크를 찾을 수 없습니다")
 
     # 프로젝트 접근 권한 검증 (PM, admin, 또는 태스크 생성자만 삭제 가능)
-    project = _get_project_or_403(db, task.project_id, current_user)
+    project = await _get_project_or_403(db, task.project_id, current_user)
     is_pm = project.creator_id == current_user.id
     is_task_creator = task.creator_id == current_user.id
     if not current_user.is_admin and not is_pm and not is_task_creator:
@@ -332,19 +552,23 @@ async def delete_task(
 
     try:
         # 관련 댓글 ID 조회
-        comment_ids = [c.id for c in db.query(Comment.id).filter(Comment.task_id == task_id).all()]
+        comment_ids = (await db.scalars(select(Comment.id).where(Comment.task_id == task_id))).all()
         # 관련 알림 삭제
         noti_filter = Notification.task_id == task_id
         if comment_ids:
             noti_filter = or_(noti_filter, Notification.comment_id.in_(comment_ids))
-        db.query(Notification).filter(noti_filter).delete(synchronize_session=False)
+        await db.execute(
+            delete(Notification).where(noti_filter).execution_options(synchronize_session=False)
+        )
         # 관련 댓글 삭제
-        db.query(Comment).filter(Comment.task_id == task_id).delete(synchronize_session=False)
+        await db.execute(
+            delete(Comment).where(Comment.task_id == task_id).execution_options(synchronize_session=False)
+        )
         # 태스크 삭제
-        db.delete(task)
-        db.commit()
+        await db.delete(task)
+        await db.commit()
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="태스크 삭제에 실패했습니다")
 
     return {"message": "태스크가 삭제되었습니다"}
@@ -354,11 +578,11 @@ async def delete_task(
 async def change_task_status(
     task_id: str,
     new_status: TaskStatus,  # FastAPI가 쿼리 파라미터로 자동 처리
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """태스크 상태 변경"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -374,20 +598,23 @@ async def change_task_status(
             "username": current_user.username,
             "changedAt": datetime.now(timezone.utc).isoformat()
         }
-        task.status_history = list(task.status_history) + [history_entry]
+        db.add(task_event(task.id, STATUS, current_user.id, history_entry))
         task.status = new_status
+        if new_status == TaskStatus.DONE:
+            await db.execute(record_task_activity(task.project_id, current_user.id, task.id))
 
         # 작업 옵션 변경 알림 (이전 상태 → 새 상태 문구 포함)
-        notify_task_option_changed(
-            db,
+        await db.run_sync(
+            notify_task_option_changed,
             task,
             current_user,
             ['status'],
             transitions={'status': (old_status.value, new_status.value)},
         )
 
-        db.commit()
-        db.refresh(task)
+        await db.commit()
+        await db.refresh(task)
 
+    await attach_task_history(db, [task])
     return task
 
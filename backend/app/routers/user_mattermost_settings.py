@@ -9,7 +9,8 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User
 from app.models.user_mattermost_setting import UserMattermostSetting
-from app.utils.dependencies import get_current_user
+from app.utils.dependencies import get_current_admin_user, get_current_user
+from app.utils.mattermost import dispatcher
 
 router = APIRouter()
 
@@ -76,3 +77,11 @@ async def delete_my_mattermost_setting(
     if rec:
         db.delete(rec)
         db.commit()
+
+
+@router.get("/metrics")
+async def get_mattermost_delivery_metrics(
+    _: User = Depends(get_current_admin_user),
+):
+    """웹훅 전송 큐 상태 (큐 깊이, 지연 시간, 실패/재시도 수) — 관리자 전용"""
+    return dispatcher.stats()
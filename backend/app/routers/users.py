@@ -9,6 +9,7 @@ from app.models.user import User
 from app.models.workspace import WorkspaceMember
 from app.schemas.user import UserResponse, UserUpdate
 from app.utils.dependencies import get_current_user, get_current_admin_user, get_current_admin_or_pm_user
+from app.utils.auth_cache import invalidate_user
 
 router = APIRouter()
 
@@ -69,10 +70,12 @@ async def set_favorite_projects(
     current_user: User = Depends(get_current_user),
 ):
     """현재 사용자의 즐겨찾기 프로젝트 ID 목록 저장"""
-    current_user.favorite_project_ids = data.get("project_ids", [])
+    user = db.query(User).filter(User.id == current_user.id).first()
+    user.favorite_project_ids = data.get("project_ids", [])
     db.commit()
-    db.refresh(current_user)
-    return current_user.favorite_project_ids or []
+    db.refresh(user)
+    invalidate_user(user.id)
+    return user.favorite_project_ids or []
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -99,10 +102,12 @@ async def update_profile_image(
 ):
     """현재 사용자 프로필 이미지 업데이트"""
     profile_image_url = data.get("profile_image_url")
-    current_user.profile_image_url = profile_image_url
+    user = db.query(User).filter(User.id == current_user.id).first()
+    user.profile_image_url = profile_image_url
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    db.refresh(user)
+    invalidate_user(user.id)
+    return user
 
 
 @router.patch("/{user_id}/approve", response_model=UserResponse)
@@ -123,6 +128,7 @@ async def approve_user(
     user.is_approved = True
     db.commit()
     db.refresh(user)
+    invalidate_user(user.id)
     print(f"[Approve] 승인 후: {user.username}, is_approved: {user.is_approved}")
     return user
 
@@ -143,6 +149,7 @@ async def reject_user(
     
     db.delete(user)
     db.commit()
+    invalidate_user(user_id)
     return {"message": "사용자가 거부되었습니다"}
 
 
@@ -163,6 +170,7 @@ async def grant_pm_permission(
     user.is_pm = True
     db.commit()
     db.refresh(user)
+    invalidate_user(user.id)
     return user
 
 
@@ -183,5 +191,6 @@ async def revoke_pm_permission(
     user.is_pm = False
     db.commit()
     db.refresh(user)
+    invalidate_user(user.id)
     return user
 
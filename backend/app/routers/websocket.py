@@ -2,106 +2,222 @@
 WebSocket 라우터 - 실시간 동기화
 """
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Set
 import json
 import asyncio
 
+from app.utils.backplane import NODE_ID, Backplane, InMemoryBackplane
+
 router = APIRouter()
 
+def _encode(message: dict) -> str:
+    """메시지를 한 번만 JSON 직렬화 (starlette send_json 과 동일한 형식)"""
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
+
+class _ClientConnection:
+    """소켓 1개의 송신 상태 — 제한된 크기의 송신 큐 + 전용 writer 태스크"""
+
+    __slots__ = ("websocket", "user_id", "queue", "writer")
+
+    def __init__(self, websocket: WebSocket, user_id: str, max_queue: int):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.writer: Optional[asyncio.Task] = None
+
+
 # 연결된 클라이언트 관리
 class ConnectionManager:
-    def __init__(self):
-        # 활성 연결: {user_id: [websocket1, websocket2, ...]}
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-        # 모든 연결 (브로드캐스트용)
-        self.all_connections: List[WebSocket] = []
+    """WebSocket 연결 관리 + 전송 엔진
+
+    - 메시지는 봉투당 1번만 직렬화하고, 각 소켓의 송신 큐에 넣기만 한다 (await 없음)
+    - 소켓마다 writer 태스크가 큐를 비우며 SEND_TIMEOUT 안에 전송 → 소켓 간 전송이 병렬로 진행
+    - 큐가 가득 찬(= 따라오지 못하는) 소켓이나 전송 타임아웃 소켓은 끊어서 다른 수신자를 지연시키지 않음
+    """
+
+    # 소켓당 전송 1건 최대 대기 시간 (초)
+    SEND_TIMEOUT = 5.0
+    # 소켓당 미전송 메시지 상한 — 넘으면 느린 소비자로 간주하고 연결 종료
+    MAX_QUEUE_SIZE = 256
+
+    def __init__(self, backplane: Optional[Backplane] = None):
+        # 활성 연결: {user_id: {websocket1, websocket2, ...}}
+        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # 역인덱스: {websocket: _ClientConnection(user_id 포함)} — 브로드캐스트/제외 판정용
+        self.connections: Dict[WebSocket, _ClientConnection] = {}
+        # 느린 소비자로 끊은 연결 수 (모니터링용)
+        self.dropped_connections = 0
+        # 워커 간 팬아웃 — start_backplane() 전까지는 프로세스 내 전달
+        self.backplane: Backplane = backplane or InMemoryBackplane()
+        # 제어 봉투 핸들러: {op: handler(envelope)}
+        self.control_handlers: Dict[str, Callable[[dict], None]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def all_connections(self) -> List[WebSocket]:
+        """모든 연결 (하위 호환용)"""
+        return list(self.connections)
+
+    async def start_backplane(self, backplane: Optional[Backplane] = None) -> None:
+        """앱 시작 시 호출 — 백플레인 수신을 시작한다"""
+        if backplane is not None:
+            self.backplane = backplane
+        self._loop = asyncio.get_running_loop()
+        await self.backplane.start(self._handle_envelope)
+
+    async def stop_backplane(self) -> None:
+        await self.backplane.stop()
+
+    async def _handle_envelope(self, envelope: dict) -> None:
+        """백플레인에서 받은 봉투를 이 워커의 로컬 연결로 전달"""
+        op = envelope.get("op")
+        message = envelope.get("message") or {}
+        exclude_user_id = envelope.get("exclude_user_id")
+        if op == "user":
+            self._deliver_to_users(message, envelope.get("user_ids") or [])
+        elif op == "users":
+            self._deliver_to_users(message, envelope.get("user_ids") or [], exclude_user_id)
+        elif op == "broadcast":
+            self._deliver_broadcast(message, exclude_user_id)
+        elif op in self.control_handlers:
+            self.control_handlers[op](envelope)
+
+    def register_control_handler(self, op: str, handler: Callable[[dict], None]) -> None:
+        """WebSocket 전달 외의 워커 간 제어 봉투(캐시 무효화 등) 핸들러 등록"""
+        self.control_handlers[op] = handler
+
+    async def publish_control(self, op: str, user_ids: list) -> None:
+        await self._publish(op, {}, user_ids)
+
+    def publish_control_nowait(self, op: str, user_ids: list) -> None:
+        """동기 코드(이벤트 루프 / 스레드풀 어디서든)에서 제어 봉투 발행 예약"""
+        coro = self.publish_control(op, user_ids)
+        try:
+            asyncio.get_running_loop()
+            asyncio.create_task(coro)
+            return
+        except RuntimeError:
+            pass
+        if self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(coro, self._loop)
+        else:
+            coro.close()
+
+    async def _publish(self, op: str, message: dict, user_ids: list = None, exclude_user_id: str = None):
+        await self.backplane.publish({
+            "origin": NODE_ID,
+            "op": op,
+            "user_ids": list(user_ids or []),
+            "exclude_user_id": exclude_user_id,
+            "message": message,
+        })
 
     async def connect(self, websocket: WebSocket, user_id: str):
         await websocket.accept()
-        if user_id not in self.active_connections:
-            self.active_connections[user_id] = []
-        self.active_connections[user_id].append(websocket)
-        self.all_connections.append(websocket)
-        print(f"[WebSocket] 사용자 {user_id} 연결됨. 총 연결: {len(self.all_connections)}")
-
-    def disconnect(self, websocket: WebSocket, user_id: str):
-        if user_id in self.active_connections:
-            if websocket in self.active_connections[user_id]:
-                self.active_connections[user_id].remove(websocket)
-            if not self.active_connections[user_id]:
+        client = _ClientConnection(websocket, user_id, self.MAX_QUEUE_SIZE)
+        client.writer = asyncio.create_task(self._writer(client))
+        self.active_connections.setdefault(user_id, set()).add(websocket)
+        self.connections[websocket] = client
+        print(f"[WebSocket] 사용자 {user_id} 연결됨. 총 연결: {len(self.connections)}")
+
+    def disconnect(self, websocket: WebSocket, user_id: str = None):
+        client = self.connections.pop(websocket, None)
+        if client is None:
+            return
+        user_id = client.user_id
+        sockets = self.active_connections.get(user_id)
+        if sockets is not None:
+            sockets.discard(websocket)
+            if not sockets:
                 del self.active_connections[user_id]
-        
-        if websocket in self.all_connections:
-            self.all_connections.remove(websocket)
-        print(f"[WebSocket] 사용자 {user_id} 연결 해제됨. 총 연결: {len(self.all_connections)}")
+        if client.writer is not None and client.writer is not asyncio.current_task():
+            client.writer.cancel()
+        print(f"[WebSocket] 사용자 {user_id} 연결 해제됨. 총 연결: {len(self.connections)}")
 
-    async def send_personal_message(self, message: dict, websocket: WebSocket):
+    async def _writer(self, client: _ClientConnection):
+        """소켓 전용 송신 루프 — 전송 실패/타임아웃 시 연결 정리"""
         try:
-            await websocket.send_json(message)
+            while True:
+                text = await client.queue.get()
+                await asyncio.wait_for(client.websocket.send_text(text), timeout=self.SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            print(f"[WebSocket] 사용자 {client.user_id} 전송 타임아웃 — 연결 종료")
+            self._drop(client)
         except Exception as e:
-            print(f"[WebSocket] 개인 메시지 전송 실패: {e}")
+            print(f"[WebSocket] 사용자 {client.user_id} 전송 실패: {e}")
+            self.disconnect(client.websocket)
 
-    async def send_to_user(self, message: dict, user_id: str):
-        """특정 사용자에게만 메시지 전송 (타겟 전송)"""
-        if user_id not in self.active_connections:
-            return
-        
-        disconnected = []
-        for websocket in self.active_connections[user_id][:]:
+    def _drop(self, client: _ClientConnection):
+        """느린 소비자 연결 끊기 (1013: Try Again Later — 클라이언트가 재연결 후 재동기화)"""
+        self.dropped_connections += 1
+        self.disconnect(client.websocket)
+
+        async def _close():
             try:
-                await websocket.send_json(message)
-            except Exception as e:
-                print(f"[WebSocket] 사용자 {user_id} 전송 실패: {e}")
-                disconnected.append(websocket)
-        
-        # 끊어진 연결 정리
-        for ws in disconnected:
-            self.active_connections[user_id].remove(ws)
-            if ws in self.all_connections:
-                self.all_connections.remove(ws)
-            if not self.active_connections[user_id]:
-                del self.active_connections[user_id]
+                await asyncio.wait_for(
+                    client.websocket.close(code=1013, reason="slow consumer"), timeout=self.SEND_TIMEOUT
+                )
+            except Exception:
+                pass
+
+        asyncio.create_task(_close())
+
+    def _enqueue(self, client: _ClientConnection, text: str):
+        try:
+            client.queue.put_nowait(text)
+        except asyncio.QueueFull:
+            print(f"[WebSocket] 사용자 {client.user_id} 송신 큐 초과({self.MAX_QUEUE_SIZE}) — 연결 종료")
+            self._drop(client)
+
+    def send_text_to_socket(self, websocket: WebSocket, text: str):
+        """특정 소켓에 원문 텍스트 전송 (ping 응답 등) — 같은 송신 큐를 사용해 순서 보장"""
+        client = self.connections.get(websocket)
+        if client is not None:
+            self._enqueue(client, text)
+
+    async def send_personal_message(self, message: dict, websocket: WebSocket):
+        self.send_text_to_socket(websocket, _encode(message))
+
+    async def send_to_user(self, message: dict, user_id: str):
+        """특정 사용자에게만 메시지 전송 (타겟 전송, 모든 워커)"""
+        await self._publish("user", message, [user_id])
 
     async def send_to_users(self, message: dict, user_ids: list, exclude_user_id: str = None):
-        """여러 사용자에게 메시지 전송 (타겟 전송)"""
-        for uid in user_ids:
+        """여러 사용자에게 메시지 전송 (타겟 전송, 모든 워커)"""
+        await self._publish("users", message, user_ids, exclude_user_id)
+
+    async def broadcast(self, message: dict, exclude_user_id: str = None):
+        """모든 연결된 클라이언트에게 메시지 브로드캐스트 (모든 워커)"""
+        await self._publish("broadcast", message, exclude_user_id=exclude_user_id)
+
+    def _deliver_to_users(self, message: dict, user_ids: list, exclude_user_id: str = None):
+        """이 워커에 연결된 사용자 소켓들의 송신 큐에 적재"""
+        text = None
+        for uid in dict.fromkeys(user_ids):
             if exclude_user_id and uid == exclude_user_id:
                 continue
-            await self.send_to_user(message, uid)
+            sockets = self.active_connections.get(uid)
+            if not sockets:
+                continue
+            if text is None:
+                text = _encode(message)
+            for websocket in list(sockets):
+                client = self.connections.get(websocket)
+                if client is not None:
+                    self._enqueue(client, text)
 
-    async def broadcast(self, message: dict, exclude_user_id: str = None):
-        """모든 연결된 클라이언트에게 메시지 브로드캐스트"""
-        if not self.all_connections:
+    def _deliver_broadcast(self, message: dict, exclude_user_id: str = None):
+        """이 워커의 모든 연결 송신 큐에 적재"""
+        if not self.connections:
             return
-        
-        disconnected = []
-        for websocket in self.all_connections[:]:  # 복사본으로 순회
-            # exclude_user_id가 지정된 경우 해당 사용자의 연결은 제외
-            if exclude_user_id:
-                should_exclude = False
-                for user_id, connections in self.active_connections.items():
-                    if user_id == exclude_user_id and websocket in connections:
-                        should_exclude = True
-                        break
-                if should_exclude:
-                    continue
-            
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                print(f"[WebSocket] 브로드캐스트 실패: {e}")
-                disconnected.append(websocket)
-        
-        # 끊어진 연결 정리
-        for ws in disconnected:
-            if ws in self.all_connections:
-                self.all_connections.remove(ws)
-            # active_connections에서도 제거
-            for user_id, connections in list(self.active_connections.items()):
-                if ws in connections:
-                    connections.remove(ws)
-                    if not connections:
-                        del self.active_connections[user_id]
+        text = _encode(message)
+        for client in list(self.connections.values()):
+            if exclude_user_id and client.user_id == exclude_user_id:
+                continue
+            self._enqueue(client, text)
 
 # 전역 연결 관리자
 manager = ConnectionManager()
@@ -111,8 +227,8 @@ manager = ConnectionManager()
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket 연결 엔드포인트"""
     from app.database import SessionLocal
-    from app.utils.security import decode_access_token
     from app.models.user import User
+    from app.utils.auth_cache import cache_user, decode_token_cached, get_cached_user
     
     # 쿼리 파라미터에서 토큰 가져오기
     token = websocket.query_params.get("token")
@@ -121,7 +237,7 @@ async def websocket_endpoint(websocket: WebSocket):
         return
 
     # 토큰 검증
-    payload = decode_access_token(token)
+    payload = decode_token_cached(token)
     if payload is None:
         await websocket.close(code=1008, reason="유효하지 않은 토큰입니다")
         return
@@ -131,26 +247,30 @@ async def websocket_endpoint(websocket: WebSocket):
         await websocket.close(code=1008, reason="토큰에서 사용자 정보를 찾을 수 없습니다")
         return
 
-    # DB 세션은 유저 조회에만 사용하고 즉시 반환 (커넥션 풀 고갈 방지)
-    db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.is_approved:
-            await websocket.close(code=1008, reason="접근이 거부되었습니다")
-            return
-        resolved_user_id = user.id
-        resolved_username = user.username
-    finally:
-        db.close()
+    user = get_cached_user(user_id)
+    if user is None:
+        # DB 세션은 유저 조회에만 사용하고 즉시 반환 (커넥션 풀 고갈 방지)
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter(User.id == user_id).first()
+            if user is not None:
+                user = cache_user(user)
+        finally:
+            db.close()
+    if not user or not user.is_approved:
+        await websocket.close(code=1008, reason="접근이 거부되었습니다")
+        return
+    resolved_user_id = user.id
+    resolved_username = user.username
 
     await manager.connect(websocket, resolved_user_id)
-    print(f"[WebSocket] 사용자 {resolved_username} 연결됨. 총 연결: {len(manager.all_connections)}")
+    print(f"[WebSocket] 사용자 {resolved_username} 연결됨. 총 연결: {len(manager.connections)}")
     try:
         while True:
             # 60초 타임아웃으로 ping/pong 처리 (좀비 연결 방지)
             data = await asyncio.wait_for(websocket.receive_text(), timeout=60.0)
             if data == "ping":
-                await websocket.send_text("pong")
+                manager.send_text_to_socket(websocket, "pong")
     except asyncio.TimeoutError:
         manager.disconnect(websocket, resolved_user_id)
     except WebSocketDisconnect:
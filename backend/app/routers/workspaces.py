@@ -5,16 +5,18 @@ import secrets
 import uuid
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, distinct, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.workspace import Workspace, WorkspaceMember
 from app.models.user import User
 from app.models.project import Project
 from app.models.task import Task, TaskStatus
-from app.models.comment import Comment
+from app.models.task_activity import TaskActivityDaily
 from app.schemas.workspace import WorkspaceCreate, WorkspaceResponse, WorkspaceMemberResponse, JoinByTokenRequest
+from app.utils.auth_cache import invalidate_user
 from app.utils.dependencies import get_current_user
 
 router = APIRouter()
@@ -72,22 +74,24 @@ def _is_date_task(t: Task, day_start: datetime, day_end: datetime) -> bool:
     return False
 
 
-def _is_workspace_member(db: Session, workspace_id: str, user_id: str) -> bool:
-    return db.query(WorkspaceMember).filter(
+async def _is_workspace_member(db: AsyncSession, workspace_id: str, user_id: str) -> bool:
+    return await db.scalar(select(WorkspaceMember.id).where(
         WorkspaceMember.workspace_id == workspace_id,
         WorkspaceMember.user_id == user_id
-    ).first() is not None
+    ).limit(1)) is not None
 
 
-def _get_workspace_or_404(db: Session, workspace_id: str) -> Workspace:
-    ws = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+async def _get_workspace_or_404(db: AsyncSession, workspace_id: str) -> Workspace:
+    ws = await db.get(Workspace, workspace_id)
     if not ws:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="워크스페이스를 찾을 수 없습니다")
     return ws
 
 
-def _workspace_to_response(ws: Workspace, db: Session) -> WorkspaceResponse:
-    member_count = db.query(WorkspaceMember).filter(WorkspaceMember.workspace_id == ws.id).count()
+async def _workspace_to_response(ws: Workspace, db: AsyncSession) -> WorkspaceResponse:
+    member_count = await db.scalar(
+        select(func.count(WorkspaceMember.id)).where(WorkspaceMember.workspace_id == ws.id)
+    )
     return WorkspaceResponse(
         id=ws.id,
         name=ws.name,
@@ -101,29 +105,28 @@ def _workspace_to_response(ws: Workspace, db: Session) -> WorkspaceResponse:
 
 @router.get("/", response_model=List[WorkspaceResponse])
 async def get_my_workspaces(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """내가 속한 워크스페이스 목록 (admin은 전체)"""
     if current_user.is_admin:
-        workspaces = db.query(Workspace).all()
+        workspaces = (await db.scalars(select(Workspace))).all()
     else:
-        memberships = db.query(WorkspaceMember).filter(
+        ws_ids = select(WorkspaceMember.workspace_id).where(
             WorkspaceMember.user_id == current_user.id
-        ).all()
-        ws_ids = [m.workspace_id for m in memberships]
-        workspaces = db.query(Workspace).filter(Workspace.id.in_(ws_ids)).all()
-    return [_workspace_to_response(ws, db) for ws in workspaces]
+        )
+        workspaces = (await db.scalars(select(Workspace).where(Workspace.id.in_(ws_ids)))).all()
+    return [await _workspace_to_response(ws, db) for ws in workspaces]
 
 
 @router.post("/", response_model=WorkspaceResponse, status_code=status.HTTP_201_CREATED)
 async def create_workspace(
     ws_data: WorkspaceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """워크스페이스 생성 - 생성자가 owner가 됨"""
-    existing = db.query(Workspace).filter(Workspace.name == ws_data.name).first()
+    existing = await db.scalar(select(Workspace).where(Workspace.name == ws_data.name).limit(1))
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -137,7 +140,7 @@ async def create_workspace(
         invite_token=secrets.token_urlsafe(16),
     )
     db.add(new_ws)
-    db.flush()
+    await db.flush()
 
     # 생성자를 owner로 멤버에 추가
     db.add(WorkspaceMember(
@@ -146,42 +149,45 @@ async def create_workspace(
         user_id=current_user.id,
         role="owner",
     ))
-    db.commit()
-    db.refresh(new_ws)
-    return _workspace_to_response(new_ws, db)
+    await db.commit()
+    await db.refresh(new_ws)
+    return await _workspace_to_response(new_ws, db)
 
 
 @router.get("/{workspace_id}", response_model=WorkspaceResponse)
 async def get_workspace(
     workspace_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """워크스페이스 상세 조회 (멤버 또는 admin)"""
-    ws = _get_workspace_or_404(db, workspace_id)
-    if not current_user.is_admin and not _is_workspace_member(db, workspace_id, current_user.id):
+    ws = await _get_workspace_or_404(db, workspace_id)
+    if not current_user.is_admin and not await _is_workspace_member(db, workspace_id, current_user.id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="워크스페이스 멤버가 아닙니다")
-    return _workspace_to_response(ws, db)
+    return await _workspace_to_response(ws, db)
 
 
 @router.get("/{workspace_id}/members", response_model=List[WorkspaceMemberResponse])
 async def get_workspace_members(
     workspace_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """워크스페이스 멤버 목록 (멤버 또는 admin)"""
-    _get_workspace_or_404(db, workspace_id)
-    if not current_user.is_admin and not _is_workspace_member(db, workspace_id, current_user.id):
+    await _get_workspace_or_404(db, workspace_id)
+    if not current_user.is_admin and not await _is_workspace_member(db, workspace_id, current_user.id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="워크스페이스 멤버가 아닙니다")
 
-    memberships = db.query(WorkspaceMember).filter(
+    memberships = (await db.scalars(select(WorkspaceMember).where(
         WorkspaceMember.workspace_id == workspace_id
-    ).all()
+    ))).all()
+    member_user_ids = [m.user_id for m in memberships]
+    users = (await db.scalars(select(User).where(User.id.in_(member_user_ids)))).all() if member_user_ids else []
+    user_by_id = {u.id: u for u in users}
 
     result = []
     for m in memberships:
-        user = db.query(User).filter(User.id == m.user_id).first()
+        user = user_by_id.get(m.user_id)
         if user:
             result.append(WorkspaceMemberResponse(
                 user_id=user.id,
@@ -196,146 +202,236 @@ async def get_workspace_members(
 @router.post("/join", response_model=WorkspaceResponse)
 async def join_workspace_by_token(
     body: JoinByTokenRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """초대 토큰으로 워크스페이스 참여"""
-    ws = db.query(Workspace).filter(Workspace.invite_token == body.invite_token).first()
+    ws = await db.scalar(select(Workspace).where(Workspace.invite_token == body.invite_token))
     if not ws:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="유효하지 않은 초대 코드입니다")
 
     # 이미 멤버이면 그냥 반환
-    if not _is_workspace_member(db, ws.id, current_user.id):
+    if not await _is_workspace_member(db, ws.id, current_user.id):
         db.add(WorkspaceMember(
             id=str(uuid.uuid4()),
             workspace_id=ws.id,
             user_id=current_user.id,
             role="member",
         ))
-        db.commit()
-        db.refresh(ws)
+        await db.commit()
+        await db.refresh(ws)
 
-    return _workspace_to_response(ws, db)
+    return await _workspace_to_response(ws, db)
 
 
 @router.post("/{workspace_id}/invite/regenerate", response_model=WorkspaceResponse)
 async def regenerate_invite_token(
     workspace_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """초대 토큰 재발급 (owner만)"""
-    ws = _get_workspace_or_404(db, workspace_id)
+    ws = await _get_workspace_or_404(db, workspace_id)
     if ws.owner_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="워크스페이스 오너만 초대 코드를 재발급할 수 있습니다")
 
     ws.invite_token = secrets.token_urlsafe(16)
-    db.commit()
-    db.refresh(ws)
-    return _workspace_to_response(ws, db)
+    await db.commit()
+    await db.refresh(ws)
+    return await _workspace_to_response(ws, db)
 
 
 @router.delete("/{workspace_id}/members/{user_id}")
 async def remove_workspace_member(
     workspace_id: str,
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """멤버 강퇴 (owner 또는 admin만)"""
-    ws = _get_workspace_or_404(db, workspace_id)
+    ws = await _get_workspace_or_404(db, workspace_id)
     if ws.owner_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="워크스페이스 오너만 멤버를 강퇴할 수 있습니다")
     if user_id == ws.owner_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="오너는 강퇴할 수 없습니다")
 
-    member = db.query(WorkspaceMember).filter(
+    member = await db.scalar(select(WorkspaceMember).where(
         WorkspaceMember.workspace_id == workspace_id,
         WorkspaceMember.user_id == user_id
-    ).first()
+    ))
     if member:
-        db.delete(member)
-        db.commit()
+        await db.delete(member)
+        await db.commit()
     return {"message": "멤버가 강퇴되었습니다"}
 
 
 @router.delete("/{workspace_id}")
 async def delete_workspace(
     workspace_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """워크스페이스 삭제 (owner만 가능)"""
-    ws = _get_workspace_or_404(db, workspace_id)
+    ws = await _get_workspace_or_404(db, workspace_id)
     if ws.owner_id != current_user.id and not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="오너만 워크스페이스를 삭제할 수 있습니다"
         )
-    db.query(WorkspaceMember).filter(WorkspaceMember.workspace_id == workspace_id).delete()
-    db.delete(ws)
-    db.commit()
+    await db.execute(delete(WorkspaceMember).where(WorkspaceMember.workspace_id == workspace_id))
+    await db.delete(ws)
+    await db.commit()
     return {"message": "워크스페이스가 삭제되었습니다"}
 
 
+async def _member_status_counts(db: AsyncSession, project_ids: List[str], user_ids: List[str]) -> dict:
+    """멤버별·상태별 할당 태스크 수 — {user_id: {TaskStatus: count}}
+
+    unnest(assigned_member_ids) 로 (담당자, 태스크) 행을 펼친 뒤 GROUP BY.
+    같은 담당자가 배열에 중복돼 있어도 태스크는 한 번만 센다.
+    """
+    assigned = (
+        select(func.unnest(Task.assigned_member_ids).label("user_id"), Task.id, Task.status)
+        .where(Task.project_id.in_(project_ids))
+        .subquery("assigned")
+    )
+    rows = (await db.execute(
+        select(assigned.c.user_id, assigned.c.status, func.count(distinct(assigned.c.id)))
+        .where(assigned.c.user_id.in_(user_ids))
+        .group_by(assigned.c.user_id, assigned.c.status)
+    )).all()
+    counts: dict = {}
+    for user_id, task_status, count in rows:
+        counts.setdefault(user_id, {})[task_status] = count
+    return counts
+
+
+async def _member_task_rows(
+    db: AsyncSession, project_ids: List[str], user_ids: List[str], today_start: datetime
+) -> dict:
+    """멤버별 목록 표시에 필요한 태스크 행 — {user_id: [Row]}
+
+    미완료 태스크 전부 + 완료 태스크는 최근 5개(done_rank) 와 오늘 갱신분만.
+    화면에 쓰는 컬럼만 읽고, 완료 이력 전체는 내려받지 않는다.
+    """
+    assigned = (
+        select(
+            func.unnest(Task.assigned_member_ids).label("user_id"),
+            Task.id, Task.title, Task.project_id, Task.priority, Task.status,
+            Task.start_date, Task.end_date, Task.updated_at,
+        )
+        .where(Task.project_id.in_(project_ids))
+        .subquery("assigned")
+    )
+    # dense_rank: 배열 중복으로 같은 태스크가 두 줄이어도 같은 순위
+    ranked = (
+        select(
+            assigned,
+            func.dense_rank().over(
+                partition_by=(assigned.c.user_id, assigned.c.status),
+                order_by=(assigned.c.updated_at.desc(), assigned.c.id),
+            ).label("done_rank"),
+        )
+        .where(assigned.c.user_id.in_(user_ids))
+        .subquery("ranked")
+    )
+    rows = (await db.execute(
+        select(ranked).where(or_(
+            ranked.c.status != TaskStatus.DONE,
+            ranked.c.done_rank <= 5,
+            ranked.c.updated_at >= today_start,
+        ))
+    )).all()
+
+    tasks_by_member: dict = {}
+    seen = set()
+    for row in rows:
+        if (row.user_id, row.id) in seen:
+            continue
+        seen.add((row.user_id, row.id))
+        tasks_by_member.setdefault(row.user_id, []).append(row)
+    return tasks_by_member
+
+
 @router.get("/{workspace_id}/member-stats")
 async def get_workspace_member_stats(
     workspace_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """워크스페이스 멤버별 작업 통계 조회"""
-    _get_workspace_or_404(db, workspace_id)
-    if not current_user.is_admin and not _is_workspace_member(db, workspace_id, current_user.id):
+    await _get_workspace_or_404(db, workspace_id)
+    if not current_user.is_admin and not await _is_workspace_member(db, workspace_id, current_user.id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="워크스페이스 멤버가 아닙니다")
 
     # 워크스페이스 프로젝트 목록
-    projects = db.query(Project).filter(Project.workspace_id == workspace_id).all()
+    projects = (await db.scalars(select(Project).where(Project.workspace_id == workspace_id))).all()
     project_ids = [p.id for p in projects]
     project_map = {p.id: p for p in projects}
 
-    # 워크스페이스 전체 태스크 (서브태스크 포함 — 담당자가 서브태스크에 할당될 수 있음)
-    all_tasks = db.query(Task).filter(
-        Task.project_id.in_(project_ids),
-    ).all() if project_ids else []
-
-    # 멤버 목록
-    memberships = db.query(WorkspaceMember).filter(
+    # 멤버 목록 + 사용자 일괄 조회
+    memberships = (await db.scalars(select(WorkspaceMember).where(
         WorkspaceMember.workspace_id == workspace_id
-    ).all()
+    ))).all()
+    member_user_ids = [m.user_id for m in memberships]
+    users = (await db.scalars(select(User).where(User.id.in_(member_user_ids)))).all() if member_user_ids else []
+    user_by_id = {u.id: u for u in users}
+
+    # 오늘 일정 기준 (대시보드와 동일한 로직)
+    now_utc = datetime.now(timezone.utc)
+    today_start = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+    today_end = now_utc.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+    counts_by_member, tasks_by_member = {}, {}
+    if project_ids and user_by_id:
+        counts_by_member = await _member_status_counts(db, project_ids, list(user_by_id))
+        tasks_by_member = await _member_task_rows(db, project_ids, list(user_by_id), today_start)
+
+    status_map = {
+        TaskStatus.BACKLOG: "backlog",
+        TaskStatus.READY: "ready",
+        TaskStatus.IN_PROGRESS: "in_progress",
+        TaskStatus.IN_REVIEW: "in_review",
+        TaskStatus.DONE: "done",
+    }
+    priority_order = {
+        TaskStatus.IN_PROGRESS: 0,
+        TaskStatus.IN_REVIEW: 1,
+        TaskStatus.READY: 2,
+        TaskStatus.BACKLOG: 3,
+    }
+    priority_value = {"p0": 0, "p1": 1, "p2": 2, "p3": 3}
+
+    def project_name(t) -> str:
+        return project_map[t.project_id].name if t.project_id in project_map else ""
 
     result_members = []
     for m in memberships:
-        user = db.query(User).filter(User.id == m.user_id).first()
+        user = user_by_id.get(m.user_id)
         if not user:
             continue
 
         # 이 멤버에게 할당된 태스크 (assigned_member_ids 배열에 포함)
-        member_tasks = [t for t in all_tasks if user.id in (t.assigned_member_ids or [])]
+        # 완료 태스크는 최근 5개 + 오늘 갱신분만 조회되어 있으므로 건수는 집계 결과를 쓴다
+        member_tasks = tasks_by_member.get(user.id, [])
 
         # 태스크 수 집계
         counts = {
             "backlog": 0, "ready": 0, "in_progress": 0,
-            "in_review": 0, "done": 0, "total": len(member_tasks)
+            "in_review": 0, "done": 0, "total": 0
         }
-        status_map = {
-            TaskStatus.BACKLOG: "backlog",
-            TaskStatus.READY: "ready",
-            TaskStatus.IN_PROGRESS: "in_progress",
-            TaskStatus.IN_REVIEW: "in_review",
-            TaskStatus.DONE: "done",
-        }
-        for t in member_tasks:
-            key = status_map.get(t.status)
+        for task_status, count in counts_by_member.get(user.id, {}).items():
+            counts["total"] += count
+            key = status_map.get(task_status)
             if key:
-                counts[key] += 1
+                counts[key] += count
 
         # 진행 중 태스크 (최대 5개)
         active_tasks = [
             {
                 "id": t.id,
                 "title": t.title,
-                "project_name": project_map[t.project_id].name if t.project_id in project_map else "",
+                "project_name": project_name(t),
                 "priority": t.priority.value if t.priority else "p2",
             }
             for t in member_tasks if t.status == TaskStatus.IN_PROGRESS
@@ -343,7 +439,7 @@ async def get_workspace_member_stats(
 
         # 최근 완료 태스크 (updated_at 최신 5개)
         done_tasks = sorted(
-            [t for t in member_tasks if t.status == TaskStatus.DONE],
+            [t for t in member_tasks if t.status == TaskStatus.DONE and t.done_rank <= 5],
             key=lambda t: t.updated_at,
             reverse=True
         )[:5]
@@ -351,21 +447,13 @@ async def get_workspace_member_stats(
             {
                 "id": t.id,
                 "title": t.title,
-                "project_name": project_map[t.project_id].name if t.project_id in project_map else "",
+                "project_name": project_name(t),
                 "updated_at": t.updated_at.isoformat() if t.updated_at else None,
             }
             for t in done_tasks
         ]
 
         # 전체 미완료 태스크 (우선순위순, done 제외)
-        priority_order = {
-            TaskStatus.IN_PROGRESS: 0,
-            TaskStatus.IN_REVIEW: 1,
-            TaskStatus.READY: 2,
-            TaskStatus.BACKLOG: 3,
-        }
-        priority_value = {"p0": 0, "p1": 1, "p2": 2, "p3": 3}
-
         todo_tasks = sorted(
             [t for t in member_tasks if t.status != TaskStatus.DONE],
             key=lambda t: (
@@ -377,7 +465,7 @@ async def get_workspace_member_stats(
             {
                 "id": t.id,
                 "title": t.title,
-                "project_name": project_map[t.project_id].name if t.project_id in project_map else "",
+                "project_name": project_name(t),
                 "priority": t.priority.value if t.priority else "p2",
                 "status": t.status.value,
                 "end_date": t.end_date.isoformat() if t.end_date else None,
@@ -385,16 +473,12 @@ async def get_workspace_member_stats(
             for t in todo_tasks
         ]
 
-        # 오늘 일정 (대시보드와 동일한 로직)
-        now_utc = datetime.now(timezone.utc)
-        today_start = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = now_utc.replace(hour=23, minute=59, second=59, microsecond=999999)
-
+        # 오늘 일정
         today_tasks = [
             {
                 "id": t.id,
                 "title": t.title,
-                "project_name": project_map[t.project_id].name if t.project_id in project_map else "",
+                "project_name": project_name(t),
                 "priority": t.priority.value if t.priority else "p2",
                 "status": t.status.value,
                 "end_date": t.end_date.isoformat() if t.end_date else None,
@@ -434,12 +518,12 @@ async def get_workspace_member_stats(
 async def get_yesterday_incomplete_tasks(
     workspace_id: str,
     target_date: str = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """어제(또는 지정 날짜)의 미완료 '오늘 할일' 조회 (현재 유저 대상)"""
-    _get_workspace_or_404(db, workspace_id)
-    if not current_user.is_admin and not _is_workspace_member(db, workspace_id, current_user.id):
+    await _get_workspace_or_404(db, workspace_id)
+    if not current_user.is_admin and not await _is_workspace_member(db, workspace_id, current_user.id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="워크스페이스 멤버가 아닙니다")
 
     # 대상 날짜 결정 (기본: 어제)
@@ -457,13 +541,13 @@ async def get_yesterday_incomplete_tasks(
     day_end = target.replace(hour=23, minute=59, second=59, microsecond=999999)
 
     # 워크스페이스 프로젝트 + 태스크
-    projects = db.query(Project).filter(Project.workspace_id == workspace_id).all()
+    projects = (await db.scalars(select(Project).where(Project.workspace_id == workspace_id))).all()
     project_ids = [p.id for p in projects]
     project_map = {p.id: p for p in projects}
 
-    all_tasks = db.query(Task).filter(
+    all_tasks = (await db.scalars(select(Task).where(
         Task.project_id.in_(project_ids),
-    ).all() if project_ids else []
+    ))).all() if project_ids else []
 
     # 현재 유저에게 할당된 태스크만
     my_tasks = [t for t in all_tasks if current_user.id in (t.assigned_member_ids or [])]
@@ -509,7 +593,7 @@ async def get_yesterday_incomplete_tasks(
 @router.post("/{workspace_id}/yesterday-incomplete/acknowledge", status_code=status.HTTP_204_NO_CONTENT)
 async def acknowledge_yesterday_incomplete_review(
     workspace_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """어제 미완료 리뷰 다이얼로그를 봤음을 기록 (멱등).
@@ -517,37 +601,42 @@ async def acknowledge_yesterday_incomplete_review(
     프론트엔드는 다이얼로그를 띄우기 직전에 이 엔드포인트를 호출해야 한다.
     당일 재호출에도 안전 — last_yesterday_review_at 을 now() 로 갱신만 수행.
     """
-    _get_workspace_or_404(db, workspace_id)
-    if not current_user.is_admin and not _is_workspace_member(db, workspace_id, current_user.id):
+    await _get_workspace_or_404(db, workspace_id)
+    if not current_user.is_admin and not await _is_workspace_member(db, workspace_id, current_user.id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="워크스페이스 멤버가 아닙니다")
 
-    current_user.last_yesterday_review_at = datetime.now(timezone.utc)
-    db.add(current_user)
-    db.commit()
+    # current_user 는 인증 의존성의 (동기) 세션 소속이므로 UPDATE 문으로 직접 갱신
+    now_utc = datetime.now(timezone.utc)
+    await db.execute(
+        update(User).where(User.id == current_user.id).values(last_yesterday_review_at=now_utc)
+    )
+    await db.commit()
+    invalidate_user(current_user.id)
+    current_user.last_yesterday_review_at = now_utc
     return None
 
 
 @router.delete("/{workspace_id}/leave")
 async def leave_workspace(
     workspace_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """워크스페이스 탈퇴 (owner는 불가)"""
-    ws = _get_workspace_or_404(db, workspace_id)
+    ws = await _get_workspace_or_404(db, workspace_id)
     if ws.owner_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="오너는 워크스페이스를 탈퇴할 수 없습니다. 다른 멤버에게 오너를 양도하거나 워크스페이스를 삭제하세요"
         )
 
-    member = db.query(WorkspaceMember).filter(
+    member = await db.scalar(select(WorkspaceMember).where(
         WorkspaceMember.workspace_id == workspace_id,
         WorkspaceMember.user_id == current_user.id
-    ).first()
+    ))
     if member:
-        db.delete(member)
-        db.commit()
+        await db.delete(member)
+        await db.commit()
     return {"message": "워크스페이스를 탈퇴했습니다"}
 
 
@@ -559,11 +648,13 @@ async def leave_workspace(
 #   한 (멤버 × 일자) 의 활동 = 그 날 그 멤버가 "건드린" distinct Task 카드 수
 #   "건드림" = 다음 중 하나 이상이 그 날 발생:
 #     - 작업 생성: tasks.creator_id == 멤버 AND tasks.created_at::date == 그 날
-#     - 완료 변경: status_history JSON 의 한 entry 가 toStatus=='done', userId==멤버,
-#                  changedAt::date == 그 날
+#     - 완료 변경: task_events 의 status 이벤트가 toStatus=='done', user_id==멤버,
+#                  at::date == 그 날
 #     - 댓글 작성: comments.user_id == 멤버 AND comments.created_at::date == 그 날
 #   같은 카드에서 여러 행동이 같은 날 일어나도 1로 카운트 (set).
 #
+# 이벤트 시점에 task_activity_daily 롤업에 기록한다 (app/utils/activity.py).
+#
 # 프로젝트 활동(per project, per day) 도 같은 정의를 멤버 차원 없이 적용:
 #   그 날 활동이 있었던 distinct Task 카드 수
 #
@@ -571,13 +662,6 @@ async def leave_workspace(
 #   기간 내 활동이 있었던 distinct Task 카드 수, 프로젝트별 합계
 
 
-def _utc_date(dt: datetime) -> str:
-    """timezone-aware datetime 을 UTC 날짜 문자열(YYYY-MM-DD) 로."""
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc).strftime("%Y-%m-%d")
-
-
 def _generate_date_range(start: datetime, end: datetime) -> List[str]:
     """[start, end] (UTC 날짜) 사이의 모든 날짜 문자열 리스트 반환."""
     from datetime import timedelta
@@ -594,12 +678,12 @@ def _generate_date_range(start: datetime, end: datetime) -> List[str]:
 async def get_activity_heatmap(
     workspace_id: str,
     weeks: int = 12,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """워크스페이스 멤버별 일일 활동(작업 카드 단위) 히트맵 데이터."""
-    _get_workspace_or_404(db, workspace_id)
-    if not current_user.is_admin and not _is_workspace_member(db, workspace_id, current_user.id):
+    await _get_workspace_or_404(db, workspace_id)
+    if not current_user.is_admin and not await _is_workspace_member(db, workspace_id, current_user.id):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="워크스페이스 멤버가 아닙니다")
 
     weeks = max(1, min(weeks, 52))
@@ -608,71 +692,26 @@ async def get_activity_heatmap(
     to_dt = now_utc.replace(hour=23, minute=59, second=59, microsecond=999999)
     from_dt = (to_dt - timedelta(days=weeks * 7 - 1)).replace(hour=0, minute=0, second=0, microsecond=0)
 
-    # 워크스페이스 프로젝트 + 멤버
-    projects = db.query(Project).filter(Project.workspace_id == workspace_id).all()
-    project_ids = [p.id for p in projects]
-
-    memberships = db.query(WorkspaceMember).filter(
+    # 워크스페이스 멤버
+    memberships = (await db.scalars(select(WorkspaceMember).where(
         WorkspaceMember.workspace_id == workspace_id
-    ).all()
+    ))).all()
     user_ids = [m.user_id for m in memberships]
-    users = db.query(User).filter(User.id.in_(user_ids)).all() if user_ids else []
-    user_by_id = {u.id: u for u in users}
-
-    # 태스크 + 댓글 일괄 fetch
-    tasks = db.query(Task).filter(Task.project_id.in_(project_ids)).all() if project_ids else []
-    task_ids = [t.id for t in tasks]
-    comments = (
-        db.query(Comment).filter(
-            Comment.task_id.in_(task_ids),
-            Comment.created_at >= from_dt,
-            Comment.created_at <= to_dt,
-        ).all() if task_ids else []
-    )
+    users = (await db.scalars(select(User).where(User.id.in_(user_ids)))).all() if user_ids else []
 
-    # (user_id, date) -> set(task_id)
+    # (user_id, date) -> distinct 카드 수 — 롤업 테이블 범위 조회 (PK: workspace_id, activity_date, ...)
     activity: dict = {}
-
-    def add(user_id: str, date_str: str, task_id: str):
-        key = (user_id, date_str)
-        if key not in activity:
-            activity[key] = set()
-        activity[key].add(task_id)
-
-    # 1) 작업 생성
-    for t in tasks:
-        if not t.creator_id or not t.created_at:
-            continue
-        ct = t.created_at if t.created_at.tzinfo else t.created_at.replace(tzinfo=timezone.utc)
-        if ct < from_dt or ct > to_dt:
-            continue
-        add(t.creator_id, _utc_date(ct), t.id)
-
-    # 2) 완료 (status_history toStatus == done)
-    for t in tasks:
-        for h in (t.status_history or []):
-            try:
-                if h.get("toStatus") != "done":
-                    continue
-                uid = h.get("userId")
-                changed_raw = h.get("changedAt")
-                if not uid or not changed_raw:
-                    continue
-                changed_at = datetime.fromisoformat(changed_raw.replace("Z", "+00:00"))
-                if changed_at.tzinfo is None:
-                    changed_at = changed_at.replace(tzinfo=timezone.utc)
-                if changed_at < from_dt or changed_at > to_dt:
-                    continue
-                add(uid, _utc_date(changed_at), t.id)
-            except Exception:
-                continue
-
-    # 3) 댓글
-    for c in comments:
-        if not c.user_id or not c.created_at:
-            continue
-        ct = c.created_at if c.created_at.tzinfo else c.created_at.replace(tzinfo=timezone.utc)
-        add(c.user_id, _utc_date(ct), c.task_id)
+    if user_ids:
+        rows = (await db.execute(
+            select(TaskActivityDaily.user_id, TaskActivityDaily.activity_date, func.count())
+            .where(
+                TaskActivityDaily.workspace_id == workspace_id,
+                TaskActivityDaily.activity_date.between(from_dt.date(), to_dt.date()),
+                TaskActivityDaily.user_id.in_(user_ids),
+            )
+            .group_by(TaskActivityDaily.user_id, TaskActivityDaily.activity_date)
+        )).all()
+        activity = {(uid, d.strftime("%Y-%m-%d")): cnt for uid, d, cnt in rows}
 
     # 응답 생성 — 멤버별 일자 순서 보장
     date_list = _generate_date_range(from_dt, to_dt)
@@ -681,7 +720,7 @@ async def get_activity_heatmap(
         daily = []
         total = 0
         for d in date_list:
-            cnt = len(activity.get((u.id, d), set()))
+            cnt = activity.get((u.id, d), 0)
             total += cnt
             daily.append({"date": d, "count": cnt})
         members_payload.append({
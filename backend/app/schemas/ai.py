@@ -29,3 +29,4 @@ class AIExportRequest(BaseModel):
 class AIExportResponse(BaseModel):
     report: str
     generated_at: datetime
+    from_cache: bool = False
@@ -1,6 +1,7 @@
 """Search response schemas."""
 
-from typing import List
+from datetime import date, datetime
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -8,9 +9,47 @@ from app.schemas.comment import CommentResponse
 from app.schemas.task import TaskResponse
 
 
+class SearchSnippet(BaseModel):
+    """검색어 주변 본문 조각. highlights 는 text 기준 [start, end) 오프셋 목록"""
+    field: str
+    text: str
+    highlights: List[List[int]] = []
+
+
+class MeetingMinutesSearchHit(BaseModel):
+    id: str
+    workspace_id: str
+    title: str
+    category: Optional[str] = ""
+    meeting_date: date
+    creator_id: str
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ChatMessageSearchHit(BaseModel):
+    id: str
+    room_id: str
+    sender_id: str
+    sender_username: str
+    content: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class SearchResponse(BaseModel):
     query: str
     tasks: List[TaskResponse]
     comments: List[CommentResponse]
-    task_total: int = 0
+    meeting_minutes: List[MeetingMinutesSearchHit] = []
+    chat_messages: List[ChatMessageSearchHit] = []
+    # 결과 id -> 하이라이트 스니펫
+    snippets: Dict[str, SearchSnippet] = {}
+    # 커서 모드에서 total=none 이면 None
+    task_total: Optional[int] = 0
     has_more: bool = False
+    next_cursor: Optional[str] = None
@@ -0,0 +1,27 @@
+"""Delta sync response schemas."""
+
+from typing import List
+
+from pydantic import BaseModel
+
+from app.schemas.checklist import ChecklistResponse
+from app.schemas.comment import CommentResponse
+from app.schemas.sprint import SprintResponse
+from app.schemas.task import TaskResponse
+
+
+class SyncDeleted(BaseModel):
+    """삭제된 엔티티 (entity: task | comment | checklist | sprint)"""
+    entity: str
+    id: str
+
+
+class SyncResponse(BaseModel):
+    """since 커서 이후 변경분. has_more 이면 cursor 로 바로 다시 요청한다"""
+    cursor: str
+    has_more: bool = False
+    tasks: List[TaskResponse] = []
+    comments: List[CommentResponse] = []
+    checklists: List[ChecklistResponse] = []
+    sprints: List[SprintResponse] = []
+    deleted: List[SyncDeleted] = []
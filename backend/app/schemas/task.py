@@ -1,7 +1,7 @@
 """
 태스크 관련 Pydantic 스키마
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from app.models.task import TaskStatus, TaskPriority
@@ -52,6 +52,16 @@ class TaskUpdate(BaseModel):
     site_tags: Optional[List[str]] = None  # 사이트 태그
 
 
+class TaskBulkUpdateItem(TaskUpdate):
+    """일괄 수정 항목 — 대상 태스크 id + 바꿀 필드 (TaskUpdate 와 같은 규칙)"""
+    id: str
+
+
+class TaskBulkUpdateRequest(BaseModel):
+    """태스크 일괄 수정 요청 스키마 (전부 적용되거나 전부 취소)"""
+    updates: List[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=500)
+
+
 class TaskReorderRequest(BaseModel):
     """태스크 순서 변경 요청 스키마"""
     task_ids: List[str]
@@ -0,0 +1,99 @@
+"""
+프로젝트 접근 권한 (공용)
+
+접근 규칙: 관리자 OR 프로젝트 생성자 OR 팀원(team_member_ids).
+PM 전체 조회를 허용하는 화면(스프린트 등)은 pm_sees_all=True 로 호출한다.
+
+- project_access_clause / accessible_project_ids_query:
+  호출 측 쿼리에 그대로 끼워 넣는 SQL 조건. 팀원 조건은 `team_member_ids @> ARRAY[:uid]` 로
+  만들어 ix_projects_team_member_ids(GIN) 인덱스를 탄다. (`:uid = ANY(...)` 는 인덱스를 못 쓴다)
+- accessible_project_ids: Python 집합이 필요한 곳용. 사용자별로 캐시하며
+  프로젝트 생성/삭제/팀원 변경 시 invalidate_project_access() 로 비운다 (백플레인으로 다른 워커 포함).
+"""
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import String, cast, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.project import Project
+from app.models.user import User
+from app.utils.cache import TTLCache
+
+# 백플레인 봉투 op
+INVALIDATE_OP = "access_invalidate_projects"
+
+_project_ids_cache = TTLCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.ACCESS_CACHE_TTL)
+
+
+def sees_all_projects(user: User, pm_sees_all: bool = False) -> bool:
+    return user.is_admin or (pm_sees_all and user.is_pm)
+
+
+def can_access_project(project: Project, user: User, pm_sees_all: bool = False) -> bool:
+    """이미 로드한 프로젝트 1건에 대한 권한 판정"""
+    if sees_all_projects(user, pm_sees_all):
+        return True
+    if project.creator_id == user.id:
+        return True
+    return user.id in (project.team_member_ids or [])
+
+
+def project_access_clause(user: User):
+    """Project 행에 대한 접근 조건 (관리자 여부는 호출 측에서 판단)"""
+    return or_(
+        # varchar[] @> text[] 는 연산자가 없으므로 같은 타입으로 캐스팅
+        Project.team_member_ids.op("@>")(cast(array([user.id]), ARRAY(String))),
+        Project.creator_id == user.id,
+    )
+
+
+def accessible_project_ids_query(user: User):
+    """접근 가능한 프로젝트 id 서브쿼리 — `X.project_id.in_(...)` 로 사용"""
+    return select(Project.id).where(project_access_clause(user))
+
+
+def accessible_project_ids(db: Session, user: User) -> Set[str]:
+    """접근 가능한 프로젝트 id 집합 (관리자는 전체). 사용자별 캐시."""
+    key = (user.id, user.is_admin)
+    cached = _project_ids_cache.get(key)
+    if cached is not None:
+        return cached
+    query = select(Project.id)
+    if not user.is_admin:
+        query = query.where(project_access_clause(user))
+    ids = frozenset(db.scalars(query).all())
+    _project_ids_cache.set(key, ids)
+    return ids
+
+
+def invalidate_project_access(user_ids: Optional[Iterable[str]] = None) -> None:
+    """접근 가능 프로젝트 캐시 제거. user_ids 가 없으면 전체 (관리자 항목 포함).
+
+    관리자 캐시는 모든 프로젝트를 담고 있으므로 프로젝트 생성/삭제 시에는 전체를 비운다.
+    """
+    user_ids = [uid for uid in (user_ids or []) if uid]
+    _discard(user_ids)
+    from app.routers.websocket import manager
+
+    manager.publish_control_nowait(INVALIDATE_OP, user_ids)
+
+
+def _discard(user_ids: list) -> None:
+    if not user_ids:
+        _project_ids_cache.clear()
+        return
+    targets = set(user_ids)
+    # 관리자 항목은 팀원 변경과 무관하므로 남긴다
+    _project_ids_cache.discard_where(lambda key, _value: key[0] in targets and not key[1])
+
+
+def handle_invalidation(envelope: dict) -> None:
+    """백플레인 수신 핸들러 — 다른 워커가 보낸 무효화 반영"""
+    _discard(envelope.get("user_ids") or [])
+
+
+def register(manager) -> None:
+    """앱 시작 시 호출 — 무효화 봉투 핸들러 등록"""
+    manager.register_control_handler(INVALIDATE_OP, handle_invalidation)
@@ -0,0 +1,75 @@
+"""
+작업 활동 롤업 (task_activity_daily)
+
+활동 히트맵은 "그 날 멤버가 건드린 distinct 작업 카드 수" 를 보여준다.
+건드림 = 작업 생성 / 완료(done) 로 상태 변경 / 댓글 작성.
+
+매 요청마다 태스크·상태 이력·댓글을 훑는 대신, 이벤트가 일어날 때
+record_task_activity() 로 (워크스페이스, 날짜, 멤버, 카드) 한 행을 같은 트랜잭션에 넣어 둔다.
+이미 있는 행이면 무시(ON CONFLICT DO NOTHING)하므로 distinct 가 유지된다.
+
+    await db.execute(record_task_activity(task.project_id, current_user.id, task.id))   # AsyncSession
+    db.execute(record_task_activity(task.project_id, current_user.id, task.id))         # Session
+
+기존 데이터는 backfill_task_activity() 로 채운다 (여러 번 실행해도 안전).
+"""
+from sqlalchemy import Date, cast, func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Connection
+
+from app.models.project import Project
+from app.models.task_activity import TaskActivityDaily
+
+# (UTC 날짜) — 태스크/댓글 created_at 의 now() 와 같은 트랜잭션 시각을 쓴다
+_UTC_TODAY = cast(func.timezone("UTC", func.now()), Date)
+
+
+def record_task_activity(project_id: str, user_id: str, task_id: str):
+    """활동 1건 INSERT 문. 워크스페이스는 프로젝트에서 찾고, 워크스페이스가 없는 프로젝트는 건너뛴다."""
+    source = select(
+        Project.workspace_id,
+        _UTC_TODAY,
+        literal(user_id),
+        literal(task_id),
+    ).where(Project.id == project_id, Project.workspace_id.isnot(None))
+    return (
+        pg_insert(TaskActivityDaily)
+        .from_select(["workspace_id", "activity_date", "user_id", "task_id"], source)
+        .on_conflict_do_nothing()
+    )
+
+
+# 히트맵 기존 계산과 같은 정의: 생성자·생성일 / done 으로의 상태 변경(task_events) / 댓글 작성
+BACKFILL_SQL = """
+INSERT INTO task_activity_daily (workspace_id, activity_date, user_id, task_id)
+SELECT DISTINCT workspace_id, activity_date, user_id, task_id FROM (
+    SELECT p.workspace_id, (t.created_at AT TIME ZONE 'UTC')::date AS activity_date,
+           t.creator_id AS user_id, t.id AS task_id
+    FROM tasks t JOIN projects p ON p.id = t.project_id
+    WHERE p.workspace_id IS NOT NULL AND t.creator_id IS NOT NULL
+
+    UNION ALL
+
+    SELECT p.workspace_id, (e.at AT TIME ZONE 'UTC')::date, e.user_id, e.task_id
+    FROM task_events e
+    JOIN tasks t ON t.id = e.task_id
+    JOIN projects p ON p.id = t.project_id
+    WHERE p.workspace_id IS NOT NULL
+      AND e.kind = 'status' AND e.data->>'toStatus' = 'done'
+      AND e.user_id IS NOT NULL
+
+    UNION ALL
+
+    SELECT p.workspace_id, (c.created_at AT TIME ZONE 'UTC')::date, c.user_id, c.task_id
+    FROM comments c
+    JOIN tasks t ON t.id = c.task_id
+    JOIN projects p ON p.id = t.project_id
+    WHERE p.workspace_id IS NOT NULL AND c.user_id IS NOT NULL
+) AS activity
+ON CONFLICT DO NOTHING
+"""
+
+
+def backfill_task_activity(conn: Connection) -> int:
+    """기존 태스크/댓글로 롤업을 채운다. 새로 들어간 행 수 반환 (커밋은 호출 측)"""
+    return conn.execute(text(BACKFILL_SQL)).rowcount
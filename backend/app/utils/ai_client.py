@@ -0,0 +1,172 @@
+"""
+AI 텍스트 생성 클라이언트
+
+settings.AI_CLIENT 로 고른다.
+- "gemini" (기본): Gemini Flash 모델을 순서대로 시도 (한 모델이 503 이어도 다른 모델이 될 수 있음)
+- "fake": 외부 호출 없이 프롬프트 해시로 만든 고정 문장을 돌려준다 (로컬 개발 / 사전 생성 스케줄러 테스트용)
+
+테스트에서는 set_ai_client(FakeAIClient(...)) 로 교체한다.
+
+PromptCache: 렌더링한 프롬프트의 sha256 을 키로 결과를 보관 (TTL + LRU). 같은 데이터로 다시 만들면 AI 를 부르지 않고,
+같은 프롬프트가 동시에 들어오면 한 번만 호출해 결과를 나눈다 (single-flight). 프로세스(워커)별 캐시다.
+"""
+import asyncio
+import hashlib
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.utils.cache import TTLCache
+
+# 2.5가 부하로 503을 자주 내면 순차 시도
+GEMINI_MODEL_CHAIN: tuple[str, ...] = (
+    "gemini-2.5-flash",
+    "gemini-2.0-flash",
+    "gemini-1.5-flash",
+)
+
+
+class AILibraryError(Exception):
+    """AI SDK 를 불러오지 못함"""
+
+
+class GeminiClient:
+    name = "gemini"
+    # 모델 전환 사이 대기 (초)
+    FALLBACK_DELAY = 1.0
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self._client = None
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key)
+
+    def _get_client(self):
+        if self._client is None:
+            try:
+                from google import genai
+            except Exception as e:
+                raise AILibraryError(str(e)) from e
+            self._client = genai.Client(api_key=self.api_key)
+        return self._client
+
+    async def generate(self, prompt: str) -> str:
+        client = self._get_client()
+        last_err: Optional[BaseException] = None
+        for i, model in enumerate(GEMINI_MODEL_CHAIN):
+            try:
+                response = await asyncio.to_thread(
+                    client.models.generate_content,
+                    model=model,
+                    contents=prompt,
+                )
+                text = (response.text or "").strip()
+                if text:
+                    return text
+                last_err = RuntimeError("빈 응답")
+            except Exception as e:
+                last_err = e
+            if i < len(GEMINI_MODEL_CHAIN) - 1:
+                await asyncio.sleep(self.FALLBACK_DELAY)
+        if last_err is not None:
+            raise last_err
+        raise RuntimeError("AI 응답 없음")
+
+
+class FakeAIClient:
+    """외부 호출 없는 AI 클라이언트. 같은 프롬프트에는 같은 응답, 받은 프롬프트는 prompts 에 남는다."""
+
+    name = "fake"
+    configured = True
+
+    def __init__(self, delay: float = 0.0, fail: Optional[BaseException] = None):
+        self.delay = delay
+        self.fail = fail
+        self.prompts: List[str] = []
+
+    async def generate(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail is not None:
+            raise self.fail
+        digest = hashlib.sha256(prompt.encode()).hexdigest()[:8]
+        return f"[fake:{digest}] 오늘 브리핑 (프롬프트 {len(prompt)}자)"
+
+
+class PromptCache:
+    """프롬프트 내용 해시 → (생성 결과, 생성 시각)"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.generated = 0
+        self.shared = 0
+
+    @staticmethod
+    def key(client, prompt: str) -> str:
+        return hashlib.sha256(f"{client.name}\0{prompt}".encode()).hexdigest()
+
+    async def generate(self, client, prompt: str) -> Tuple[str, datetime, bool]:
+        """(결과, 생성 시각, 캐시/진행 중 호출 재사용 여부). 실패는 캐시하지 않는다."""
+        key = self.key(client, prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached[0], cached[1], True
+
+        task = self._inflight.get(key)
+        leader = task is None
+        if leader:
+            # 먼저 온 요청이 끊겨도 기다리는 요청이 있으므로 호출은 별도 태스크로 돌린다
+            task = asyncio.create_task(self._run(key, client, prompt))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.shared += 1
+        text, generated_at = await asyncio.shield(task)
+        return text, generated_at, not leader
+
+    async def _run(self, key: str, client, prompt: str) -> Tuple[str, datetime]:
+        text = await client.generate(prompt)
+        generated_at = datetime.now(timezone.utc)
+        self.generated += 1
+        if text:
+            self._cache.set(key, (text, generated_at))
+        return text, generated_at
+
+    def _done(self, key: str, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        # 기다리던 요청이 모두 끊긴 경우 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {**self._cache.stats(), "generated": self.generated, "shared": self.shared, "inflight": len(self._inflight)}
+
+
+# 업무 보고서 (POST /api/ai/export-report) 결과 캐시
+export_report_cache = PromptCache(settings.AI_EXPORT_CACHE_MAX_ENTRIES, settings.AI_EXPORT_CACHE_TTL)
+
+
+_client = None
+
+
+def get_ai_client():
+    global _client
+    if _client is None:
+        if settings.AI_CLIENT == "fake":
+            _client = FakeAIClient()
+        else:
+            _client = GeminiClient(settings.GEMINI_API_KEY)
+    return _client
+
+
+def set_ai_client(client) -> None:
+    """AI 클라이언트 교체 (테스트용). None 이면 설정값으로 다시 만든다."""
+    global _client
+    _client = client
@@ -0,0 +1,168 @@
+"""
+AI 요약 사전 생성 스케줄러
+
+GET /api/ai/summary 는 KST 하루 첫 요청에서 프로젝트 현황을 모으고 Gemini 를 호출(모델 폴백 포함)하므로
+매일 아침 첫 사용자가 오래 기다린다. 이 스케줄러는 한산한 시간(AI_PRECOMPUTE_HOUR_KST 시)에
+최근 AI_PRECOMPUTE_ACTIVE_DAYS 일 안에 조회된 (사용자, 워크스페이스, 범위) 조합의 오늘 요약을 미리 만든다.
+
+- 동시 생성 수는 AI_PRECOMPUTE_CONCURRENCY 로 제한 (AI 쿼터 / DB 부하)
+- 여러 워커 중 advisory lock 을 잡은 한 곳에서만 실행, 이미 오늘 요약이 있는 조합은 건너뜀
+- 정해진 시각 이후에 기동하면 바로 한 번 따라잡는다
+- AI 클라이언트는 app.utils.ai_client 를 쓰므로 AI_CLIENT=fake 또는 run_once(client=FakeAIClient()) 로 외부 호출 없이 돌릴 수 있다
+
+    python scripts/precompute_ai_summaries.py --fake
+"""
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.ai_summary_cache import AiSummaryCache
+from app.models.user import User
+
+_KST = timezone(timedelta(hours=9))
+
+# 여러 워커 중 한 곳에서만 실행 (마이그레이션 러너 LOCK_KEY 와 겹치지 않는 값)
+LOCK_KEY = 72_0418_0024
+
+
+class Target(NamedTuple):
+    user_id: str
+    workspace_id: Optional[str]
+    scope: str
+
+
+def active_targets(db: Session, today: date) -> List[Target]:
+    """최근 조회 이력이 있고 오늘 요약이 아직 없는 (사용자, 워크스페이스, 범위)"""
+    since = today - timedelta(days=settings.AI_PRECOMPUTE_ACTIVE_DAYS)
+    recent = (
+        db.query(AiSummaryCache.user_id, AiSummaryCache.workspace_id, AiSummaryCache.summary_scope)
+        .join(User, User.id == AiSummaryCache.user_id)
+        .filter(
+            AiSummaryCache.summary_date >= since,
+            AiSummaryCache.summary_date < today,
+            User.is_approved.is_(True),
+        )
+        .distinct()
+        .all()
+    )
+    done = set(
+        db.query(AiSummaryCache.user_id, AiSummaryCache.workspace_id, AiSummaryCache.summary_scope)
+        .filter(AiSummaryCache.summary_date == today)
+        .all()
+    )
+    return [Target(*row) for row in recent if tuple(row) not in done]
+
+
+def seconds_until_next_run(now: Optional[datetime] = None) -> float:
+    now = now or datetime.now(_KST)
+    run_at = now.replace(hour=settings.AI_PRECOMPUTE_HOUR_KST, minute=0, second=0, microsecond=0)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    return (run_at - now).total_seconds()
+
+
+async def precompute(client=None, concurrency: Optional[int] = None) -> dict:
+    """오늘 요약 사전 생성. {"targets", "generated", "skipped", "failed", "seconds"} 를 돌려준다."""
+    from app.database import SessionLocal
+    from app.routers.ai import find_cached_summary, generate_summary
+    from app.utils.ai_client import get_ai_client
+
+    client = client or get_ai_client()
+    today = datetime.now(_KST).date()
+    db = SessionLocal()
+    try:
+        targets = active_targets(db, today)
+    finally:
+        db.close()
+
+    counts = {"targets": len(targets), "generated": 0, "skipped": 0, "failed": 0}
+    semaphore = asyncio.Semaphore(max(1, concurrency or settings.AI_PRECOMPUTE_CONCURRENCY))
+    started = time.perf_counter()
+
+    async def _one(target: Target) -> None:
+        async with semaphore:
+            db = SessionLocal()
+            try:
+                user = db.get(User, target.user_id)
+                # 사용자가 먼저 조회해서 만들어졌으면 건너뜀
+                if user is None or find_cached_summary(db, user.id, target.workspace_id, target.scope, today):
+                    counts["skipped"] += 1
+                    return
+                await generate_summary(db, user, target.workspace_id, target.scope, client)
+                counts["generated"] += 1
+            except Exception as e:
+                db.rollback()
+                counts["failed"] += 1
+                print(f"[ai_precompute] failed for user={target.user_id} workspace={target.workspace_id} "
+                      f"scope={target.scope}: {e}")
+            finally:
+                db.close()
+
+    await asyncio.gather(*(_one(target) for target in targets))
+    counts["seconds"] = round(time.perf_counter() - started, 1)
+    print(
+        f"[ai_precompute] {today}: {counts['generated']} generated, {counts['skipped']} skipped, "
+        f"{counts['failed']} failed of {counts['targets']} ({counts['seconds']}s)"
+    )
+    return counts
+
+
+class AISummaryScheduler:
+    """매일 AI_PRECOMPUTE_HOUR_KST 시에 precompute() 실행"""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Optional[dict] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running or not settings.AI_PRECOMPUTE_ENABLED:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self, client=None) -> Optional[dict]:
+        """다른 워커가 실행 중이면 None"""
+        from app.database import engine
+
+        # 세션 단위 잠금을 트랜잭션 밖(AUTOCOMMIT)에서 잡는다 — 실행 내내 idle in transaction 으로 남으면
+        # idle_in_transaction_session_timeout 에 끊겨 잠금이 풀린다
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            if not conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": LOCK_KEY}).scalar():
+                return None
+            try:
+                self.last_run = await precompute(client)
+                return self.last_run
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": LOCK_KEY})
+
+    async def _loop(self) -> None:
+        # 오늘 실행 시각이 이미 지났으면 바로 따라잡기 (이미 만든 요약은 건너뛰므로 재기동해도 중복 생성 없음)
+        delay = 0.0 if datetime.now(_KST).hour >= settings.AI_PRECOMPUTE_HOUR_KST else seconds_until_next_run()
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"[ai_precompute] run failed: {e}")
+            delay = seconds_until_next_run()
+
+
+scheduler = AISummaryScheduler()
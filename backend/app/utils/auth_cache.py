@@ -0,0 +1,104 @@
+"""
+인증 캐시 (get_current_user 용)
+
+- JWT 디코드 캐시: sha256(token) -> payload. 토큰 만료 시각을 넘겨 보관하지 않는다.
+- 사용자 캐시: user_id -> User 컬럼 스냅샷 (승인된 사용자만).
+  요청마다 스냅샷으로 새 User 인스턴스를 만들어 돌려주므로 세션에 붙어 있지 않다.
+  current_user 를 수정해 저장해야 하는 곳은 db 에서 다시 조회한 뒤 invalidate_user() 를 호출한다.
+
+권한/프로필이 바뀌면 invalidate_user() 로 즉시 제거하고, 백플레인으로 다른 워커에도 알린다.
+백플레인이 닿지 않는 경우에도 AUTH_USER_CACHE_TTL 이 지나면 DB 에서 다시 읽는다.
+"""
+import hashlib
+import time
+from typing import Iterable, Optional
+
+from app.config import settings
+from app.models.user import User
+from app.utils.cache import TTLCache
+from app.utils.security import decode_access_token
+
+# 백플레인 봉투 op
+INVALIDATE_OP = "auth_invalidate_user"
+
+_USER_COLUMNS = [column.key for column in User.__table__.columns]
+
+_token_cache = TTLCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_TOKEN_CACHE_TTL)
+_user_cache = TTLCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_USER_CACHE_TTL)
+
+
+def decode_token_cached(token: str) -> Optional[dict]:
+    """decode_access_token 과 같지만 같은 토큰의 서명 검증은 한 번만 한다."""
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is not None and exp <= time.time():
+            _token_cache.pop(key)
+            return None
+        return payload
+
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+    ttl = _token_cache.ttl
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        _token_cache.set(key, payload, ttl=ttl)
+    return payload
+
+
+def get_cached_user(user_id: str) -> Optional[User]:
+    snapshot = _user_cache.get(user_id)
+    if snapshot is None:
+        return None
+    return _from_snapshot(snapshot)
+
+
+def cache_user(user: User) -> User:
+    """사용자 스냅샷을 캐시에 넣고, 세션과 분리된 인스턴스를 돌려준다."""
+    snapshot = {key: getattr(user, key) for key in _USER_COLUMNS}
+    if user.is_approved:
+        _user_cache.set(user.id, snapshot)
+    return _from_snapshot(snapshot)
+
+
+def _from_snapshot(snapshot: dict) -> User:
+    # 배열 컬럼은 복사 — 요청 중 변경이 캐시 스냅샷으로 새지 않도록
+    return User(**{k: list(v) if isinstance(v, list) else v for k, v in snapshot.items()})
+
+
+def invalidate_user(user_id: str) -> None:
+    """사용자 캐시 제거 (이 워커 + 백플레인으로 다른 워커)"""
+    invalidate_users([user_id])
+
+
+def invalidate_users(user_ids: Iterable[str]) -> None:
+    user_ids = [uid for uid in user_ids if uid]
+    for uid in user_ids:
+        _user_cache.pop(uid)
+    if user_ids:
+        _publish_invalidation(user_ids)
+
+
+def _publish_invalidation(user_ids: list) -> None:
+    from app.routers.websocket import manager
+
+    manager.publish_control_nowait(INVALIDATE_OP, user_ids)
+
+
+def handle_invalidation(envelope: dict) -> None:
+    """백플레인 수신 핸들러 — 다른 워커가 보낸 무효화 반영"""
+    for uid in envelope.get("user_ids") or []:
+        _user_cache.pop(uid)
+
+
+def register(manager) -> None:
+    """앱 시작 시 호출 — 무효화 봉투 핸들러 등록"""
+    manager.register_control_handler(INVALIDATE_OP, handle_invalidation)
+
+
+def stats() -> dict:
+    return {"tokens": _token_cache.stats(), "users": _user_cache.stats()}
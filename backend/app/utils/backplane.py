@@ -0,0 +1,216 @@
+"""
+WebSocket 이벤트 백플레인 (워커/노드 간 팬아웃)
+
+ConnectionManager 는 자기 프로세스에 붙은 소켓만 알고 있으므로, 다른 워커에 연결된
+사용자에게 이벤트를 보내려면 모든 워커가 같은 이벤트를 받아야 한다.
+백플레인은 "봉투(envelope)" 를 모든 워커에 전달하고, 각 워커는 자기 로컬 연결로만 전송한다.
+
+- memory   : 단일 프로세스용 (기본값). publish 즉시 로컬 핸들러 호출.
+- postgres : Postgres LISTEN/NOTIFY 사용. 추가 인프라 없이 멀티 워커/멀티 노드 지원.
+
+봉투 형식:
+    {"origin": <node_id>, "op": "user" | "users" | "broadcast",
+     "user_ids": [...], "exclude_user_id": str | None, "message": {...}}
+"""
+import asyncio
+import json
+import uuid
+from typing import Awaitable, Callable, Optional
+
+from app.config import settings
+
+EnvelopeHandler = Callable[[dict], Awaitable[None]]
+
+# 프로세스 고유 ID — 자기 자신이 보낸 봉투는 이미 로컬 전달했으므로 무시한다
+NODE_ID = uuid.uuid4().hex
+
+
+class Backplane:
+    """백플레인 인터페이스"""
+
+    def __init__(self):
+        self._handler: Optional[EnvelopeHandler] = None
+
+    async def start(self, handler: EnvelopeHandler) -> None:
+        self._handler = handler
+
+    async def stop(self) -> None:
+        self._handler = None
+
+    async def publish(self, envelope: dict) -> None:
+        raise NotImplementedError
+
+    async def _dispatch(self, envelope: dict) -> None:
+        if self._handler is None:
+            return
+        try:
+            await self._handler(envelope)
+        except Exception as e:
+            print(f"[Backplane] 봉투 처리 실패: {e}")
+
+
+class InMemoryBackplane(Backplane):
+    """단일 프로세스 백플레인 — 별도 전송 없이 바로 로컬 핸들러로 전달"""
+
+    async def publish(self, envelope: dict) -> None:
+        await self._dispatch(envelope)
+
+
+class PostgresBackplane(Backplane):
+    """Postgres LISTEN/NOTIFY 백플레인
+
+    - 전용 asyncpg 연결 1개로 LISTEN, 끊기면 지수 백오프로 재연결
+    - 발행한 워커는 즉시 로컬 전달하고, 다른 워커만 NOTIFY 로 받는다
+    - NOTIFY payload 는 8000 byte 제한이 있으므로 큰 메시지는 ws_backplane_messages 테이블에
+      저장하고 id 만 NOTIFY 로 보낸다 (수신 측이 조회)
+    """
+
+    # NOTIFY payload 상한(8000 byte) 보다 여유 있게
+    MAX_INLINE_PAYLOAD = 7000
+    # 큰 메시지 보관 기간 — 모든 워커가 읽어 갈 시간
+    SPILL_RETENTION_SECONDS = 300
+
+    def __init__(self, dsn: str, channel: str = "ws_events"):
+        super().__init__()
+        self._dsn = dsn
+        self._channel = channel
+        self._listen_conn = None
+        self._publish_conn = None
+        self._publish_lock = asyncio.Lock()
+        # asyncpg 연결은 동시에 한 쿼리만 실행 가능
+        self._listen_lock = asyncio.Lock()
+        self._runner: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self, handler: EnvelopeHandler) -> None:
+        await super().start(handler)
+        self._stopping = False
+        await self._ensure_spill_table()
+        self._runner = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._runner:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._runner = None
+        for conn in (self._listen_conn, self._publish_conn):
+            if conn is not None and not conn.is_closed():
+                await conn.close()
+        self._listen_conn = None
+        self._publish_conn = None
+        await super().stop()
+
+    async def publish(self, envelope: dict) -> None:
+        # 발행 워커의 로컬 연결은 즉시 전달 (NOTIFY 왕복 대기 없음)
+        await self._dispatch(envelope)
+
+        payload = json.dumps(envelope, ensure_ascii=False, default=str)
+        try:
+            async with self._publish_lock:
+                conn = await self._get_publish_conn()
+                if len(payload.encode("utf-8")) > self.MAX_INLINE_PAYLOAD:
+                    ref = await conn.fetchval(
+                        "INSERT INTO ws_backplane_messages (payload) VALUES ($1) RETURNING id",
+                        payload,
+                    )
+                    payload = json.dumps({"origin": envelope.get("origin"), "ref": ref})
+                await conn.execute("SELECT pg_notify($1, $2)", self._channel, payload)
+        except Exception as e:
+            print(f"[Backplane] NOTIFY 발행 실패: {e}")
+            self._publish_conn = None
+
+    async def _connect(self):
+        import asyncpg
+
+        return await asyncpg.connect(self._dsn)
+
+    async def _get_publish_conn(self):
+        if self._publish_conn is None or self._publish_conn.is_closed():
+            self._publish_conn = await self._connect()
+        return self._publish_conn
+
+    async def _ensure_spill_table(self) -> None:
+        try:
+            async with self._publish_lock:
+                conn = await self._get_publish_conn()
+                await conn.execute("""
+                    CREATE UNLOGGED TABLE IF NOT EXISTS ws_backplane_messages (
+                        id BIGSERIAL PRIMARY KEY,
+                        payload TEXT NOT NULL,
+                        created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                    )
+                """)
+        except Exception as e:
+            print(f"[Backplane] ws_backplane_messages 테이블 확인 실패: {e}")
+            self._publish_conn = None
+
+    async def _listen_forever(self) -> None:
+        backoff = 1.0
+        while not self._stopping:
+            closed = asyncio.Event()
+            try:
+                self._listen_conn = await self._connect()
+                self._listen_conn.add_termination_listener(lambda _conn: closed.set())
+                await self._listen_conn.add_listener(self._channel, self._on_notify)
+                print(f"[Backplane] LISTEN {self._channel} (node={NODE_ID[:8]})")
+                backoff = 1.0
+                while not closed.is_set():
+                    # 주기적으로 오래된 대용량 메시지 정리
+                    try:
+                        await asyncio.wait_for(closed.wait(), timeout=self.SPILL_RETENTION_SECONDS)
+                    except asyncio.TimeoutError:
+                        await self._purge_spilled()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[Backplane] LISTEN 연결 실패, {backoff:.0f}초 후 재시도: {e}")
+            if self._stopping:
+                break
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def _on_notify(self, _conn, _pid, _channel, payload: str) -> None:
+        asyncio.create_task(self._handle_notify(payload))
+
+    async def _handle_notify(self, payload: str) -> None:
+        try:
+            envelope = json.loads(payload)
+            if envelope.get("origin") == NODE_ID:
+                return
+            ref = envelope.get("ref")
+            if ref is not None:
+                async with self._listen_lock:
+                    raw = await self._listen_conn.fetchval(
+                        "SELECT payload FROM ws_backplane_messages WHERE id = $1", ref
+                    )
+                if raw is None:
+                    return
+                envelope = json.loads(raw)
+        except Exception as e:
+            print(f"[Backplane] NOTIFY 수신 처리 실패: {e}")
+            return
+        await self._dispatch(envelope)
+
+    async def _purge_spilled(self) -> None:
+        try:
+            async with self._listen_lock:
+                await self._listen_conn.execute(
+                    "DELETE FROM ws_backplane_messages WHERE created_at < now() - make_interval(secs => $1)",
+                    float(self.SPILL_RETENTION_SECONDS),
+                )
+        except Exception as e:
+            print(f"[Backplane] 대용량 메시지 정리 실패: {e}")
+
+
+def create_backplane() -> Backplane:
+    """설정(WS_BACKPLANE)에 따라 백플레인 구현 선택"""
+    kind = (settings.WS_BACKPLANE or "memory").lower()
+    if kind == "postgres":
+        from app.database import DATABASE_URL
+
+        return PostgresBackplane(DATABASE_URL)
+    return InMemoryBackplane()
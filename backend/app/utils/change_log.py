@@ -0,0 +1,104 @@
+"""
+델타 동기화 변경 로그 (change_log)
+
+추적 테이블의 INSERT/UPDATE/DELETE 는 행 트리거 dora_record_change() 가 change_log 에 기록한다.
+라우터마다 기록 코드를 넣지 않아도 되고, 일괄 UPDATE(정렬 변경 등)나 외부 API 경로도 빠지지 않는다.
+
+- 엔티티마다 한 행만 유지한다 (ON CONFLICT 갱신). 삭제는 op='delete' 톰스톤으로 남는다.
+- 자식 행(체크리스트 항목, 댓글 리액션) 변경은 부모 엔티티 변경으로 기록한다.
+  응답이 부모 단위(항목 포함 체크리스트, 리액션 포함 댓글)이기 때문이다.
+
+커서 규칙: 행마다 기록한 트랜잭션의 xid 를 저장하고 (xid, seq) 순으로 읽는다.
+seq 만으로 읽으면 먼저 seq 를 받고 늦게 커밋한 트랜잭션의 행을 건너뛸 수 있다.
+그래서 조회 시점의 스냅샷 xmin(아직 진행 중인 가장 오래된 트랜잭션) 보다 작은 xid 만 돌려준다 —
+그보다 작은 트랜잭션은 모두 끝났으므로 나중에 더 작은 커서의 행이 나타나지 않는다.
+오래 열린 트랜잭션이 있으면 그 동안은 새 변경이 전달되지 않고 대기할 뿐 유실되지는 않는다.
+"""
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TASK = "task"
+COMMENT = "comment"
+CHECKLIST = "checklist"
+SPRINT = "sprint"
+
+UPSERT = "upsert"
+DELETE = "delete"
+
+# 테이블 -> (엔티티, 엔티티 id 컬럼, 부모 테이블)
+TRACKED_TABLES: Dict[str, Tuple[str, str, Optional[str]]] = {
+    "tasks": (TASK, "id", None),
+    "comments": (COMMENT, "id", None),
+    "comment_reactions": (COMMENT, "comment_id", "comments"),
+    "checklists": (CHECKLIST, "id", None),
+    "checklist_items": (CHECKLIST, "checklist_id", "checklists"),
+    "sprints": (SPRINT, "id", None),
+}
+
+RECORD_CHANGE_SQL = """
+CREATE OR REPLACE FUNCTION dora_record_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    entity text := TG_ARGV[0];
+    id_column text := TG_ARGV[1];
+    parent_table text := CASE WHEN TG_NARGS > 2 THEN TG_ARGV[2] END;
+    r jsonb;
+    target_id text;
+    change_op text;
+    project text;
+BEGIN
+    r := to_jsonb(CASE WHEN TG_OP = 'DELETE' THEN OLD ELSE NEW END);
+    -- 값이 그대로인 UPDATE 는 무시 (json 컬럼은 = 가 없어 행 비교 대신 jsonb 로 비교)
+    IF TG_OP = 'UPDATE' AND r = to_jsonb(OLD) THEN
+        RETURN NULL;
+    END IF;
+    target_id := r->>id_column;
+    change_op := CASE WHEN TG_OP = 'DELETE' THEN 'delete' ELSE 'upsert' END;
+
+    IF parent_table IS NOT NULL THEN
+        -- 자식 변경 = 부모 갱신. 부모가 이미 지워졌으면(같이 삭제 중) 톰스톤을 덮지 않는다
+        EXECUTE format('SELECT to_jsonb(p) FROM %I p WHERE p.id = $1', parent_table) INTO r USING target_id;
+        IF r IS NULL THEN
+            RETURN NULL;
+        END IF;
+        change_op := 'upsert';
+    END IF;
+
+    project := r->>'project_id';
+    IF project IS NULL AND r ? 'task_id' THEN
+        SELECT t.project_id INTO project FROM tasks t WHERE t.id = r->>'task_id';
+    END IF;
+
+    INSERT INTO change_log (entity, entity_id, project_id, op, xid)
+    VALUES (entity, target_id, project, change_op, pg_current_xact_id()::text::bigint)
+    ON CONFLICT (entity, entity_id) DO UPDATE
+    SET project_id = COALESCE(EXCLUDED.project_id, change_log.project_id),
+        op = EXCLUDED.op,
+        xid = EXCLUDED.xid,
+        seq = nextval('change_log_seq'),
+        changed_at = now();
+    RETURN NULL;
+END
+$$
+"""
+
+
+def ensure_change_log_triggers(conn: Connection) -> None:
+    """dora_record_change() 함수와 추적 테이블 트리거 생성 (여러 번 실행해도 안전)"""
+    conn.execute(text(RECORD_CHANGE_SQL))
+    for table, (entity, id_column, parent_table) in TRACKED_TABLES.items():
+        args = ", ".join(f"'{a}'" for a in (entity, id_column, parent_table) if a)
+        conn.execute(text(f"DROP TRIGGER IF EXISTS trg_{table}_change_log ON {table}"))
+        conn.execute(text(
+            f"CREATE TRIGGER trg_{table}_change_log "
+            f"AFTER INSERT OR UPDATE OR DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION dora_record_change({args})"
+        ))
+
+
+async def sync_horizon(db: AsyncSession) -> int:
+    """이 xid 미만의 트랜잭션은 모두 끝났다 — 동기화 응답은 이보다 작은 xid 만 담는다"""
+    return int(await db.scalar(text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")))
@@ -0,0 +1,256 @@
+"""
+GitHub 커밋 그래프 캐시 (github_commits / github_branch_heads)
+
+그래프 요청마다 브랜치 수만큼 get_commits 를 부르는 대신, 프로젝트별 커밋 DAG 를 Postgres 에 쌓아 두고
+- sync_commit_graph(): 브랜치 head 가 바뀐(또는 새로 생긴) 브랜치만 GitHub 에서 새 커밋을 가져온다.
+  head 에서 시작해 이미 아는 커밋을 만날 때까지 부모 방향으로 걷는다 (한 번에 최대 MAX_WALK_PAGES 페이지).
+  브랜치가 삭제/이동하면 어떤 head 에서도 닿지 않는 커밋을 지운다 (force push 대응).
+- graph_page(): 페이지를 DB 에서 만든다. 캐시가 모자라고 끊긴 이력(부모가 캐시에 없는 커밋)이 있으면
+  그 부모부터 필요한 만큼만 더 가져온다.
+
+브랜치/태그 목록 자체는 github_api 클라이언트 캐시(ETag 재검증)를 타므로 head 가 그대로면 304 로 끝난다.
+"""
+import asyncio
+import heapq
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.github import GitHubBranchHead, GitHubCommit, ProjectGitHub
+from app.utils.github_api import GitHubApiError, get_commits
+
+PAGE_SIZE = 100
+# 동기화 한 번에 GitHub 에서 가져올 최대 커밋 페이지 수 (나머지는 graph_page 가 필요할 때 이어서)
+MAX_WALK_PAGES = 10
+
+ORDER_DATE = "date"
+ORDER_TOPO = "topo"
+
+# 같은 프로젝트를 동시에 동기화하지 않도록 — 워커 안에서는 asyncio.Lock, 워커 사이에서는 트랜잭션 advisory lock
+# (다른 워커의 prune 이 옛 head 기준으로 방금 넣은 커밋을 지우면 그래프에 영구 구멍이 생긴다)
+_locks: Dict[str, asyncio.Lock] = {}
+# advisory lock 대기 간격 (초) — 블로킹 pg_advisory_xact_lock 은 이벤트 루프를 멈추므로 try 로 폴링
+_LOCK_POLL_INTERVAL = 0.2
+
+_OPEN_PARENTS_SQL = text("""
+    SELECT DISTINCT p.sha
+    FROM github_commits c, unnest(c.parents) AS p(sha)
+    WHERE c.project_id = :project_id
+      AND NOT EXISTS (
+          SELECT 1 FROM github_commits k WHERE k.project_id = :project_id AND k.sha = p.sha
+      )
+""")
+
+_PRUNE_SQL = text("""
+    WITH RECURSIVE reach(sha) AS (
+        SELECT unnest(CAST(:heads AS VARCHAR[]))
+        UNION
+        SELECT unnest(c.parents)
+        FROM github_commits c
+        JOIN reach r ON c.project_id = :project_id AND c.sha = r.sha
+    )
+    DELETE FROM github_commits
+    WHERE project_id = :project_id AND sha NOT IN (SELECT sha FROM reach)
+""")
+
+
+async def _lock_project(db: Session, project_id: str) -> None:
+    """현재 트랜잭션이 끝날 때(commit/rollback)까지 프로젝트 그래프 잠금"""
+    while not db.execute(
+        text("SELECT pg_try_advisory_xact_lock(hashtext('commit_graph:' || :project_id))"),
+        {"project_id": project_id},
+    ).scalar():
+        await asyncio.sleep(_LOCK_POLL_INTERVAL)
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _commit_row(project_id: str, item: dict) -> dict:
+    commit = item.get("commit", {})
+    author = commit.get("author") or {}
+    gh_author = item.get("author") or {}
+    date = author.get("date", "")
+    return {
+        "project_id": project_id,
+        "sha": item.get("sha", ""),
+        "message": commit.get("message", ""),
+        "author_name": author.get("name", ""),
+        "author_email": author.get("email"),
+        "author_avatar_url": gh_author.get("avatar_url"),
+        "date": date,
+        "committed_at": _parse_date(date),
+        "url": item.get("html_url", ""),
+        "parents": [p.get("sha", "") for p in item.get("parents", [])],
+    }
+
+
+async def _walk(
+    db: Session, gh: ProjectGitHub, token: Optional[str], starts: Iterable[str], known: Set[str], max_pages: int
+) -> Tuple[bool, int]:
+    """starts 에서 부모 방향으로 아는 커밋을 만날 때까지 가져와 저장. (첫 요청 성공 여부, 사용한 페이지 수)"""
+    frontier = [sha for sha in starts if sha not in known]
+    first_ok = True
+    pages = 0
+    while frontier and pages < max_pages:
+        start = frontier.pop()
+        if start in known:
+            continue
+        try:
+            items = await get_commits(gh.repo_owner, gh.repo_name, token, start, 1, PAGE_SIZE)
+        except GitHubApiError as e:
+            print(f"[commit_graph] failed to fetch {gh.repo_owner}/{gh.repo_name}@{start[:7]}: {e}")
+            if pages == 0:
+                first_ok = False
+            pages += 1
+            continue
+        pages += 1
+        rows = [_commit_row(gh.project_id, item) for item in items if item.get("sha") and item["sha"] not in known]
+        if rows:
+            db.execute(pg_insert(GitHubCommit).values(rows).on_conflict_do_nothing())
+        known.update(row["sha"] for row in rows)
+        for row in rows:
+            frontier.extend(p for p in row["parents"] if p and p not in known)
+        frontier = list(dict.fromkeys(frontier))
+    return first_ok, pages
+
+
+async def sync_commit_graph(db: Session, gh: ProjectGitHub, token: Optional[str], branches: List[dict]) -> int:
+    """브랜치 목록(GitHub 응답)에 맞춰 캐시를 갱신. GitHub 커밋 API 호출 수를 돌려준다."""
+    project_id = gh.project_id
+    lock = _locks.setdefault(project_id, asyncio.Lock())
+    async with lock:
+        # 저장된 head 를 읽기 전에 잠가 walk / head 갱신 / prune 까지 한 트랜잭션으로 묶는다
+        await _lock_project(db, project_id)
+        heads = {b.get("name", ""): b.get("commit", {}).get("sha", "") for b in branches if b.get("name")}
+        stored = {
+            row.name: row.sha
+            for row in db.query(GitHubBranchHead).filter(GitHubBranchHead.project_id == project_id).all()
+        }
+        moved = {name: sha for name, sha in heads.items() if sha and stored.get(name) != sha}
+        removed = [name for name in stored if name not in heads]
+        if not moved and not removed:
+            db.commit()
+            return 0
+
+        known = {
+            sha for (sha,) in db.query(GitHubCommit.sha).filter(GitHubCommit.project_id == project_id).all()
+        }
+        # 페이지 예산은 브랜치마다가 아니라 동기화 한 번 전체에 적용 — 다 쓰면 남은 브랜치는 다음 동기화로 미룬다
+        calls = 0
+        synced = []
+        for name, sha in moved.items():
+            if calls >= MAX_WALK_PAGES:
+                break
+            ok, pages = await _walk(db, gh, token, [sha], known, MAX_WALK_PAGES - calls)
+            calls += pages
+            if ok:
+                synced.append(name)
+
+        for name in synced:
+            db.execute(
+                pg_insert(GitHubBranchHead)
+                .values(project_id=project_id, name=name, sha=moved[name])
+                .on_conflict_do_update(
+                    index_elements=["project_id", "name"], set_={"sha": moved[name], "updated_at": text("now()")}
+                )
+            )
+        if removed:
+            db.query(GitHubBranchHead).filter(
+                GitHubBranchHead.project_id == project_id, GitHubBranchHead.name.in_(removed)
+            ).delete(synchronize_session=False)
+        # 삭제되었거나 다른 곳으로 옮겨진 브랜치가 있으면 닿지 않는 커밋 정리
+        # (가져오지 못한 브랜치는 이전 head 기준으로 남겨 둔다)
+        if removed or any(name in stored for name in synced):
+            reach_from = [
+                stored.get(name) if name in moved and name not in synced else sha for name, sha in heads.items()
+            ]
+            db.execute(_PRUNE_SQL, {"project_id": project_id, "heads": [sha for sha in reach_from if sha]})
+        db.commit()
+        return calls
+
+
+def _topo_order(db: Session, project_id: str) -> List[str]:
+    """자식이 항상 부모보다 앞에 오는 순서 (같은 단계에서는 최신 커밋 우선)"""
+    nodes = db.query(GitHubCommit.sha, GitHubCommit.parents, GitHubCommit.committed_at).filter(
+        GitHubCommit.project_id == project_id
+    ).all()
+    children: Dict[str, int] = {sha: 0 for sha, _, _ in nodes}
+    for _, parents, _ in nodes:
+        for parent in parents or []:
+            if parent in children:
+                children[parent] += 1
+    info = {sha: (parents or [], committed_at) for sha, parents, committed_at in nodes}
+
+    def _key(sha: str):
+        committed_at = info[sha][1]
+        return (-committed_at.timestamp() if committed_at else 0.0, sha)
+
+    ready = [(_key(sha), sha) for sha, count in children.items() if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, sha = heapq.heappop(ready)
+        order.append(sha)
+        for parent in info[sha][0]:
+            if parent in children:
+                children[parent] -= 1
+                if children[parent] == 0:
+                    heapq.heappush(ready, (_key(parent), parent))
+    return order
+
+
+async def graph_page(
+    db: Session,
+    gh: ProjectGitHub,
+    token: Optional[str],
+    page: int,
+    per_page: int,
+    order: str = ORDER_DATE,
+) -> Tuple[List[GitHubCommit], bool]:
+    """캐시에서 그래프 페이지를 만든다. (커밋 목록, has_more)"""
+    project_id = gh.project_id
+    needed = page * per_page + 1
+    base = db.query(GitHubCommit).filter(GitHubCommit.project_id == project_id)
+
+    # 캐시가 요청 범위보다 적으면 끊긴 이력을 필요한 만큼 이어 붙인다
+    open_parents = [sha for (sha,) in db.execute(_OPEN_PARENTS_SQL, {"project_id": project_id})]
+    count = base.count()
+    if open_parents and count < needed:
+        await _lock_project(db, project_id)
+        known = {sha for (sha,) in db.query(GitHubCommit.sha).filter(GitHubCommit.project_id == project_id).all()}
+        max_pages = -(-(needed - count) // PAGE_SIZE) + 1
+        await _walk(db, gh, token, open_parents, known, max_pages)
+        db.commit()
+        open_parents = [sha for (sha,) in db.execute(_OPEN_PARENTS_SQL, {"project_id": project_id})]
+
+    offset = (page - 1) * per_page
+    if order == ORDER_TOPO:
+        shas = _topo_order(db, project_id)
+        page_shas = shas[offset:offset + per_page]
+        by_sha = {c.sha: c for c in base.filter(GitHubCommit.sha.in_(page_shas)).all()} if page_shas else {}
+        commits = [by_sha[sha] for sha in page_shas if sha in by_sha]
+        has_more = len(shas) > offset + per_page
+    else:
+        rows = (
+            base.order_by(GitHubCommit.committed_at.desc().nullslast(), GitHubCommit.sha)
+            .offset(offset)
+            .limit(per_page + 1)
+            .all()
+        )
+        commits = rows[:per_page]
+        has_more = len(rows) > per_page
+    return commits, has_more or bool(open_parents)
+
+
+def clear_commit_graph(db: Session, project_id: str) -> None:
+    """레포 연결이 바뀌면 캐시 삭제 (커밋은 호출 측)"""
+    db.query(GitHubCommit).filter(GitHubCommit.project_id == project_id).delete(synchronize_session=False)
+    db.query(GitHubBranchHead).filter(GitHubBranchHead.project_id == project_id).delete(synchronize_session=False)
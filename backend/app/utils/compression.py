@@ -0,0 +1,181 @@
+"""
+응답 압축 미들웨어 (brotli / gzip)
+
+Accept-Encoding 을 보고 br(brotli 모듈이 있을 때) > gzip 순으로 고른다. q=0 으로 거부한 인코딩은 쓰지 않는다.
+- minimum_size 보다 작은 응답, 이미 인코딩된 응답, 압축 효과가 없는 타입(이미지 등)은 그대로 보낸다.
+- 압축하면 Vary: Accept-Encoding 을 붙이고 ETag 를 약한 ETag(W/"...")로 바꾼다 —
+  바이트가 달라지므로 강한 ETag 를 그대로 두면 안 된다. If-None-Match 비교는 약한 비교라 304 는 그대로 동작한다.
+- 스트리밍 응답은 청크마다 flush 해서 지연 없이 내보낸다.
+"""
+from typing import Optional
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 에서 쓸 인코딩 ("br" | "gzip" | None)"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[token] = q
+
+    def allowed(name: str) -> bool:
+        return accepted.get(name, accepted.get("*", 0.0)) > 0
+
+    if brotli is not None and allowed("br"):
+        return "br"
+    if allowed("gzip"):
+        return "gzip"
+    return None
+
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip 헤더
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    """Vary: Accept-Encoding (이미 있으면 그대로 — 조건부 GET 응답은 미리 붙여 둔다)"""
+    vary = headers.get("vary", "")
+    if "accept-encoding" not in vary.lower() and vary.strip() != "*":
+        headers.add_vary_header("Accept-Encoding")
+
+
+def _compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+            if encoding is not None:
+                encoder = (
+                    _BrotliEncoder(self.brotli_quality) if encoding == "br" else _GzipEncoder(self.gzip_level)
+                )
+                responder = _CompressionResponder(self.app, encoding, encoder, self.minimum_size)
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, encoder, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.encoder = encoder
+        self.minimum_size = minimum_size
+        self.send: Optional[Send] = None
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    def _encode_headers(self, start: Message, length: Optional[int]) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        _add_vary(headers)
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    def _encode(self, body: bytes, more_body: bool) -> bytes:
+        return self.encoder.compress(body) + (self.encoder.flush() if more_body else self.encoder.finish())
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # 본문 첫 청크를 보고 압축 여부를 정할 때까지 헤더를 보류
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is None:
+            # 스트리밍 응답의 이후 청크
+            if not self.passthrough:
+                message = {**message, "body": self._encode(body, more_body)}
+            await self.send(message)
+            return
+
+        start, self.start_message = self.start_message, None
+        compressible = _compressible(Headers(raw=start["headers"]))
+        if not compressible or (not more_body and len(body) < self.minimum_size):
+            self.passthrough = True
+            if compressible:
+                # 이번에는 작아서 그대로 보내도 같은 URL 이 다른 응답에서는 압축될 수 있다
+                _add_vary(MutableHeaders(raw=start["headers"]))
+            await self.send(start)
+            await self.send(message)
+            return
+
+        body = self._encode(body, more_body)
+        self._encode_headers(start, None if more_body else len(body))
+        await self.send(start)
+        await self.send({**message, "body": body})
@@ -9,7 +9,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User
-from app.utils.security import decode_access_token
+from app.utils.auth_cache import cache_user, decode_token_cached, get_cached_user
 from app.schemas.auth import TokenData
 
 security = HTTPBearer()
@@ -22,9 +22,10 @@ def get_current_user(
     """
     현재 로그인한 사용자 가져오기
     JWT 토큰에서 사용자 정보를 추출하고 데이터베이스에서 사용자를 조회합니다.
+    디코드 결과와 사용자는 auth_cache 에 보관되며, 반환값은 세션에 붙지 않은 스냅샷입니다.
     """
     token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = decode_token_cached(token)
     
     if payload is None:
         raise HTTPException(
@@ -41,13 +42,16 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached_user(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="사용자를 찾을 수 없습니다",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="사용자를 찾을 수 없습니다",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user = cache_user(user)
     
     if not user.is_approved:
         raise HTTPException(
@@ -132,7 +136,7 @@ async def get_current_user_ws(
             detail="토큰이 필요합니다"
         )
     
-    payload = decode_access_token(token)
+    payload = decode_token_cached(token)
     
     if payload is None:
         await websocket.close(code=1008, reason="유효하지 않은 토큰입니다")
@@ -149,7 +153,11 @@ async def get_current_user_ws(
             detail="토큰에서 사용자 정보를 찾을 수 없습니다"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_cached_user(user_id)
+    if user is None:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is not None:
+            user = cache_user(user)
     if user is None:
         await websocket.close(code=1008, reason="사용자를 찾을 수 없습니다")
         raise HTTPException(
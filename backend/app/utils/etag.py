@@ -0,0 +1,82 @@
+"""
+조건부 GET (ETag / If-None-Match)
+
+폴링하는 클라이언트가 매번 전체 목록을 다시 받지 않도록, 목록 응답에 ETag 를 붙이고
+If-None-Match 가 같으면 본문 없이 304 를 돌려준다.
+
+ETag 는 응답을 만들기 전에 "같은 조건으로 조회한 (id, updated_at) 행" 만 읽어 계산한다 (row_version).
+전체 행 로드·이력 조회·직렬화는 값이 바뀌었을 때만 한다.
+행이 추가/삭제/수정되면 (id, updated_at) 목록이 달라지므로 max(updated_at) 만 보는 것과 달리 삭제도 잡힌다.
+
+    conditional: ConditionalGet = Depends()
+    ...
+    not_modified = conditional.check(row_version(rows))
+    if not_modified is not None:
+        return not_modified
+
+ETag 는 약한 ETag(W/"...")다. 같은 데이터라도 압축 미들웨어가 인코딩에 따라 다른 바이트를 보내므로,
+304 와 200 이 같은 ETag / Vary: Accept-Encoding 을 갖도록 처음부터 약한 값으로 만든다.
+
+버전은 반드시 본문 조회보다 먼저 읽는다 — 그 사이 커밋이 끼어들면 ETag 가 본문보다 오래된 쪽이 되어
+다음 요청에서 한 번 더 받을 뿐, 바뀐 내용을 304 로 숨기지 않는다.
+"""
+import hashlib
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response, status
+
+# 브라우저/프록시가 저장은 하되 매번 재검증하도록
+CACHE_CONTROL = "private, no-cache"
+
+
+def row_version(rows: Iterable[Iterable[Any]]) -> str:
+    """(id, updated_at, ...) 행 목록의 해시"""
+    digest = hashlib.sha1()
+    for row in rows:
+        digest.update("\x1f".join("" if v is None else str(v) for v in row).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def make_etag(*parts: Any) -> str:
+    raw = "\x1f".join("" if p is None else str(p) for p in parts)
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교: W/ 접두어 무시, * 는 항상 일치)"""
+    if not if_none_match:
+        return False
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ConditionalGet:
+    """목록 GET 용 의존성. check() 가 ETag 헤더를 붙이고, 클라이언트 ETag 와 같으면 304 응답을 돌려준다.
+
+    ETag 에는 경로와 쿼리 문자열이 함께 들어가므로 필터/페이지가 다르면 다른 값이 된다.
+    304 응답에는 그때까지 response 에 넣은 헤더(X-Next-Cursor 등)가 그대로 복사된다.
+    압축 미들웨어가 200 에 붙이는 Vary: Accept-Encoding 도 여기서 미리 넣어 304 와 맞춘다.
+    """
+
+    def __init__(self, request: Request, response: Response):
+        self.request = request
+        self.response = response
+
+    def check(self, *versions: Any) -> Optional[Response]:
+        etag = make_etag(self.request.url.path, self.request.url.query, *versions)
+        self.response.headers["ETag"] = etag
+        self.response.headers["Cache-Control"] = CACHE_CONTROL
+        self.response.headers["Vary"] = "Accept-Encoding"
+        if etag_matches(self.request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(self.response.headers))
+        return None
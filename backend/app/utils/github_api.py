@@ -1,14 +1,41 @@
-"""GitHub REST API v3 client utilities."""
-from typing import Any, Dict, List, Optional
+"""GitHub REST API v3 client utilities.
+
+All calls go through one long-lived GitHubClient (``github``) instead of a new
+httpx.AsyncClient per call, so TLS connections are kept alive and reused
+(HTTP/2 when the ``h2`` package is installed).
+
+GET responses that carry an ETag are kept in an LRU cache keyed by
+(path, params, token scope). A repeated request within the fresh window is
+served from the cache; after that it is revalidated with If-None-Match, and a
+304 (which GitHub does not count against the rate limit) reuses the cached
+body. Rate-limit headers are tracked per token scope and exposed by stats().
+Once a repository delivers webhooks (invalidate_repo), its entries are
+invalidated on change and otherwise stay fresh for GITHUB_WEBHOOK_FRESH_SECONDS.
+"""
+import asyncio
+import hashlib
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional
 
 import httpx
 
+from app.config import settings
+from app.utils.cache import TTLCache
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    h2 = None
+
 
 class GitHubApiError(Exception):
     """Raised when a GitHub API call fails."""
 
 
-_GITHUB_API = "https://api.github.com"
+_GITHUB_API = settings.GITHUB_API_URL.rstrip("/")
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
 
 
 def _headers(token: Optional[str] = None) -> Dict[str, str]:
@@ -18,11 +45,174 @@ def _headers(token: Optional[str] = None) -> Dict[str, str]:
     return h
 
 
+def _repo_prefix(path: str) -> str:
+    """/repos/{owner}/{repo}/... -> /repos/{owner}/{repo}"""
+    return "/".join(path.split("/")[:4])
+
+
+def _token_scope(token: Optional[str]) -> str:
+    """Cache/rate-limit bucket for a token (never stores the token itself)."""
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+class GitHubClient:
+    """Pooled GitHub API client with an ETag-revalidated response cache."""
+
+    TIMEOUT = 15.0
+
+    def __init__(self, base_url: str = _GITHUB_API):
+        self.base_url = base_url.rstrip("/")
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # (path, params, scope) -> (etag, body, headers, fresh_until)
+        self._cache = TTLCache(maxsize=settings.GITHUB_CACHE_MAX_ENTRIES, ttl=settings.GITHUB_CACHE_TTL)
+        # scope -> {"limit", "remaining", "used", "reset_at", "resource"}
+        self._rate_limits: Dict[str, Dict[str, Any]] = {}
+        # repos with a working webhook ("/repos/{owner}/{repo}", lower-cased): their cached
+        # entries stay fresh longer because webhook deliveries invalidate them on change
+        self._webhook_repos: set = set()
+        # metrics
+        self.requests = 0
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.errors = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # AsyncClient is bound to the event loop it first ran on
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.TIMEOUT,
+                http2=h2 is not None,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0),
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+    async def get(
+        self,
+        path: str,
+        token: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """GET ``path``; served from cache when fresh, revalidated with If-None-Match otherwise."""
+        scope = _token_scope(token)
+        key = (path, tuple(sorted((params or {}).items())), scope)
+        cached = self._cache.get(key)
+        if cached is not None:
+            etag, body, headers, fresh_until = cached
+            if time.monotonic() < fresh_until:
+                self.fresh_hits += 1
+                return httpx.Response(200, content=body, headers=headers)
+
+        headers = _headers(token)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+        resp = await self._send("GET", path, scope, headers=headers, params=params, timeout=timeout)
+
+        if resp.status_code == 304 and cached is not None:
+            self.revalidated += 1
+            etag, body, cached_headers, _ = cached
+            self._cache.set(key, (etag, body, cached_headers, self._fresh_until(path, resp)))
+            return httpx.Response(200, content=body, headers=cached_headers, request=resp.request)
+        if resp.status_code == 200 and resp.headers.get("etag"):
+            kept = {name: resp.headers[name] for name in ("content-type", "link") if name in resp.headers}
+            self._cache.set(key, (resp.headers["etag"], resp.content, kept, self._fresh_until(path, resp)))
+        return resp
+
+    async def post(
+        self,
+        path: str,
+        token: Optional[str] = None,
+        json: Any = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """POST ``path`` and drop cached GETs of the same repository."""
+        scope = _token_scope(token)
+        resp = await self._send("POST", path, scope, headers=_headers(token), json=json, timeout=timeout)
+        self._discard_prefix(_repo_prefix(path))
+        return resp
+
+    def invalidate_repo(self, owner: str, repo: str, sections: Iterable[str] = ("",)) -> int:
+        """Drop cached GETs under /repos/{owner}/{repo}{section} (called on webhook deliveries)."""
+        prefix = f"/repos/{owner}/{repo}".lower()
+        self._webhook_repos.add(prefix)
+        return sum(self._discard_prefix(prefix + section) for section in sections)
+
+    def _discard_prefix(self, prefix: str) -> int:
+        prefix = prefix.lower()
+        return self._cache.discard_where(
+            lambda key, _: key[0].lower() == prefix or key[0].lower().startswith(prefix + "/")
+        )
+
+    async def _send(self, method: str, path: str, scope: str, timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        self.requests += 1
+        try:
+            resp = await self._get_client().request(
+                method, path, timeout=timeout if timeout is not None else self.TIMEOUT, **kwargs
+            )
+        except Exception:
+            self.errors += 1
+            raise
+        self._track_rate_limit(scope, resp.headers)
+        return resp
+
+    def _fresh_until(self, path: str, resp: httpx.Response) -> float:
+        if _repo_prefix(path).lower() in self._webhook_repos:
+            return time.monotonic() + settings.GITHUB_WEBHOOK_FRESH_SECONDS
+        match = _MAX_AGE.search(resp.headers.get("cache-control", ""))
+        max_age = int(match.group(1)) if match else 0
+        return time.monotonic() + min(max_age, settings.GITHUB_CACHE_FRESH_SECONDS)
+
+    def _track_rate_limit(self, scope: str, headers: httpx.Headers) -> None:
+        if "x-ratelimit-remaining" not in headers:
+            return
+        try:
+            self._rate_limits[scope] = {
+                "limit": int(headers.get("x-ratelimit-limit", 0)),
+                "remaining": int(headers["x-ratelimit-remaining"]),
+                "used": int(headers.get("x-ratelimit-used", 0)),
+                "reset_at": int(headers.get("x-ratelimit-reset", 0)),
+                "resource": headers.get("x-ratelimit-resource", "core"),
+            }
+        except ValueError:
+            pass
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """Pool/cache/rate-limit metrics."""
+        return {
+            "http2": h2 is not None,
+            "requests": self.requests,
+            "fresh_hits": self.fresh_hits,
+            "revalidated_304": self.revalidated,
+            "errors": self.errors,
+            "cache": self._cache.stats(),
+            "rate_limits": dict(self._rate_limits),
+            "webhook_repos": len(self._webhook_repos),
+        }
+
+
+# Process-wide client (closed on app shutdown)
+github = GitHubClient()
+
+
 async def validate_repo(owner: str, repo: str, token: Optional[str] = None) -> Dict[str, Any]:
     """Verify that a repository exists and is accessible."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(f"{_GITHUB_API}/repos/{owner}/{repo}", headers=_headers(token))
+        resp = await github.get(f"/repos/{owner}/{repo}", token)
     except Exception as exc:
         raise GitHubApiError(f"Failed to connect to GitHub: {exc}") from exc
     if resp.status_code == 404:
@@ -44,12 +234,11 @@ async def get_issues(
 ) -> List[Dict[str, Any]]:
     """Fetch issues from a repository (PRs excluded)."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{_GITHUB_API}/repos/{owner}/{repo}/issues",
-                headers=_headers(token),
-                params={"state": state, "page": page, "per_page": per_page},
-            )
+        resp = await github.get(
+            f"/repos/{owner}/{repo}/issues",
+            token,
+            params={"state": state, "page": page, "per_page": per_page},
+        )
     except Exception as exc:
         raise GitHubApiError(f"Failed to fetch issues: {exc}") from exc
     if resp.status_code != 200:
@@ -71,12 +260,7 @@ async def get_commits(
     if branch:
         params["sha"] = branch
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{_GITHUB_API}/repos/{owner}/{repo}/commits",
-                headers=_headers(token),
-                params=params,
-            )
+        resp = await github.get(f"/repos/{owner}/{repo}/commits", token, params=params)
     except Exception as exc:
         raise GitHubApiError(f"Failed to fetch commits: {exc}") from exc
     if resp.status_code != 200:
@@ -93,12 +277,11 @@ async def get_branches(
 ) -> List[Dict[str, Any]]:
     """Fetch branches from a repository."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{_GITHUB_API}/repos/{owner}/{repo}/branches",
-                headers=_headers(token),
-                params={"page": page, "per_page": per_page},
-            )
+        resp = await github.get(
+            f"/repos/{owner}/{repo}/branches",
+            token,
+            params={"page": page, "per_page": per_page},
+        )
     except Exception as exc:
         raise GitHubApiError(f"Failed to fetch branches: {exc}") from exc
     if resp.status_code != 200:
@@ -115,12 +298,11 @@ async def get_tags(
 ) -> List[Dict[str, Any]]:
     """Fetch tags from a repository."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{_GITHUB_API}/repos/{owner}/{repo}/tags",
-                headers=_headers(token),
-                params={"page": page, "per_page": per_page},
-            )
+        resp = await github.get(
+            f"/repos/{owner}/{repo}/tags",
+            token,
+            params={"page": page, "per_page": per_page},
+        )
     except Exception as exc:
         raise GitHubApiError(f"Failed to fetch tags: {exc}") from exc
     if resp.status_code != 200:
@@ -141,12 +323,7 @@ async def create_tag_ref(
     ref = f"refs/tags/{tag_name}"
     body = {"ref": ref, "sha": commit_sha.strip()}
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            resp = await client.post(
-                f"{_GITHUB_API}/repos/{owner}/{repo}/git/refs",
-                headers=_headers(token),
-                json=body,
-            )
+        resp = await github.post(f"/repos/{owner}/{repo}/git/refs", token, json=body, timeout=20.0)
     except Exception as exc:
         raise GitHubApiError(f"Failed to create tag: {exc}") from exc
     if resp.status_code == 422:
@@ -178,12 +355,11 @@ async def get_user_repos(
 ) -> List[Dict[str, Any]]:
     """Fetch repositories accessible to the authenticated user."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{_GITHUB_API}/user/repos",
-                headers=_headers(token),
-                params={"page": page, "per_page": per_page, "sort": "updated", "affiliation": "owner,collaborator,organization_member"},
-            )
+        resp = await github.get(
+            "/user/repos",
+            token,
+            params={"page": page, "per_page": per_page, "sort": "updated", "affiliation": "owner,collaborator,organization_member"},
+        )
     except Exception as exc:
         raise GitHubApiError(f"Failed to fetch user repos: {exc}") from exc
     if resp.status_code == 401:
@@ -200,11 +376,7 @@ async def get_languages(
 ) -> Dict[str, int]:
     """Fetch language breakdown (bytes per language) from GitHub."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{_GITHUB_API}/repos/{owner}/{repo}/languages",
-                headers=_headers(token),
-            )
+        resp = await github.get(f"/repos/{owner}/{repo}/languages", token)
     except Exception as exc:
         raise GitHubApiError(f"Failed to fetch languages: {exc}") from exc
     if resp.status_code != 200:
@@ -222,12 +394,11 @@ async def get_releases(
 ) -> List[Dict[str, Any]]:
     """Fetch releases from a repository (sorted by published_at desc)."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{_GITHUB_API}/repos/{owner}/{repo}/releases",
-                headers=_headers(token),
-                params={"page": page, "per_page": per_page},
-            )
+        resp = await github.get(
+            f"/repos/{owner}/{repo}/releases",
+            token,
+            params={"page": page, "per_page": per_page},
+        )
     except Exception as exc:
         raise GitHubApiError(f"Failed to fetch releases: {exc}") from exc
     if resp.status_code != 200:
@@ -244,11 +415,7 @@ async def compare_commits(
 ) -> Dict[str, Any]:
     """Compare two commits via GitHub API (GET /repos/{owner}/{repo}/compare/{base}...{head})."""
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
-            resp = await client.get(
-                f"{_GITHUB_API}/repos/{owner}/{repo}/compare/{base}...{head}",
-                headers=_headers(token),
-            )
+        resp = await github.get(f"/repos/{owner}/{repo}/compare/{base}...{head}", token, timeout=20.0)
     except Exception as exc:
         raise GitHubApiError(f"Failed to compare commits: {exc}") from exc
     if resp.status_code == 404:
@@ -268,12 +435,11 @@ async def get_pull_requests(
 ) -> List[Dict[str, Any]]:
     """Fetch pull requests from a repository."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{_GITHUB_API}/repos/{owner}/{repo}/pulls",
-                headers=_headers(token),
-                params={"state": state, "page": page, "per_page": per_page},
-            )
+        resp = await github.get(
+            f"/repos/{owner}/{repo}/pulls",
+            token,
+            params={"state": state, "page": page, "per_page": per_page},
+        )
     except Exception as exc:
         raise GitHubApiError(f"Failed to fetch pull requests: {exc}") from exc
     if resp.status_code != 200:
@@ -0,0 +1,223 @@
+"""
+GitHub 웹훅 수신 처리 (POST /api/github/webhook)
+
+레포 Settings → Webhooks 에 https://<host>/api/github/webhook, Content type application/json,
+Secret = settings.GITHUB_WEBHOOK_SECRET 로 등록한다. push / pull_request / issues / create / delete / release 를 받는다.
+
+수신하면
+1) X-Hub-Signature-256 (HMAC-SHA256) 검증 — 실패하면 401
+2) github_webhook_events 에 기록 (X-GitHub-Delivery 로 재전송 중복 제거)
+3) github_api 클라이언트 캐시에서 바뀐 구역(branches/pulls/...)만 무효화 — 백플레인으로 다른 워커에도 알린다.
+   웹훅이 오는 레포는 이후 캐시를 GITHUB_WEBHOOK_FRESH_SECONDS 동안 GitHub 에 묻지 않고 쓴다.
+4) 연동 프로젝트 멤버에게 WebSocket "github_event" 전송
+5) 백그라운드로 무효화한 목록 첫 페이지를 다시 받아 캐시를 채우고, push/create/delete 면 커밋 그래프도 갱신한다.
+   (프로젝트 토큰 기준으로 채운다 — 개인 토큰으로 보는 사용자는 첫 조회 때 채워진다)
+"""
+import hashlib
+import hmac
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.github import GitHubWebhookEvent, ProjectGitHub
+from app.models.project import Project
+from app.utils.github_api import (
+    GitHubApiError,
+    get_branches,
+    get_commits,
+    get_issues,
+    get_pull_requests,
+    get_releases,
+    get_tags,
+    github,
+)
+
+# 백플레인 봉투 op — user_ids 자리에 "owner/repo:event" 를 실어 보낸다
+INVALIDATE_OP = "github_invalidate_repo"
+
+# 이벤트별로 무효화할 캐시 구역 (/repos/{owner}/{repo} 뒤 경로)
+_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    "push": ("/branches", "/commits", "/compare", "/tags"),
+    "create": ("/branches", "/tags"),
+    "delete": ("/branches", "/tags"),
+    "pull_request": ("/pulls",),
+    "issues": ("/issues",),
+    "release": ("/releases", "/tags"),
+    "repository": ("",),
+}
+
+SUPPORTED_EVENTS = frozenset(_SECTIONS)
+
+# 커밋 그래프를 갱신해야 하는 이벤트
+_GRAPH_EVENTS = frozenset({"push", "create", "delete"})
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    if not secret or not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len("sha256="):])
+
+
+def repo_of(payload: dict) -> Optional[Tuple[str, str]]:
+    repo = payload.get("repository") or {}
+    owner = (repo.get("owner") or {}).get("login")
+    name = repo.get("name")
+    if not owner or not name:
+        return None
+    return owner, name
+
+
+def linked_repos(db: Session, owner: str, name: str) -> List[ProjectGitHub]:
+    """이 레포에 연동된 프로젝트 (대소문자 무시)"""
+    return db.query(ProjectGitHub).filter(
+        func.lower(ProjectGitHub.repo_owner) == owner.lower(),
+        func.lower(ProjectGitHub.repo_name) == name.lower(),
+    ).all()
+
+
+def _first_line(message: Optional[str]) -> str:
+    return (message or "").split("\n", 1)[0]
+
+
+def summarize(event: str, payload: dict) -> dict:
+    """WebSocket / 이벤트 기록용 요약"""
+    if event == "push":
+        ref = payload.get("ref", "")
+        head = payload.get("head_commit") or {}
+        return {
+            "ref": ref,
+            "branch": ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else None,
+            "tag": ref[len("refs/tags/"):] if ref.startswith("refs/tags/") else None,
+            "before": payload.get("before"),
+            "after": payload.get("after"),
+            "created": bool(payload.get("created")),
+            "deleted": bool(payload.get("deleted")),
+            "forced": bool(payload.get("forced")),
+            "commit_count": len(payload.get("commits") or []),
+            "head_commit": {
+                "sha": head.get("id"),
+                "message": _first_line(head.get("message")),
+                "author_name": (head.get("author") or {}).get("name"),
+                "url": head.get("url"),
+            } if head else None,
+            "pusher": (payload.get("pusher") or {}).get("name"),
+        }
+    if event == "pull_request":
+        pr = payload.get("pull_request") or {}
+        return {
+            "number": pr.get("number"),
+            "title": pr.get("title"),
+            "state": pr.get("state"),
+            "merged": bool(pr.get("merged")),
+            "url": pr.get("html_url"),
+            "user": (pr.get("user") or {}).get("login"),
+        }
+    if event == "issues":
+        issue = payload.get("issue") or {}
+        return {
+            "number": issue.get("number"),
+            "title": issue.get("title"),
+            "state": issue.get("state"),
+            "url": issue.get("html_url"),
+            "user": (issue.get("user") or {}).get("login"),
+        }
+    if event in ("create", "delete"):
+        return {"ref_type": payload.get("ref_type"), "ref": payload.get("ref")}
+    if event == "release":
+        release = payload.get("release") or {}
+        return {
+            "tag_name": release.get("tag_name"),
+            "name": release.get("name"),
+            "url": release.get("html_url"),
+            "draft": bool(release.get("draft")),
+            "prerelease": bool(release.get("prerelease")),
+        }
+    return {}
+
+
+def record_delivery(
+    db: Session, delivery_id: str, event: str, payload: dict, repo_full_name: str, project_ids: List[str], summary: dict
+) -> bool:
+    """이벤트 기록. 이미 받은 delivery 면 False (커밋은 호출 측)"""
+    inserted = db.execute(
+        pg_insert(GitHubWebhookEvent)
+        .values(
+            delivery_id=delivery_id,
+            event=event,
+            action=payload.get("action"),
+            repo_full_name=repo_full_name,
+            project_ids=project_ids,
+            summary=summary,
+        )
+        .on_conflict_do_nothing()
+        .returning(GitHubWebhookEvent.delivery_id)
+    ).first()
+    return inserted is not None
+
+
+def project_member_ids(db: Session, project_ids: List[str]) -> List[str]:
+    member_ids = set()
+    for team_member_ids, creator_id in db.query(Project.team_member_ids, Project.creator_id).filter(
+        Project.id.in_(project_ids)
+    ):
+        member_ids.update(team_member_ids or [])
+        if creator_id:
+            member_ids.add(creator_id)
+    return list(member_ids)
+
+
+def invalidate_caches(owner: str, name: str, event: str) -> None:
+    """이 워커의 캐시 무효화 + 다른 워커에 전달"""
+    github.invalidate_repo(owner, name, _SECTIONS.get(event, ("",)))
+    from app.routers.websocket import manager
+
+    manager.publish_control_nowait(INVALIDATE_OP, [f"{owner}/{name}:{event}"])
+
+
+def handle_invalidation(envelope: dict) -> None:
+    """백플레인 수신 핸들러 — 다른 워커가 받은 웹훅의 캐시 무효화 반영"""
+    for entry in envelope.get("user_ids") or []:
+        repo, _, event = entry.rpartition(":")
+        owner, _, name = repo.partition("/")
+        if owner and name:
+            github.invalidate_repo(owner, name, _SECTIONS.get(event, ("",)))
+
+
+def register(manager) -> None:
+    """앱 시작 시 호출 — 무효화 봉투 핸들러 등록"""
+    manager.register_control_handler(INVALIDATE_OP, handle_invalidation)
+
+
+async def refresh_after_webhook(project_ids: List[str], event: str) -> None:
+    """무효화한 목록 첫 페이지를 다시 받아 캐시를 채우고, 필요하면 커밋 그래프를 갱신 (백그라운드)"""
+    from app.database import SessionLocal
+    from app.utils.commit_graph import sync_commit_graph
+
+    sections = _SECTIONS.get(event, ())
+    db = SessionLocal()
+    try:
+        for gh in db.query(ProjectGitHub).filter(ProjectGitHub.project_id.in_(project_ids)).all():
+            owner, name, token = gh.repo_owner, gh.repo_name, gh.access_token
+            try:
+                branches = await get_branches(owner, name, token) if "/branches" in sections else None
+                if "/tags" in sections:
+                    await get_tags(owner, name, token)
+                if "/commits" in sections:
+                    await get_commits(owner, name, token)
+                if "/pulls" in sections:
+                    await get_pull_requests(owner, name, token)
+                if "/issues" in sections:
+                    await get_issues(owner, name, token)
+                if "/releases" in sections:
+                    await get_releases(owner, name, token)
+                if event in _GRAPH_EVENTS and branches:
+                    await sync_commit_graph(db, gh, token, branches)
+            except GitHubApiError as e:
+                print(f"[github_webhook] refresh failed for {owner}/{name}: {e}")
+    except Exception as e:
+        print(f"[github_webhook] refresh failed: {e}")
+    finally:
+        db.close()
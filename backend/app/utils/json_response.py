@@ -0,0 +1,32 @@
+"""
+기본 JSON 응답 클래스
+
+FastAPI 는 response_model 직렬화(pydantic-core) 후 마지막 단계에서 json.dumps 로 바이트를 만든다.
+1000건 태스크 목록처럼 큰 응답은 이 단계가 눈에 띄게 느려서 orjson 으로 바꾼다 (결과 JSON 은 같다).
+
+settings.JSON_RESPONSE 로 고른다: "orjson"(기본) | "std"(표준 json).
+orjson 이 설치되어 있지 않으면 표준 json 으로 동작한다.
+"""
+from typing import Type
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.config import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+RESPONSE_CLASSES = {
+    "orjson": ORJSONResponse,
+    "std": JSONResponse,
+}
+
+
+def default_response_class() -> Type[JSONResponse]:
+    name = settings.JSON_RESPONSE
+    if name == "orjson" and orjson is None:
+        print("[JSON] orjson 이 없어 표준 json 응답을 사용합니다")
+        name = "std"
+    return RESPONSE_CLASSES.get(name, JSONResponse)
@@ -1,5 +1,17 @@
-"""Mattermost incoming webhook 연동 (사용자별 설정 기반)."""
+"""Mattermost incoming webhook 연동 (사용자별 설정 기반).
+
+웹훅 전송은 요청 처리 중에 하지 않고 MattermostDispatcher 큐에 넣기만 한다.
+앱 시작 시 워커 풀이 공용 httpx.AsyncClient 로 전송하며,
+- 같은 웹훅으로 쌓인 알림은 한 번의 POST 로 묶어서 보내고 (batching)
+- 웹훅별 최소 전송 간격을 지키며 (rate limiting)
+- 네트워크 오류 / 429 / 5xx 는 지수 백오프로 재시도한다.
+"""
+import asyncio
 import json
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
 import httpx
 
 from sqlalchemy.orm import Session
@@ -17,6 +29,216 @@ _ICON_MAP = {
 }
 
 
+class MattermostDispatcher:
+    """웹훅 전송 큐 + 워커 풀"""
+
+    WORKER_COUNT = 4
+    # 웹훅 1개당 POST 최소 간격 (초) — Mattermost 기본 rate limit 보호
+    MIN_INTERVAL_PER_WEBHOOK = 1.0
+    # 한 POST 에 묶을 최대 알림 수
+    BATCH_MAX = 10
+    MAX_ATTEMPTS = 4
+    BACKOFF_BASE = 1.0
+    REQUEST_TIMEOUT = 5.0
+    # 큐에 쌓일 수 있는 최대 알림 수 — 넘으면 가장 오래된 것부터 버림
+    MAX_PENDING = 5000
+
+    def __init__(self):
+        # 웹훅별 대기 알림: {webhook_url: deque[(payload_text, username, enqueued_at)]}
+        self._pending: Dict[str, Deque[Tuple[str, str, float]]] = {}
+        # 처리 대기 중인 웹훅 URL (워커가 가져감)
+        self._ready: Optional[asyncio.Queue] = None
+        # 큐에 올라가 있거나 처리 중인 웹훅 — 중복 스케줄 방지
+        self._scheduled: Set[str] = set()
+        self._last_sent_at: Dict[str, float] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._workers: list = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 메트릭
+        self.sent_posts = 0
+        self.sent_notifications = 0
+        self.failed_notifications = 0
+        self.dropped_notifications = 0
+        self.retries = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Queue()
+        self._client = httpx.AsyncClient(
+            timeout=self.REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.WORKER_COUNT)]
+        for url in list(self._pending):
+            self._schedule(url)
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        if not self.running:
+            return
+        # 남은 알림 + 전송/재시도 중인 배치를 잠시 기다려 준 뒤 종료
+        # (_flush 는 배치를 _pending 에서 꺼낸 뒤 보내므로, 처리 중인 웹훅은 _scheduled 로 본다)
+        deadline = time.monotonic() + drain_timeout
+        while (self._pending or self._scheduled) and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        for w in self._workers:
+            w.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self._client.aclose()
+        self._client = None
+        self._loop = None
+        self._scheduled.clear()
+
+    def enqueue(self, webhook_url: str, text: str, username: str = "SYNC") -> None:
+        """알림 1건을 큐에 넣는다 (블로킹 없음)"""
+        if self.pending_count() >= self.MAX_PENDING:
+            self._drop_oldest()
+        self._pending.setdefault(webhook_url, deque()).append((text, username, time.monotonic()))
+        if self.running:
+            self._schedule(webhook_url)
+
+    def _schedule(self, webhook_url: str) -> None:
+        if webhook_url in self._scheduled:
+            return
+        self._scheduled.add(webhook_url)
+        self._ready.put_nowait(webhook_url)
+
+    def _drop_oldest(self) -> None:
+        oldest_url = min(
+            (url for url, items in self._pending.items() if items),
+            key=lambda url: self._pending[url][0][2],
+            default=None,
+        )
+        if oldest_url is None:
+            return
+        self._pending[oldest_url].popleft()
+        self.dropped_notifications += 1
+        if not self._pending[oldest_url]:
+            del self._pending[oldest_url]
+
+    async def _worker(self) -> None:
+        while True:
+            webhook_url = await self._ready.get()
+            try:
+                await self._flush(webhook_url)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[Mattermost] 웹훅 처리 오류: {e}")
+            finally:
+                self._scheduled.discard(webhook_url)
+                if self._pending.get(webhook_url):
+                    self._schedule(webhook_url)
+
+    async def _flush(self, webhook_url: str) -> None:
+        # 웹훅별 최소 간격 대기 — 기다리는 동안 들어온 알림은 같은 배치로 묶인다
+        wait = self._last_sent_at.get(webhook_url, 0.0) + self.MIN_INTERVAL_PER_WEBHOOK - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        items = self._pending.get(webhook_url)
+        if not items:
+            self._pending.pop(webhook_url, None)
+            return
+        batch = [items.popleft() for _ in range(min(self.BATCH_MAX, len(items)))]
+        if not items:
+            del self._pending[webhook_url]
+
+        text = "\n\n".join(t for t, _, _ in batch)
+        body = json.dumps({"text": text, "username": batch[0][1]}, ensure_ascii=False).encode("utf-8")
+
+        ok = await self._post_with_retry(webhook_url, body)
+        self._last_sent_at[webhook_url] = time.monotonic()
+        if not ok:
+            self.failed_notifications += len(batch)
+            return
+        now = time.monotonic()
+        self.sent_posts += 1
+        self.sent_notifications += len(batch)
+        for _, _, enqueued_at in batch:
+            latency = now - enqueued_at
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+
+    async def _post_with_retry(self, webhook_url: str, body: bytes) -> bool:
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            delay = self.BACKOFF_BASE * (2 ** (attempt - 1))
+            try:
+                resp = await self._client.post(
+                    webhook_url,
+                    content=body,
+                    headers={"Content-Type": "application/json; charset=utf-8"},
+                )
+                if resp.status_code < 400:
+                    return True
+                if resp.status_code != 429 and resp.status_code < 500:
+                    print(f"[Mattermost] 전송 거부 ({resp.status_code}): {resp.text[:200]}")
+                    return False
+                retry_after = resp.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+                error = f"HTTP {resp.status_code}"
+            except httpx.HTTPError as e:
+                error = str(e) or e.__class__.__name__
+            if attempt == self.MAX_ATTEMPTS:
+                print(f"[Mattermost] 전송 실패 ({attempt}회 시도): {error}")
+                return False
+            self.retries += 1
+            await asyncio.sleep(delay)
+        return False
+
+    def pending_count(self) -> int:
+        return sum(len(items) for items in self._pending.values())
+
+    def stats(self) -> dict:
+        """큐 깊이 / 지연 시간 메트릭"""
+        now = time.monotonic()
+        oldest = min((items[0][2] for items in self._pending.values() if items), default=None)
+        return {
+            "running": self.running,
+            "queue_depth": self.pending_count(),
+            "queued_webhooks": len(self._pending),
+            "oldest_pending_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+            "sent_posts": self.sent_posts,
+            "sent_notifications": self.sent_notifications,
+            "failed_notifications": self.failed_notifications,
+            "dropped_notifications": self.dropped_notifications,
+            "retries": self.retries,
+            "avg_latency_seconds": round(self._latency_total / self.sent_notifications, 3)
+            if self.sent_notifications
+            else 0.0,
+            "max_latency_seconds": round(self._latency_max, 3),
+        }
+
+
+# 전역 디스패처 (app.main 의 startup/shutdown 에서 시작/종료)
+dispatcher = MattermostDispatcher()
+
+
+def _format_text(
+    notification_type: NotificationType,
+    title: str,
+    message: str,
+    task_id: str = None,
+) -> str:
+    icon = _ICON_MAP.get(notification_type, ":bell:")
+    text = f"{icon} **{title}**\n{message}"
+
+    # 작업 링크 추가
+    if task_id and settings.FRONTEND_URL:
+        task_url = f"{settings.FRONTEND_URL}/task/{task_id}"
+        text += f"\n:link: [작업 보기]({task_url})"
+    return text
+
+
 def send_mattermost_notification(
     db: Session,
     user_id: str,
@@ -26,7 +248,7 @@ def send_mattermost_notification(
     username: str = "SYNC",
     task_id: str = None,
 ) -> None:
-    """사용자 Mattermost 설정을 조회해 활성화된 경우 웹훅으로 알림 전송."""
+    """사용자 Mattermost 설정을 조회해 활성화된 경우 웹훅 전송 큐에 넣는다."""
     try:
         rec = db.query(UserMattermostSetting).filter(
             UserMattermostSetting.user_id == user_id
@@ -34,19 +256,74 @@ def send_mattermost_notification(
         if not rec or not rec.is_enabled or not rec.webhook_url:
             return
 
-        icon = _ICON_MAP.get(notification_type, ":bell:")
-        text = f"{icon} **{title}**\n{message}"
+        text = _format_text(notification_type, title, message, task_id)
 
-        # 작업 링크 추가
-        if task_id and settings.FRONTEND_URL:
-            task_url = f"{settings.FRONTEND_URL}/task/{task_id}"
-            text += f"\n:link: [작업 보기]({task_url})"
-
-        httpx.post(
-            rec.webhook_url,
-            content=json.dumps({"text": text, "username": username}, ensure_ascii=False).encode("utf-8"),
-            headers={"Content-Type": "application/json; charset=utf-8"},
-            timeout=5.0,
-        )
+        if dispatcher.running:
+            dispatcher.enqueue(rec.webhook_url, text, username)
+        else:
+            # 디스패처가 없는 환경(스크립트 등) — 기존처럼 직접 전송
+            httpx.post(
+                rec.webhook_url,
+                content=json.dumps({"text": text, "username": username}, ensure_ascii=False).encode("utf-8"),
+                headers={"Content-Type": "application/json; charset=utf-8"},
+                timeout=5.0,
+            )
     except Exception as e:
         print(f"[Mattermost] 전송 실패 (user={user_id}): {e}")
+
+
+def send_mattermost_notifications_bulk(
+    db: Session,
+    user_ids: List[str],
+    notification_type: NotificationType,
+    title: str,
+    message: str,
+    username: str = "SYNC",
+    task_id: str = None,
+) -> None:
+    """여러 수신자의 Mattermost 설정을 한 번에 조회해 활성화된 웹훅마다 전송 큐에 넣는다."""
+    send_mattermost_notifications_batch(
+        db, [(user_ids, notification_type, title, message, task_id)], username=username
+    )
+
+
+def send_mattermost_notifications_batch(
+    db: Session,
+    groups: List[Tuple[List[str], NotificationType, str, str, Optional[str]]],
+    username: str = "SYNC",
+) -> None:
+    """내용이 다른 알림 묶음 전송. groups: [(user_ids, type, title, message, task_id)]
+
+    수신자 전체의 설정은 한 번의 쿼리로 조회하고, 묶음마다 웹훅 중복을 제거해 큐에 넣는다.
+    """
+    all_user_ids = list({uid for user_ids, *_ in groups for uid in user_ids})
+    if not all_user_ids:
+        return
+    try:
+        recs = db.query(UserMattermostSetting).filter(
+            UserMattermostSetting.user_id.in_(all_user_ids),
+            UserMattermostSetting.is_enabled.is_(True),
+        ).all()
+        webhook_by_user = {rec.user_id: rec.webhook_url for rec in recs if rec.webhook_url}
+        if not webhook_by_user:
+            return
+
+        for user_ids, notification_type, title, message, task_id in groups:
+            webhook_urls = list(dict.fromkeys(
+                webhook_by_user[uid] for uid in user_ids if uid in webhook_by_user
+            ))
+            if not webhook_urls:
+                continue
+            text = _format_text(notification_type, title, message, task_id)
+            for webhook_url in webhook_urls:
+                if dispatcher.running:
+                    dispatcher.enqueue(webhook_url, text, username)
+                else:
+                    httpx.post(
+                        webhook_url,
+                        content=json.dumps({"text": text, "username": username}, ensure_ascii=False).encode("utf-8"),
+                        headers={"Content-Type": "application/json; charset=utf-8"},
+                        timeout=5.0,
+                    )
+    except Exception as e:
+        print(f"[Mattermost] 일괄 전송 실패 (users={len(all_user_ids)}): {e}")
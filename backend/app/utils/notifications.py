@@ -3,8 +3,8 @@
 """
 import asyncio
 import uuid
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -12,79 +12,132 @@ from app.models.notification import Notification, NotificationType
 from app.models.project import Project
 from app.models.task import Task
 from app.models.user import User
-from app.utils.mattermost import send_mattermost_notification
+from app.utils.mattermost import send_mattermost_notifications_batch
 
 
-def create_notification(
+def create_notifications_bulk(
     db: Session,
     notification_type: NotificationType,
-    user_id: str,
+    user_ids: Iterable[str],
     title: str,
     message: str,
     project_id: str = None,
     task_id: str = None,
-    comment_id: str = None
-) -> Notification:
-    """알림 생성"""
-    notification = Notification(
-        id=str(uuid.uuid4()),
-        type=notification_type,
-        user_id=user_id,
-        project_id=project_id,
-        task_id=task_id,
-        comment_id=comment_id,
-        title=title,
-        message=message,
-        is_read=False
-    )
-    
-    db.add(notification)
+    comment_id: str = None,
+) -> List[Notification]:
+    """여러 수신자에게 같은 내용의 알림을 한 번에 생성.
+
+    - INSERT 는 한 번의 배치 문장, COMMIT 은 1회
+    - Mattermost 설정은 수신자 전체를 한 번의 쿼리로 조회
+    - WebSocket 푸시는 커밋 후 한 태스크에서 전송
+    """
+    return create_notifications_batch(db, [{
+        "notification_type": notification_type,
+        "user_ids": user_ids,
+        "title": title,
+        "message": message,
+        "project_id": project_id,
+        "task_id": task_id,
+        "comment_id": comment_id,
+    }])
+
+
+def create_notifications_batch(db: Session, groups: Iterable[dict]) -> List[Notification]:
+    """내용이 서로 다른 알림 묶음을 한 번에 생성 (COMMIT 1회, Mattermost 조회 1회).
+
+    groups: create_notifications_bulk 의 인자 이름을 키로 갖는 dict 목록
+    """
+    # created_at 을 직접 채워 커밋 후 재조회(refresh) 없이 페이로드를 만든다
+    now = datetime.now(timezone.utc)
+    notifications: List[Notification] = []
+    payloads: List[dict] = []
+    mattermost_groups = []
+    for group in groups:
+        recipients = [uid for uid in dict.fromkeys(group["user_ids"]) if uid]
+        if not recipients:
+            continue
+        notification_type = group["notification_type"]
+        project_id = group.get("project_id")
+        task_id = group.get("task_id")
+        comment_id = group.get("comment_id")
+        title, message = group["title"], group["message"]
+        for user_id in recipients:
+            n = Notification(
+                id=str(uuid.uuid4()),
+                type=notification_type,
+                user_id=user_id,
+                project_id=project_id,
+                task_id=task_id,
+                comment_id=comment_id,
+                title=title,
+                message=message,
+                is_read=False,
+                created_at=now,
+            )
+            notifications.append(n)
+            payloads.append({
+                "id": n.id,
+                "type": notification_type.value,
+                "user_id": user_id,
+                "project_id": project_id,
+                "task_id": task_id,
+                "comment_id": comment_id,
+                "title": title,
+                "message": message,
+                "is_read": False,
+                "created_at": now.isoformat(),
+            })
+        mattermost_groups.append((recipients, notification_type, title, message, task_id))
+
+    if not notifications:
+        return []
+
+    db.add_all(notifications)
     db.commit()
-    db.refresh(notification)
 
     # Mattermost 웹훅 전송 (사용자별 설정 확인)
     try:
-        send_mattermost_notification(
-            db=db,
-            user_id=user_id,
-            notification_type=notification_type,
-            title=title,
-            message=message,
-            task_id=task_id,
-        )
+        send_mattermost_notifications_batch(db, mattermost_groups)
     except Exception as e:
         print(f"[Mattermost] 알림 전송 오류: {e}")
 
-    # Push realtime notification event to the target user.
+    # Push realtime notification event to the target users.
     try:
-        from app.routers.websocket import manager
-
-        asyncio.create_task(
-            manager.send_to_user(
-                {
-                    "type": "notification_created",
-                    "data": {
-                        "id": notification.id,
-                        "type": notification.type.value,
-                        "user_id": notification.user_id,
-                        "project_id": notification.project_id,
-                        "task_id": notification.task_id,
-                        "comment_id": notification.comment_id,
-                        "title": notification.title,
-                        "message": notification.message,
-                        "is_read": notification.is_read,
-                        "created_at": notification.created_at.isoformat()
-                        if notification.created_at
-                        else None,
-                    },
-                },
-                notification.user_id,
-            )
-        )
+        asyncio.create_task(_push_notifications(payloads))
     except Exception as e:
         print(f"[Notification] websocket push failed: {e}")
 
-    return notification
+    return notifications
+
+
+async def _push_notifications(payloads: List[dict]) -> None:
+    from app.routers.websocket import manager
+
+    for data in payloads:
+        await manager.send_to_user({"type": "notification_created", "data": data}, data["user_id"])
+
+
+def create_notification(
+    db: Session,
+    notification_type: NotificationType,
+    user_id: str,
+    title: str,
+    message: str,
+    project_id: str = None,
+    task_id: str = None,
+    comment_id: str = None
+) -> Notification:
+    """알림 생성"""
+    return create_notifications_bulk(
+        db,
+        notification_type,
+        [user_id],
+        title=title,
+        message=message,
+        project_id=project_id,
+        task_id=task_id,
+        comment_id=comment_id,
+    )[0]
 
 
 def notify_project_member_added(
@@ -125,16 +178,15 @@ def notify_task_created(
         recipients.add(project.creator_id)
     recipients.discard(created_by_user.id)  # 본인 제외
 
-    for user_id in recipients:
-        create_notification(
-            db=db,
-            notification_type=NotificationType.TASK_CREATED,
-            user_id=user_id,
-            title=f"[{project.name}] 새 작업이 추가되었습니다",
-            message=f"{created_by_user.username}님이 '{task.title}' 작업을 추가했습니다.",
-            project_id=task.project_id,
-            task_id=task.id,
-        )
+    create_notifications_bulk(
+        db=db,
+        notification_type=NotificationType.TASK_CREATED,
+        user_ids=recipients,
+        title=f"[{project.name}] 새 작업이 추가되었습니다",
+        message=f"{created_by_user.username}님이 '{task.title}' 작업을 추가했습니다.",
+        project_id=task.project_id,
+        task_id=task.id,
+    )
 
 
 def notify_task_assigned(
@@ -144,18 +196,33 @@ def notify_task_assigned(
     assigned_by_user: User
 ):
     """작업 할당 알림"""
+    notify_task_assigned_many(db, task, [assigned_user_id], assigned_by_user)
+
+
+def notify_task_assigned_many(
+    db: Session,
+    task: Task,
+    assigned_user_ids: Iterable[str],
+    assigned_by_user: User
+):
+    """작업 할당 알림 (여러 담당자 일괄)"""
     task_title = task.title
-    assigned_user = db.query(User).filter(User.id == assigned_user_id).first()
-    if not assigned_user:
+    ids = list(dict.fromkeys(assigned_user_ids))
+    if not ids:
+        return
+    existing_ids = [
+        row[0] for row in db.query(User.id).filter(User.id.in_(ids)).all()
+    ]
+    if not existing_ids:
         return
     
     title = f"작업 '{task_title}'의 할당자로 임명되었습니다"
     message = f"{assigned_by_user.username}님이 '{task_title}' 작업의 할당자로 당신을 임명했습니다."
     
-    create_notification(
+    create_notifications_bulk(
         db=db,
         notification_type=NotificationType.TASK_ASSIGNED,
-        user_id=assigned_user_id,
+        user_ids=existing_ids,
         title=title,
         message=message,
         project_id=task.project_id,
@@ -192,18 +259,13 @@ def _fmt_task_date(value: Any) -> str:
     return str(value)
 
 
-def notify_task_option_changed(
-    db: Session,
+def _option_changed_content(
     task: Task,
     changed_by_user: User,
     changed_fields: list,
-    *,
     transitions: Optional[Dict[str, Tuple[Any, Any]]] = None,
-):
-    """작업 옵션 변경 알림 (중요도, 상태, 날짜).
-
-    transitions 예: {'status': ('backlog', 'inProgress'), 'priority': ('p2', 'p0')}
-    """
+) -> Tuple[str, str]:
+    """작업 옵션 변경 알림의 (title, message)"""
     task_title = task.title
     transitions = transitions or {}
     field_names = {
@@ -241,23 +303,136 @@ def notify_task_option_changed(
     message = (
         f"{changed_by_user.username}님이 '{task_title}' 작업의 {detail} 변경했습니다."
     )
+    return f"작업 '{task_title}'의 옵션이 변경되었습니다", message
+
 
+def _option_changed_recipients(task: Task, changed_by_user: User) -> set:
     # 담당자 + 참조자 모두에게 알림 (중복 제거)
     notify_user_ids = set(task.assigned_member_ids or [])
     notify_user_ids.update(task.observer_ids or [])
     notify_user_ids.discard(changed_by_user.id)
+    return notify_user_ids
+
+
+def _participants(task: Task, actor: User) -> set:
+    """담당자 + 참조자 + 작업 생성자 (행위자 제외)"""
+    notify_user_ids = set(task.assigned_member_ids or [])
+    notify_user_ids.update(task.observer_ids or [])
+    if task.creator_id:
+        notify_user_ids.add(task.creator_id)
+    notify_user_ids.discard(actor.id)
+    return notify_user_ids
 
-    for user_id in notify_user_ids:
-        title = f"작업 '{task_title}'의 옵션이 변경되었습니다"
-        create_notification(
-            db=db,
-            notification_type=NotificationType.TASK_OPTION_CHANGED,
-            user_id=user_id,
-            title=title,
-            message=message,
-            project_id=task.project_id,
-            task_id=task.id,
-        )
+
+def notify_task_option_changed(
+    db: Session,
+    task: Task,
+    changed_by_user: User,
+    changed_fields: list,
+    *,
+    transitions: Optional[Dict[str, Tuple[Any, Any]]] = None,
+):
+    """작업 옵션 변경 알림 (중요도, 상태, 날짜).
+
+    transitions 예: {'status': ('backlog', 'inProgress'), 'priority': ('p2', 'p0')}
+    """
+    title, message = _option_changed_content(task, changed_by_user, changed_fields, transitions)
+    create_notifications_bulk(
+        db=db,
+        notification_type=NotificationType.TASK_OPTION_CHANGED,
+        user_ids=_option_changed_recipients(task, changed_by_user),
+        title=title,
+        message=message,
+        project_id=task.project_id,
+        task_id=task.id,
+    )
+
+
+def notify_tasks_bulk_updated(db: Session, changes: List[dict], actor: User):
+    """일괄 수정 알림 — 수신자마다 1건으로 합친다.
+
+    changes: [{"task", "changed_fields", "transitions", "added_member_ids", "doc_title"}]
+    한 수신자에게 해당하는 알림이 1건이면 단건 수정과 같은 알림을, 여러 건이면 요약 알림 1건을 보낸다.
+    """
+    added_ids = {uid for change in changes for uid in change.get("added_member_ids") or []}
+    existing_ids = set()
+    if added_ids:
+        existing_ids = {row[0] for row in db.query(User.id).filter(User.id.in_(list(added_ids))).all()}
+
+    items_by_user: Dict[str, List[dict]] = {}
+
+    def add(user_ids, notification_type, task, title, message):
+        item = {
+            "notification_type": notification_type,
+            "title": title,
+            "message": message,
+            "project_id": task.project_id,
+            "task_id": task.id,
+            "task_title": task.title,
+        }
+        for uid in user_ids:
+            items_by_user.setdefault(uid, []).append(item)
+
+    for change in changes:
+        task = change["task"]
+        assigned = [uid for uid in change.get("added_member_ids") or [] if uid in existing_ids]
+        if assigned:
+            add(
+                assigned, NotificationType.TASK_ASSIGNED, task,
+                f"작업 '{task.title}'의 할당자로 임명되었습니다",
+                f"{actor.username}님이 '{task.title}' 작업의 할당자로 당신을 임명했습니다.",
+            )
+        if change.get("doc_title"):
+            add(
+                _participants(task, actor), NotificationType.TASK_DOCUMENT_ADDED, task,
+                f"작업 '{task.title}'에 문서가 추가되었습니다",
+                f"{actor.username}님이 '{task.title}' 작업에 문서 '{change['doc_title']}'을(를) 추가했습니다.",
+            )
+        if change.get("changed_fields"):
+            title, message = _option_changed_content(
+                task, actor, change["changed_fields"], change.get("transitions")
+            )
+            add(_option_changed_recipients(task, actor), NotificationType.TASK_OPTION_CHANGED, task, title, message)
+
+    # 같은 내용끼리 묶어 create_notifications_batch 의 group 으로
+    groups: Dict[tuple, dict] = {}
+    for user_id, items in items_by_user.items():
+        if len(items) == 1:
+            item = items[0]
+        else:
+            titles = list(dict.fromkeys(i["task_title"] for i in items))
+            names = ", ".join(f"'{t}'" for t in titles[:3])
+            if len(titles) > 3:
+                names += f" 외 {len(titles) - 3}개"
+            types = {i["notification_type"] for i in items}
+            project_ids = {i["project_id"] for i in items}
+            task_ids = {i["task_id"] for i in items}
+            if len(titles) == 1:
+                # 한 작업에 대한 여러 알림 (예: 담당자 지정 + 상태 변경) — 문구를 이어 붙인다
+                title = f"작업 '{titles[0]}'이(가) 변경되었습니다"
+                message = " ".join(i["message"] for i in items)
+            else:
+                title = f"작업 {len(titles)}개가 변경되었습니다"
+                message = f"{actor.username}님이 {names} 작업을 변경했습니다."
+            item = {
+                "notification_type": types.pop() if len(types) == 1 else NotificationType.TASK_OPTION_CHANGED,
+                "title": title,
+                "message": message,
+                "project_id": project_ids.pop() if len(project_ids) == 1 else None,
+                "task_id": task_ids.pop() if len(task_ids) == 1 else None,
+            }
+        key = (item["notification_type"], item["title"], item["message"], item["project_id"], item["task_id"])
+        group = groups.setdefault(key, {
+            "notification_type": item["notification_type"],
+            "title": item["title"],
+            "message": item["message"],
+            "project_id": item["project_id"],
+            "task_id": item["task_id"],
+            "user_ids": [],
+        })
+        group["user_ids"].append(user_id)
+
+    create_notifications_batch(db, list(groups.values()))
 
 
 def _notify_task_participants(
@@ -269,22 +444,15 @@ def _notify_task_participants(
     message: str,
 ):
     """담당자 + 참조자 + 작업 생성자에게 알림 (행위자 제외, 중복 제외)"""
-    notify_user_ids = set(task.assigned_member_ids or [])
-    notify_user_ids.update(task.observer_ids or [])
-    if task.creator_id:
-        notify_user_ids.add(task.creator_id)
-    notify_user_ids.discard(actor.id)
-
-    for user_id in notify_user_ids:
-        create_notification(
-            db=db,
-            notification_type=notification_type,
-            user_id=user_id,
-            title=title,
-            message=message,
-            project_id=task.project_id,
-            task_id=task.id,
-        )
+    create_notifications_bulk(
+        db=db,
+        notification_type=notification_type,
+        user_ids=_participants(task, actor),
+        title=title,
+        message=message,
+        project_id=task.project_id,
+        task_id=task.id,
+    )
 
 
 def notify_task_document_added(
@@ -347,15 +515,14 @@ def notify_task_comment_added(
         notify_user_ids.add(task.creator_id)
     notify_user_ids.discard(comment_author.id)
 
-    for user_id in notify_user_ids:
-        create_notification(
-            db=db,
-            notification_type=NotificationType.TASK_COMMENT_ADDED,
-            user_id=user_id,
-            title=f"작업 '{task.title}'에 새로운 코멘트가 추가되었습니다",
-            message=f"{comment_author.username}님이 '{task.title}' 작업에 코멘트를 남겼습니다.",
-            project_id=task.project_id,
-            task_id=task.id,
-            comment_id=comment_id,
-        )
+    create_notifications_bulk(
+        db=db,
+        notification_type=NotificationType.TASK_COMMENT_ADDED,
+        user_ids=notify_user_ids,
+        title=f"작업 '{task.title}'에 새로운 코멘트가 추가되었습니다",
+        message=f"{comment_author.username}님이 '{task.title}' 작업에 코멘트를 남겼습니다.",
+        project_id=task.project_id,
+        task_id=task.id,
+        comment_id=comment_id,
+    )
 
@@ -0,0 +1,84 @@
+"""
+희소(sparse) 정렬 키
+
+display_order 를 0, 1, 2 ... 로 빽빽하게 매기면 카드 하나를 옮길 때마다 뒤의 카드 전부를 다시 써야 한다.
+대신 ORDER_STEP 간격으로 띄워 두고, 옮긴 카드만 이웃 키 사이의 값으로 바꾼다.
+
+plan_reorder(keys) 는 "원하는 순서대로 나열한 현재 키" 를 받아,
+이미 순서가 맞는 카드(최장 증가 부분열)는 그대로 두고 나머지 카드의 새 키만 돌려준다.
+이웃 사이에 빈 자리가 없으면 그 목록 전체를 ORDER_STEP 간격으로 다시 매긴다.
+"""
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+ORDER_STEP = 1024
+
+# display_order 는 INTEGER 컬럼
+_MIN_KEY = -(2 ** 31)
+_MAX_KEY = 2 ** 31 - 1
+
+
+def _increasing_indexes(keys: Sequence[int]) -> List[int]:
+    """엄격 증가 부분열 중 가장 긴 것의 인덱스 목록 (O(n log n))"""
+    tails: List[int] = []       # 길이별 마지막 키
+    tail_index: List[int] = []  # 길이별 마지막 인덱스
+    prev: List[Optional[int]] = [None] * len(keys)
+    for i, key in enumerate(keys):
+        pos = bisect_left(tails, key)
+        if pos == len(tails):
+            tails.append(key)
+            tail_index.append(i)
+        else:
+            tails[pos] = key
+            tail_index[pos] = i
+        prev[i] = tail_index[pos - 1] if pos else None
+    out: List[int] = []
+    i = tail_index[-1] if tail_index else None
+    while i is not None:
+        out.append(i)
+        i = prev[i]
+    return out[::-1]
+
+
+def _fill(lo: Optional[int], hi: Optional[int], count: int) -> Optional[List[int]]:
+    """lo 와 hi 사이(양끝 제외)에 count 개의 증가하는 키. 자리가 없으면 None"""
+    if lo is None and hi is None:
+        values = [ORDER_STEP * (i + 1) for i in range(count)]
+    elif lo is None:
+        values = [hi - ORDER_STEP * (count - i) for i in range(count)]
+    elif hi is None:
+        values = [lo + ORDER_STEP * (i + 1) for i in range(count)]
+    else:
+        gap = hi - lo
+        if gap <= count:
+            return None
+        values = [lo + gap * (i + 1) // (count + 1) for i in range(count)]
+    if values and (values[0] < _MIN_KEY or values[-1] > _MAX_KEY):
+        return None
+    return values
+
+
+def plan_reorder(keys: Sequence[Optional[int]]) -> Dict[int, int]:
+    """원하는 순서의 현재 키 목록 -> {위치: 새 키} (바뀌는 위치만)"""
+    keys = [k if k is not None else 0 for k in keys]
+    kept = _increasing_indexes(keys)
+
+    changes: Dict[int, int] = {}
+    anchors = [-1] + kept + [len(keys)]
+    for left, right in zip(anchors, anchors[1:]):
+        count = right - left - 1
+        if count <= 0:
+            continue
+        lo = keys[left] if left >= 0 else None
+        hi = keys[right] if right < len(keys) else None
+        values = _fill(lo, hi, count)
+        if values is None:
+            # 빈 자리가 없음 — 목록 전체를 다시 매긴다
+            return {
+                i: ORDER_STEP * (i + 1)
+                for i in range(len(keys))
+                if keys[i] != ORDER_STEP * (i + 1)
+            }
+        for offset, value in enumerate(values):
+            changes[left + 1 + offset] = value
+    return changes
@@ -0,0 +1,136 @@
+"""
+키셋(커서) 페이지네이션 유틸
+
+offset(skip) 방식은 깊은 페이지일수록 앞의 행을 모두 읽고 버려야 하므로 느려진다.
+커서 방식은 "마지막으로 받은 행의 정렬 키" 이후만 조회하므로 페이지 깊이와 무관하게 O(limit).
+
+    order = [(Notification.created_at, True), (Notification.id, True)]   # (컬럼, desc)
+    query = apply_keyset(query, order, cursor)
+    rows = (await db.scalars(query.limit(limit + 1))).all()
+    items, next_cursor = split_page(rows, limit, order)
+
+커서는 정렬 키 값 목록을 JSON → base64url 로 인코딩한 불투명 문자열이다.
+정렬 마지막 키는 반드시 고유 컬럼(id)이어야 한다.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+KeysetOrder = Sequence[Tuple[Any, bool]]
+
+# total 파라미터 값
+TOTAL_EXACT = "exact"
+TOTAL_APPROX = "approx"
+TOTAL_NONE = "none"
+
+
+def _dump(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if hasattr(value, "value"):  # Enum
+        return value.value
+    return value
+
+
+def _load(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$d" in value:
+            return date.fromisoformat(value["$d"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_dump(v) for v in values], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("cursor size mismatch")
+        return [_load(v) for v in values]
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다",
+        )
+
+
+def keyset_after(order: KeysetOrder, values: Sequence[Any]):
+    """정렬 순서상 values 다음에 오는 행 조건"""
+    directions = {desc for _, desc in order}
+    if len(directions) == 1:
+        # 방향이 모두 같으면 row 비교 — 복합 인덱스를 그대로 탄다
+        cols = tuple_(*[col for col, _ in order])
+        vals = tuple_(*values)
+        return cols < vals if directions.pop() else cols > vals
+
+    clauses = []
+    for i, (col, desc) in enumerate(order):
+        prefix = [order[j][0] == values[j] for j in range(i)]
+        clauses.append(and_(*prefix, col < values[i] if desc else col > values[i]))
+    return or_(*clauses)
+
+
+def apply_keyset(query, order: KeysetOrder, cursor: Optional[str]):
+    """query 에 정렬 + (커서가 있으면) 커서 이후 조건을 붙인다. 빈 커서는 첫 페이지."""
+    if cursor:
+        query = query.where(keyset_after(order, decode_cursor(cursor, len(order))))
+    return query.order_by(*[col.desc() if desc else col.asc() for col, desc in order])
+
+
+def split_page(
+    rows: Sequence[Any],
+    limit: int,
+    order: Optional[KeysetOrder] = None,
+    key: Optional[Callable[[Any], Sequence[Any]]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """limit + 1 개로 조회한 rows 를 (이번 페이지, 다음 커서) 로 나눈다.
+
+    key 가 없으면 order 의 컬럼 이름으로 ORM 객체 속성을 읽는다.
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    if key is None:
+        values = [getattr(last, col.key) for col, _ in order]
+    else:
+        values = key(last)
+    return items, encode_cursor(values)
+
+
+async def estimate_count(db: AsyncSession, query) -> Optional[int]:
+    """EXPLAIN 의 예상 행 수 — 큰 목록에서 정확한 count(*) 대신 사용. 실패 시 None."""
+    try:
+        conn = await db.connection()
+        sql = query.order_by(None).compile(
+            dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+        ).string
+        plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        print(f"[Pagination] 예상 건수 계산 실패: {e}")
+        return None
+
+
+async def count_rows(db: AsyncSession, query, mode: str = TOTAL_EXACT) -> Optional[int]:
+    """mode 에 따라 정확한 건수 / 예상 건수 / None"""
+    if mode == TOTAL_APPROX:
+        return await estimate_count(db, query)
+    if mode == TOTAL_EXACT:
+        return await db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+    return None
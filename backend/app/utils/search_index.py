@@ -0,0 +1,242 @@
+"""
+전문 검색(full-text search) 인덱스
+
+Postgres 기본 텍스트 검색 사전에는 한국어가 없고, 한국어는 조사가 붙어("작업을", "작업이")
+공백 단위 토큰으로는 부분 검색이 되지 않는다. 그래서 단어마다 2-gram 을 함께 색인한다.
+
+    "버그를 수정" -> 버그를 버그 그를 수정
+
+- 문서 쪽: dora_search_terms(text) 가 단어 + 2-gram 을 위치 순서대로 나열하고,
+  각 테이블의 search_vector 생성 컬럼(GENERATED ... STORED)이 이를 tsvector 로 저장한다.
+  INSERT/UPDATE 시 Postgres 가 해당 행만 다시 계산하므로 별도 재색인 작업이 없다.
+- 질의 쪽: dora_search_query(q) 가 단어를 2-gram 구문(<->)으로 바꾼다.
+  "작업을" -> '작업' <-> '업을'  (같은 단어 안에서 연속된 2-gram 만 일치)
+  1글자 단어는 접두어 검색(:*)으로 처리한다.
+- 순위는 ts_rank_cd, 가중치는 제목(A) > 설명(B) > 상세/본문(C).
+
+긴 문서의 한계: tsvector 의 위치 값은 16383 을 넘으면 16383 으로 고정되고(여러 컬럼을 || 로 합치면 행 전체가
+이 범위를 나눠 쓴다), 한 어휘(lexeme)는 위치를 최대 256 개까지만 가진다. dora_search_terms 는 글자당 용어를
+대략 하나씩 내므로 그 뒤로는 <-> 구문 검색이 조용히 놓친다. 그래서
+- 컬럼마다 색인할 용어 수를 정해(SEARCH_VECTOR_COLUMNS 의 max_terms, 행 합계 < 16383) 앞부분만 색인하고
+- 본문이 LONG_TEXT_CHARS 보다 긴 행은 ILIKE 로도 찾는다 (꼬리 부분 / 256 위치를 넘은 흔한 2-gram).
+  긴 행만 담는 부분 인덱스가 있어 GIN 검색과 BitmapOr 로 합쳐진다.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, literal_column, or_, text
+from sqlalchemy.engine import Connection
+
+# tsvector 위치 상한 (이 값을 넘는 위치는 모두 이 값으로 고정된다)
+MAX_TSVECTOR_POSITION = 16383
+# 이보다 긴 본문은 흔한 2-gram 이 위치 256 개를 넘을 수 있으므로 ILIKE 로도 검색
+LONG_TEXT_CHARS = 4000
+
+SEARCH_FUNCTIONS_SQL = [
+    # 용어는 대략 글자당 1개 — 앞 max_terms * 2 글자만 잘라 읽고, 그중 앞 max_terms 개만 쓴다
+    """
+    CREATE OR REPLACE FUNCTION dora_search_terms(src text, max_terms int) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT coalesce(string_agg(t.term, ' ' ORDER BY t.wn, t.pos), '')
+        FROM (
+            SELECT w.wn, 0 AS pos, w.word AS term
+            FROM regexp_split_to_table(lower(left(coalesce(src, ''), max_terms * 2)), '[[:space:][:punct:]]+')
+                 WITH ORDINALITY AS w(word, wn)
+            WHERE w.word <> ''
+            UNION ALL
+            SELECT w.wn, g.i, substr(w.word, g.i, 2)
+            FROM regexp_split_to_table(lower(left(coalesce(src, ''), max_terms * 2)), '[[:space:][:punct:]]+')
+                 WITH ORDINALITY AS w(word, wn),
+                 generate_series(1, char_length(w.word) - 1) AS g(i)
+            WHERE char_length(w.word) > 2
+            ORDER BY 1, 2
+            LIMIT max_terms
+        ) t
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION dora_search_vector(src text, weight "char", max_terms int) RETURNS tsvector
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT setweight(to_tsvector('simple'::regconfig, dora_search_terms(src, max_terms)), weight)
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION dora_search_query(q text) RETURNS tsquery
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT to_tsquery('simple'::regconfig, coalesce(string_agg(
+            CASE
+                WHEN char_length(w.word) = 1 THEN quote_literal(w.word) || ':*'
+                WHEN char_length(w.word) = 2 THEN quote_literal(w.word)
+                ELSE (
+                    SELECT string_agg(quote_literal(substr(w.word, g.i, 2)), ' <-> ' ORDER BY g.i)
+                    FROM generate_series(1, char_length(w.word) - 1) AS g(i)
+                )
+            END,
+            ' & ' ORDER BY w.wn
+        ), ''))
+        FROM regexp_split_to_table(lower(coalesce(q, '')), '[[:space:][:punct:]]+')
+             WITH ORDINALITY AS w(word, wn)
+        WHERE w.word <> ''
+    $$
+    """,
+]
+
+# 테이블별 search_vector 생성식 — 컬럼별 max_terms 합이 MAX_TSVECTOR_POSITION 보다 작아야 한다
+SEARCH_VECTOR_COLUMNS: Dict[str, str] = {
+    "tasks": (
+        "dora_search_vector(title, 'A', 500) || dora_search_vector(description, 'B', 4000) "
+        "|| dora_search_vector(detail, 'C', 11000)"
+    ),
+    "comments": "dora_search_vector(content, 'B', 16000)",
+    "meeting_minutes": "dora_search_vector(title, 'A', 500) || dora_search_vector(content, 'C', 15500)",
+    "chat_messages": "dora_search_vector(content, 'B', 16000)",
+}
+
+# 긴 본문 ILIKE 보조 검색 대상 컬럼
+LONG_TEXT_COLUMNS: Dict[str, List[str]] = {
+    "tasks": ["description", "detail"],
+    "comments": ["content"],
+    "meeting_minutes": ["content"],
+    "chat_messages": ["content"],
+}
+
+
+def _long_text_predicate(table: str, qualified: bool = True) -> str:
+    """부분 인덱스 조건과 검색 조건이 같은 식이어야(상수 포함) 플래너가 인덱스를 쓴다"""
+    prefix = f"{table}." if qualified else ""
+    return " OR ".join(
+        f"char_length({prefix}{column}) > {LONG_TEXT_CHARS}" for column in LONG_TEXT_COLUMNS[table]
+    )
+
+
+def ensure_search_index(conn: Connection) -> List[str]:
+    """검색 함수 / search_vector 생성 컬럼 / GIN 인덱스 생성. 새로 추가된 테이블 목록을 반환."""
+    for sql in SEARCH_FUNCTIONS_SQL:
+        conn.execute(text(sql))
+
+    added = []
+    for table, expression in SEARCH_VECTOR_COLUMNS.items():
+        exists = conn.execute(text("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = :table AND column_name = 'search_vector'
+        """), {"table": table}).fetchone()
+        if exists is None:
+            # 기존 행은 컬럼 추가 시 한 번에 계산된다 (테이블 재작성)
+            conn.execute(text(
+                f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+                f"GENERATED ALWAYS AS ({expression}) STORED"
+            ))
+            added.append(table)
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_search_vector ON {table} USING gin (search_vector)"
+        ))
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_search_long_text ON {table} (id) "
+            f"WHERE {_long_text_predicate(table, qualified=False)}"
+        ))
+    return added
+
+
+def rebuild_search_vectors(conn: Connection) -> List[str]:
+    """생성식이 바뀌었을 때 — search_vector 컬럼을 지우고 새 식으로 다시 만든다 (테이블 재작성)"""
+    for table in SEARCH_VECTOR_COLUMNS:
+        conn.execute(text(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector"))
+    conn.execute(text('DROP FUNCTION IF EXISTS dora_search_vector(text, "char")'))
+    conn.execute(text("DROP FUNCTION IF EXISTS dora_search_terms(text)"))
+    return ensure_search_index(conn)
+
+
+def search_vector(table: str):
+    """모델에 선언하지 않은 search_vector 컬럼 참조 (ORM 로드 시 tsvector 를 읽지 않도록)"""
+    return literal_column(f"{table}.search_vector")
+
+
+def search_query(q: str):
+    return func.dora_search_query(q)
+
+
+def search_rank(table: str, q: str):
+    return func.ts_rank_cd(search_vector(table), search_query(q))
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def search_match(table: str, q: str):
+    """search_vector 일치, 또는 긴 본문에서 모든 검색 단어가 나오는 행"""
+    match = search_vector(table).op("@@")(search_query(q))
+    terms = query_terms(q)
+    if not terms:
+        return match
+    columns = [literal_column(f"{table}.{column}") for column in LONG_TEXT_COLUMNS[table]]
+    long_text = and_(
+        literal_column(f"({_long_text_predicate(table)})"),
+        *[or_(*[column.ilike(_like_pattern(term), escape="\\") for column in columns]) for term in terms],
+    )
+    return or_(match, long_text)
+
+
+# --- 스니펫 ------------------------------------------------------------------
+
+_SPLIT_RE = re.compile(r"[\s!-/:-@\[-`{-~]+")
+
+
+def query_terms(q: str) -> List[str]:
+    """dora_search_query 와 같은 규칙으로 나눈 검색 단어 (소문자)"""
+    return [w for w in _SPLIT_RE.split(q.lower()) if w]
+
+
+def build_snippet(
+    content: Optional[str],
+    terms: List[str],
+    radius: int = 60,
+) -> Optional[dict]:
+    """본문에서 첫 일치 위치 주변을 잘라 스니펫과 하이라이트 구간을 만든다.
+
+    반환: {"text": str, "highlights": [[start, end], ...]} (스니펫 기준 오프셋), 일치가 없으면 None
+    """
+    if not content or not terms:
+        return None
+    lowered = content.lower()
+    positions = [(lowered.find(t), t) for t in terms]
+    positions = [(p, t) for p, t in positions if p >= 0]
+    if not positions:
+        return None
+
+    first = min(p for p, _ in positions)
+    start = max(0, first - radius)
+    end = min(len(content), first + radius * 2)
+    # 단어 중간에서 자르지 않도록 공백 위치로 맞춤
+    if start > 0:
+        space = content.rfind(" ", start - 15, start)
+        if space != -1:
+            start = space + 1
+    if end < len(content):
+        space = content.find(" ", end, end + 15)
+        if space != -1:
+            end = space
+
+    window = lowered[start:end]
+    spans: List[Tuple[int, int]] = []
+    for term in terms:
+        idx = window.find(term)
+        while idx != -1:
+            spans.append((idx, idx + len(term)))
+            idx = window.find(term, idx + len(term))
+    spans.sort()
+    merged: List[List[int]] = []
+    for s, e in spans:
+        if merged and s <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], e)
+        else:
+            merged.append([s, e])
+
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(content) else ""
+    offset = len(prefix)
+    return {
+        "text": f"{prefix}{content[start:end]}{suffix}",
+        "highlights": [[s + offset, e + offset] for s, e in merged],
+    }
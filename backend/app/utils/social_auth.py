@@ -2,8 +2,6 @@
 from typing import Any, Dict, Optional
 
 import httpx
-from google.auth.transport import requests as google_requests
-from google.oauth2 import id_token as google_id_token
 
 from app.config import settings
 
@@ -106,6 +104,10 @@ async def exchange_kakao_auth_code(
 
 def verify_google_token(raw_id_token: str) -> Dict[str, Optional[str]]:
     """Verify a Google ID token and return normalized user info."""
+    # google-auth pulls in requests/urllib3; import on first Google login instead of at startup.
+    from google.auth.transport import requests as google_requests
+    from google.oauth2 import id_token as google_id_token
+
     audience = settings.GOOGLE_CLIENT_ID or None
     try:
         payload = google_id_token.verify_oauth2_token(
@@ -0,0 +1,40 @@
+"""
+기동 단계별 소요 시간 기록
+
+with startup_phase("routers"):
+    ...
+처럼 단계를 감싸면 프로세스 시작 시각 기준으로 단계별 시간을 모아 두고, report() 로 한 번에 출력한다.
+app.main 은 import(라우터/앱 구성) 단계를, 마지막 startup 훅은 훅 단계와 총 기동 시간을 기록한다.
+"""
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+# 이 모듈이 처음 import 된 시각 — app.main 이 가장 먼저 import 하므로 기동 시작 기준으로 쓴다
+STARTED_AT = time.perf_counter()
+
+_phases: List[Tuple[str, float]] = []
+
+
+@contextmanager
+def startup_phase(name: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases.append((name, (time.perf_counter() - started) * 1000))
+
+
+def record_phase(name: str, started: float) -> None:
+    """started(perf_counter 값)부터 지금까지를 한 단계로 기록"""
+    _phases.append((name, (time.perf_counter() - started) * 1000))
+
+
+def phases() -> List[Tuple[str, float]]:
+    return list(_phases)
+
+
+def report(tag: str = "startup") -> None:
+    total = (time.perf_counter() - STARTED_AT) * 1000
+    detail = ", ".join(f"{name} {ms:.0f}ms" for name, ms in _phases)
+    print(f"[{tag}] ready in {total:.0f}ms ({detail})")
@@ -0,0 +1,106 @@
+"""
+태스크 변경 이력 (task_events)
+
+상태/중요도/담당자 변경은 task_events 에 한 행씩 INSERT 한다 (기존 JSON 배열 재작성 대신).
+응답의 status_history / priority_history / assignment_history 는 필요한 곳에서
+attach_task_history() 로 한 번에 읽어 태스크 인스턴스에 붙인다 — 태스크 조회 자체는 이력을 읽지 않는다.
+
+    db.add(task_event(task.id, STATUS, current_user.id, {...}))
+    await attach_task_history(db, tasks)
+"""
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task_event import TaskEvent
+
+STATUS = "status"
+PRIORITY = "priority"
+ASSIGNMENT = "assignment"
+
+# kind -> TaskResponse 필드
+HISTORY_FIELDS = {
+    STATUS: "status_history",
+    PRIORITY: "priority_history",
+    ASSIGNMENT: "assignment_history",
+}
+
+# kind -> data 안의 시각 키 (백필 시 at 컬럼 값)
+_TIME_KEYS = {
+    STATUS: "changedAt",
+    PRIORITY: "changedAt",
+    ASSIGNMENT: "assignedAt",
+}
+
+
+def task_event(task_id: str, kind: str, user_id: Optional[str], data: dict, at: Optional[datetime] = None) -> TaskEvent:
+    """이력 이벤트 1건. data 는 기존 *_history 배열 항목과 같은 모양"""
+    return TaskEvent(
+        task_id=task_id,
+        kind=kind,
+        user_id=user_id,
+        at=at or datetime.now(timezone.utc),
+        data=data,
+    )
+
+
+async def attach_task_history(db: AsyncSession, tasks: Iterable) -> None:
+    """tasks 의 이력을 한 번의 쿼리로 읽어 *_history 속성에 채운다 (TaskResponse 직렬화용)"""
+    tasks = [t for t in tasks if t is not None]
+    if not tasks:
+        return
+    histories = {t.id: {field: [] for field in HISTORY_FIELDS.values()} for t in tasks}
+    rows = (await db.execute(
+        select(TaskEvent.task_id, TaskEvent.kind, TaskEvent.data)
+        .where(TaskEvent.task_id.in_(list(histories)))
+        .order_by(TaskEvent.task_id, TaskEvent.at, TaskEvent.id)
+    )).all()
+    for task_id, kind, data in rows:
+        field = HISTORY_FIELDS.get(kind)
+        if field:
+            histories[task_id][field].append(data)
+    for t in tasks:
+        for field, values in histories[t.id].items():
+            setattr(t, field, values)
+
+
+def _backfill_select(kind: str, column: str) -> str:
+    time_key = _TIME_KEYS[kind]
+    user_key = "assignedBy" if kind == ASSIGNMENT else "userId"
+    return f"""
+    SELECT t.id, '{kind}', nullif(h.value->>'{user_key}', ''),
+           CASE WHEN h.value->>'{time_key}' ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}'
+                THEN (h.value->>'{time_key}')::timestamptz
+                ELSE t.created_at END,
+           h.value, h.n
+    FROM tasks t
+    CROSS JOIN LATERAL json_array_elements(
+        CASE WHEN json_typeof(t.{column}) = 'array' THEN t.{column} ELSE '[]'::json END
+    ) WITH ORDINALITY AS h(value, n)
+    """
+
+
+# 배열 순서를 id 순서로 보존하기 위해 (태스크, 종류, 배열 위치) 순으로 넣는다
+BACKFILL_SQL = f"""
+INSERT INTO task_events (task_id, kind, user_id, at, data)
+SELECT task_id, kind, user_id, at, data FROM (
+    {" UNION ALL ".join(_backfill_select(kind, field) for kind, field in HISTORY_FIELDS.items())}
+) AS e(task_id, kind, user_id, at, data, n)
+ORDER BY task_id, kind, n
+"""
+
+
+def has_legacy_history_columns(conn: Connection) -> bool:
+    return bool(conn.execute(text("""
+        SELECT count(*) = 3 FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'tasks'
+          AND column_name IN ('status_history', 'priority_history', 'assignment_history')
+    """)).scalar())
+
+
+def backfill_task_events(conn: Connection) -> int:
+    """tasks 의 JSON 이력 컬럼을 task_events 로 옮긴다. 넣은 행 수 반환 (커밋은 호출 측)"""
+    return conn.execute(text(BACKFILL_SQL)).rowcount
@@ -0,0 +1,42 @@
+"""
+활동 히트맵 롤업(task_activity_daily) 재계산.
+
+기존 태스크 생성 / done 상태 변경 이력(task_events) / 댓글로 롤업 행을 채운다.
+이미 있는 행은 건너뛰므로 여러 번 실행해도 안전하다. --rebuild 를 주면 비운 뒤 다시 채운다.
+
+Usage:
+  cd backend
+  python scripts/backfill_task_activity.py
+  python scripts/backfill_task_activity.py --rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from app.utils.activity import backfill_task_activity  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rebuild", action="store_true", help="기존 롤업을 지우고 다시 채움")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        if args.rebuild:
+            conn.execute(text("TRUNCATE task_activity_daily"))
+        inserted = backfill_task_activity(conn)
+    print(f"[backfill] task_activity_daily {inserted:,} 행 추가 ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
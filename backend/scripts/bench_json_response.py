@@ -0,0 +1,138 @@
+"""
+응답 직렬화/압축 비용 측정: TaskResponse 목록 (기본 1,000 / 10,000건).
+
+FastAPI 응답 경로를 그대로 따라간다.
+  1) response_model 검증 + 직렬화 (pydantic-core, 두 응답 클래스 공통)
+  2) 바이트 렌더링 — 표준 json(JSONResponse) vs orjson(ORJSONResponse)
+  3) 압축 — gzip(level) vs brotli(quality, 설치된 경우)
+DB 없이 합성 태스크(한국어 본문 + 상태/담당자 이력)로 측정한다.
+
+Usage:
+  cd backend
+  python scripts/bench_json_response.py
+  python scripts/bench_json_response.py --sizes 1000 10000 50000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.models.task import TaskPriority, TaskStatus  # noqa: E402
+from app.schemas.task import TaskResponse  # noqa: E402
+from app.utils.compression import brotli  # noqa: E402
+
+STATUSES = list(TaskStatus)
+PRIORITIES = list(TaskPriority)
+
+
+def _tasks(count: int) -> list:
+    now = datetime.now(timezone.utc)
+    tasks = []
+    for i in range(count):
+        created = now - timedelta(minutes=i)
+        tasks.append(SimpleNamespace(
+            id=f"00000000-0000-4000-8000-{i:012d}",
+            display_id=i + 1,
+            title=f"로그인 화면에서 오류가 발생하는 문제 수정 #{i}",
+            description="사용자가 소셜 로그인 후 대시보드로 이동하지 못하는 현상. 재현 절차와 로그를 첨부합니다.",
+            status=STATUSES[i % len(STATUSES)],
+            project_id=f"project-{i % 20}",
+            start_date=created,
+            end_date=created + timedelta(days=3) if i % 2 else None,
+            detail="배포 전 검토 필요. websocket 재연결 시 알림이 중복으로 표시됨." * 2,
+            detail_image_urls=[f"/api/uploads/images/{i}.png"] if i % 5 == 0 else [],
+            priority=PRIORITIES[i % len(PRIORITIES)],
+            assigned_member_ids=[f"user-{i % 50}", f"user-{(i * 7) % 50}"],
+            observer_ids=[f"user-{(i * 3) % 50}"],
+            sprint_id=None,
+            parent_task_id=None,
+            document_links=[{"title": "기획서", "url": "https://example.com/doc"}] if i % 4 == 0 else [],
+            site_tags=["MBC"] if i % 3 == 0 else [],
+            source_meeting_minutes_id=None,
+            source_line_id=None,
+            creator_id=f"user-{i % 50}",
+            comment_ids=[f"comment-{i}-{k}" for k in range(i % 4)],
+            display_order=(i + 1) * 1024,
+            status_history=[
+                {"fromStatus": "backlog", "toStatus": "inProgress", "userId": f"user-{i % 50}",
+                 "username": "홍길동", "changedAt": created.isoformat()},
+            ],
+            assignment_history=[
+                {"assignedUserId": f"user-{i % 50}", "assignedBy": f"user-{(i * 7) % 50}",
+                 "assignedByUsername": "김철수", "assignedAt": created.isoformat()},
+            ],
+            priority_history=[],
+            created_at=created,
+            updated_at=created,
+        ))
+    return tasks
+
+
+def _median_ms(fn, repeat: int):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def run(args) -> None:
+    field = create_response_field(name="bench", type_=List[TaskResponse])
+    print(f"{'items':>7} {'step':<28} {'median (ms)':>12} {'bytes':>12}")
+    for size in args.sizes:
+        tasks = _tasks(size)
+
+        model_ms, content = _median_ms(
+            lambda: asyncio.run(serialize_response(field=field, response_content=tasks)), args.repeat
+        )
+        std_ms, std_body = _median_ms(lambda: JSONResponse(content).body, args.repeat)
+        orjson_ms, orjson_body = _median_ms(lambda: ORJSONResponse(content).body, args.repeat)
+
+        def gzip_body():
+            compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 31)
+            return compressor.compress(orjson_body) + compressor.flush()
+
+        gzip_ms, gzip_out = _median_ms(gzip_body, args.repeat)
+
+        print(f"{size:>7,} {'response_model (pydantic)':<28} {model_ms:>12.1f} {'':>12}")
+        print(f"{'':>7} {'render: json':<28} {std_ms:>12.1f} {len(std_body):>12,}")
+        print(f"{'':>7} {'render: orjson':<28} {orjson_ms:>12.1f} {len(orjson_body):>12,}"
+              f"   ({std_ms / orjson_ms if orjson_ms else 0:.1f}x)")
+        print(f"{'':>7} {f'gzip (level {settings.GZIP_LEVEL})':<28} {gzip_ms:>12.1f} {len(gzip_out):>12,}")
+        if brotli is not None:
+            br_ms, br_out = _median_ms(
+                lambda: brotli.compress(orjson_body, quality=settings.BROTLI_QUALITY), args.repeat
+            )
+            print(f"{'':>7} {f'brotli (quality {settings.BROTLI_QUALITY})':<28} {br_ms:>12.1f} {len(br_out):>12,}")
+        else:
+            print(f"{'':>7} {'brotli':<28} {'(brotli 미설치)':>12}")
+    print("[bench] render 단계만 응답 클래스에 따라 달라지며, 압축은 COMPRESSION_MIN_SIZE 이상 응답에 적용된다")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+워크스페이스 member-stats 성능 비교: 기존(태스크 전체 로드 + 멤버별 Python 필터) vs SQL 집계.
+
+별도 스키마(member_stats_bench)에 public 테이블 구조를 복사해 합성 데이터를 만들고,
+같은 워크스페이스에 대해 두 구현의 지연 시간을 측정하며 응답이 같은지도 확인한다.
+실제 테이블은 건드리지 않으며 --keep 을 주지 않으면 끝난 뒤 스키마를 지운다.
+
+Usage:
+  cd backend
+  python scripts/bench_member_stats.py                 # 멤버 200 x 태스크 100,000
+  python scripts/bench_member_stats.py --members 50 --tasks 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from app.database import async_engine  # noqa: E402
+from app.models.project import Project  # noqa: E402
+from app.models.task import Task, TaskStatus  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.workspace import WorkspaceMember  # noqa: E402
+from app.routers.workspaces import _is_date_task, get_workspace_member_stats  # noqa: E402
+
+SCHEMA = "member_stats_bench"
+WORKSPACE_ID = "bench-ws"
+TABLES = ["users", "workspaces", "workspace_members", "projects", "tasks"]
+
+
+async def _setup(conn, members: int, tasks: int, projects: int) -> None:
+    await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    for table in TABLES:
+        await conn.execute(text(f"CREATE TABLE {SCHEMA}.{table} (LIKE public.{table} INCLUDING ALL)"))
+
+    print(f"[bench] 멤버 {members:,} / 프로젝트 {projects:,} / 태스크 {tasks:,} 생성 중...")
+    started = time.perf_counter()
+    await conn.execute(text(f"""
+        INSERT INTO {SCHEMA}.users (id, username, email, password_hash, is_admin, is_approved, is_pm)
+        SELECT 'u' || g, 'user' || g, 'user' || g || '@bench.local', '', false, true, false
+        FROM generate_series(1, :members) g
+    """), {"members": members})
+    await conn.execute(text(f"""
+        INSERT INTO {SCHEMA}.workspaces (id, name, owner_id, invite_token)
+        VALUES (:ws, 'bench', 'u1', 'bench-token')
+    """), {"ws": WORKSPACE_ID})
+    await conn.execute(text(f"""
+        INSERT INTO {SCHEMA}.workspace_members (id, workspace_id, user_id, role)
+        SELECT 'm' || g, :ws, 'u' || g, CASE WHEN g = 1 THEN 'owner' ELSE 'member' END
+        FROM generate_series(1, :members) g
+    """), {"ws": WORKSPACE_ID, "members": members})
+    await conn.execute(text(f"""
+        INSERT INTO {SCHEMA}.projects (id, name, color, team_member_ids, workspace_id, creator_id)
+        SELECT 'p' || g, 'project ' || g, 4280391411,
+               ARRAY(SELECT 'u' || m FROM generate_series(1, :members) m WHERE m % :projects = g % :projects),
+               :ws, 'u' || (1 + g % :members)
+        FROM generate_series(1, :projects) g
+    """), {"ws": WORKSPACE_ID, "members": members, "projects": projects})
+    # 담당자 1~2명, 상태/우선순위 순환, 날짜는 오늘 전후로 분산
+    await conn.execute(text(f"""
+        INSERT INTO {SCHEMA}.tasks (
+            id, title, description, status, project_id, start_date, end_date, detail,
+            detail_image_urls, assigned_member_ids, observer_ids, comment_ids, priority,
+            display_order, document_links, site_tags, created_at, updated_at
+        )
+        SELECT
+            't' || g, 'task ' || g, '',
+            (ARRAY['BACKLOG','READY','IN_PROGRESS','IN_REVIEW','DONE'])[1 + g % 5]::taskstatus,
+            'p' || (1 + g % :projects),
+            CASE WHEN g % 3 = 0 THEN now() - ((g % 7) || ' days')::interval END,
+            CASE WHEN g % 2 = 0 THEN now() + ((g % 5 - 2) || ' days')::interval END,
+            '', '{{}}',
+            CASE WHEN g % 4 = 0
+                 THEN ARRAY['u' || (1 + g % :members), 'u' || (1 + (g * 7) % :members)]
+                 ELSE ARRAY['u' || (1 + g % :members)] END,
+            '{{}}', '{{}}',
+            (ARRAY['P0','P1','P2','P3'])[1 + g % 4]::taskpriority,
+            0, '[]', '{{}}',
+            now() - (g || ' minutes')::interval,
+            now() - (g || ' minutes')::interval
+        FROM generate_series(1, :tasks) g
+    """), {"members": members, "tasks": tasks, "projects": projects})
+    for table in TABLES:
+        await conn.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+    print(f"[bench] 데이터 생성 {time.perf_counter() - started:.1f}s")
+
+
+async def legacy_member_stats(db: AsyncSession, workspace_id: str) -> dict:
+    """기존 구현 — 워크스페이스 태스크 전체를 읽고 멤버마다 Python 으로 필터"""
+    projects = (await db.scalars(select(Project).where(Project.workspace_id == workspace_id))).all()
+    project_ids = [p.id for p in projects]
+    all_tasks = (await db.scalars(select(Task).where(Task.project_id.in_(project_ids)))).all()
+    memberships = (await db.scalars(select(WorkspaceMember).where(
+        WorkspaceMember.workspace_id == workspace_id
+    ))).all()
+    users = (await db.scalars(select(User).where(User.id.in_([m.user_id for m in memberships])))).all()
+    user_by_id = {u.id: u for u in users}
+
+    status_map = {
+        TaskStatus.BACKLOG: "backlog", TaskStatus.READY: "ready", TaskStatus.IN_PROGRESS: "in_progress",
+        TaskStatus.IN_REVIEW: "in_review", TaskStatus.DONE: "done",
+    }
+    now_utc = datetime.now(timezone.utc)
+    today_start = now_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+    today_end = now_utc.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+    result = []
+    for m in memberships:
+        user = user_by_id.get(m.user_id)
+        if not user:
+            continue
+        member_tasks = [t for t in all_tasks if user.id in (t.assigned_member_ids or [])]
+        counts = {"backlog": 0, "ready": 0, "in_progress": 0, "in_review": 0, "done": 0, "total": len(member_tasks)}
+        for t in member_tasks:
+            key = status_map.get(t.status)
+            if key:
+                counts[key] += 1
+        done = sorted([t for t in member_tasks if t.status == TaskStatus.DONE], key=lambda t: t.updated_at, reverse=True)
+        result.append({
+            "user_id": user.id,
+            "task_counts": counts,
+            "active_tasks": [{"id": t.id} for t in member_tasks if t.status == TaskStatus.IN_PROGRESS][:5],
+            "recent_done": [{"id": t.id} for t in done[:5]],
+            "today_tasks": [{"id": t.id} for t in member_tasks if _is_date_task(t, today_start, today_end)],
+            "all_tasks": [{"id": t.id} for t in member_tasks if t.status != TaskStatus.DONE],
+        })
+    return {"members": result}
+
+
+def _compare(legacy: dict, current: dict, in_progress_ids: set) -> list[str]:
+    """정렬이 정의되지 않은 목록(진행 중 5개, 동률 우선순위)은 집합/크기로 비교"""
+    problems = []
+    current_by_user = {m["user_id"]: m for m in current["members"]}
+    for old in legacy["members"]:
+        new = current_by_user.get(old["user_id"])
+        if new is None:
+            problems.append(f"{old['user_id']}: 누락")
+            continue
+        if old["task_counts"] != new["task_counts"]:
+            problems.append(f"{old['user_id']}: task_counts {old['task_counts']} != {new['task_counts']}")
+        if [t["id"] for t in old["recent_done"]] != [t["id"] for t in new["recent_done"]]:
+            problems.append(f"{old['user_id']}: recent_done 불일치")
+        for field in ("today_tasks", "all_tasks"):
+            if {t["id"] for t in old[field]} != {t["id"] for t in new[field]}:
+                problems.append(f"{old['user_id']}: {field} 불일치")
+        active = [t["id"] for t in new["active_tasks"]]
+        if len(active) != len(old["active_tasks"]) or not set(active) <= in_progress_ids:
+            problems.append(f"{old['user_id']}: active_tasks 불일치")
+    return problems
+
+
+async def _time(fn, repeat: int) -> tuple[float, dict]:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+async def run(args) -> None:
+    admin = SimpleNamespace(id="bench-admin", is_admin=True, is_pm=False)
+    async with async_engine.connect() as conn:
+        await _setup(conn, args.members, args.tasks, args.projects)
+        await conn.commit()
+        try:
+            await conn.execute(text(f"SET search_path TO {SCHEMA}, public"))
+            db = AsyncSession(bind=conn, expire_on_commit=False)
+
+            async def legacy():
+                db.expunge_all()
+                return await legacy_member_stats(db, WORKSPACE_ID)
+
+            async def current():
+                db.expunge_all()
+                return await get_workspace_member_stats(WORKSPACE_ID, db=db, current_user=admin)
+
+            legacy_ms, legacy_result = await _time(legacy, args.repeat)
+            current_ms, current_result = await _time(current, args.repeat)
+            in_progress_ids = set((await conn.execute(
+                text(f"SELECT id FROM {SCHEMA}.tasks WHERE status = 'IN_PROGRESS'")
+            )).scalars())
+            problems = _compare(legacy_result, current_result, in_progress_ids)
+
+            print()
+            print(f"{'impl':<12} {'median (ms)':>12}")
+            print(f"{'legacy':<12} {legacy_ms:>12.1f}")
+            print(f"{'sql':<12} {current_ms:>12.1f}   ({legacy_ms / current_ms if current_ms else 0:.1f}x)")
+            if problems:
+                print(f"[bench] 응답 불일치 {len(problems)}건:")
+                for line in problems[:20]:
+                    print(f"  - {line}")
+                raise SystemExit(1)
+            print(f"[bench] 응답 일치 (멤버 {len(current_result['members']):,}명)")
+        finally:
+            await conn.rollback()
+            if not args.keep:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+                await conn.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--projects", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--keep", action="store_true", help="측정 후 member_stats_bench 스키마 유지")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
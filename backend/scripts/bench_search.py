@@ -0,0 +1,134 @@
+"""
+검색 성능 비교: 기존 ILIKE '%q%' vs search_vector(n-gram tsvector) + GIN.
+
+별도 스키마(search_bench)에 합성 태스크를 만들고, 같은 검색어로 두 방식의 지연 시간을 측정한다.
+실제 테이블은 건드리지 않으며 --keep 을 주지 않으면 끝난 뒤 스키마를 지운다.
+
+Usage:
+  cd backend
+  python scripts/bench_search.py                 # 1,000,000 행
+  python scripts/bench_search.py --rows 100000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from app.utils.search_index import SEARCH_FUNCTIONS_SQL, SEARCH_VECTOR_COLUMNS  # noqa: E402
+
+SCHEMA = "search_bench"
+
+# 합성 데이터 어휘 (한국어 + 영문 혼합)
+WORDS = [
+    "작업을", "버그를", "수정했습니다", "배포", "서버", "회의록", "검토", "요청", "일정이",
+    "변경되었습니다", "로그인", "화면에서", "오류가", "발생", "데이터베이스", "마이그레이션",
+    "api", "timeout", "release", "hotfix", "websocket", "notification", "dashboard", "sprint",
+]
+
+QUERIES = ["버그", "오류가 발생", "websocket", "마이그레이션", "작업", "존재하지않는단어"]
+
+
+def _setup(conn, rows: int) -> None:
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    for sql in SEARCH_FUNCTIONS_SQL:
+        conn.execute(text(sql))
+    words = "ARRAY[" + ",".join(f"'{w}'" for w in WORDS) + "]"
+    n = len(WORDS)
+    print(f"[bench] {rows:,} 행 생성 중...")
+    started = time.perf_counter()
+    conn.execute(text(f"""
+        CREATE TABLE {SCHEMA}.tasks AS
+        SELECT
+            g::text AS id,
+            ({words})[1 + (g * 7) % {n}] || ' ' || ({words})[1 + (g * 13) % {n}] AS title,
+            (SELECT string_agg(({words})[1 + ((g * 31 + k * 17) % {n})], ' ')
+               FROM generate_series(1, 20) k) AS description,
+            (SELECT string_agg(({words})[1 + ((g * 11 + k * 29) % {n})], ' ')
+               FROM generate_series(1, 40) k) AS detail,
+            now() - (g || ' minutes')::interval AS updated_at
+        FROM generate_series(1, :rows) g
+    """), {"rows": rows})
+    print(f"[bench] 데이터 생성 {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    conn.execute(text(
+        f"ALTER TABLE {SCHEMA}.tasks ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_COLUMNS['tasks']}) STORED"
+    ))
+    conn.execute(text(f"CREATE INDEX ON {SCHEMA}.tasks USING gin (search_vector)"))
+    conn.execute(text(f"ANALYZE {SCHEMA}.tasks"))
+    print(f"[bench] search_vector + GIN 인덱스 생성 {time.perf_counter() - started:.1f}s")
+
+
+def _time_query(conn, sql: str, params: dict, repeat: int) -> tuple[float, int]:
+    samples = []
+    count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = conn.execute(text(sql), params).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+        count = rows[0][-1] if rows else 0
+    return statistics.median(samples), count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=30)
+    parser.add_argument("--keep", action="store_true", help="측정 후 search_bench 스키마 유지")
+    args = parser.parse_args()
+
+    # 기존 검색: ILIKE 3개 컬럼 + 별도 count 쿼리
+    ilike_page = f"""
+        SELECT id, 0 FROM {SCHEMA}.tasks
+        WHERE title ILIKE :like OR description ILIKE :like OR detail ILIKE :like
+        ORDER BY updated_at DESC LIMIT :limit
+    """
+    ilike_count = f"""
+        SELECT count(*) FROM {SCHEMA}.tasks
+        WHERE title ILIKE :like OR description ILIKE :like OR detail ILIKE :like
+    """
+    # 새 검색: GIN + 순위 + window count 한 번
+    fts_page = f"""
+        SELECT id, ts_rank_cd(search_vector, dora_search_query(:q)) AS rank, count(*) OVER () AS total
+        FROM {SCHEMA}.tasks
+        WHERE search_vector @@ dora_search_query(:q)
+        ORDER BY rank DESC, updated_at DESC LIMIT :limit
+    """
+
+    with engine.connect() as conn:
+        _setup(conn, args.rows)
+        conn.commit()
+        try:
+            print()
+            print(f"{'query':<20} {'ILIKE page+count (ms)':>22} {'FTS (ms)':>10} {'hits':>10} {'speedup':>8}")
+            for q in QUERIES:
+                params = {"q": q, "like": f"%{q}%", "limit": args.limit}
+                page_ms, _ = _time_query(conn, ilike_page, params, args.repeat)
+                count_ms, ilike_hits = _time_query(conn, ilike_count, params, args.repeat)
+                fts_ms, fts_hits = _time_query(conn, fts_page, params, args.repeat)
+                ilike_ms = page_ms + count_ms
+                print(
+                    f"{q:<20} {ilike_ms:>22.1f} {fts_ms:>10.1f} "
+                    f"{fts_hits:>10,} {ilike_ms / fts_ms if fts_ms else 0:>7.1f}x"
+                    + ("" if fts_hits == ilike_hits else f"  (ILIKE hits={ilike_hits:,})")
+                )
+        finally:
+            if not args.keep:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+                conn.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+태스크 일괄 수정 처리량 비교: PATCH /api/tasks/{id} N회 vs POST /api/tasks/bulk 1회.
+
+실제 DB 에 임시 사용자 2명(수정자/담당자) + 프로젝트 + 태스크를 만들고,
+앱을 프로세스 안에서(ASGI) 호출해 같은 상태 변경을 두 경로로 적용한다.
+담당자가 있으므로 알림 생성 비용도 함께 측정된다. 끝나면 만든 데이터를 모두 지운다.
+
+Usage:
+  cd backend
+  python scripts/bench_task_bulk.py                  # 태스크 100개
+  python scripts/bench_task_bulk.py --tasks 300 --rounds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import httpx  # noqa: E402
+from sqlalchemy import delete, or_  # noqa: E402
+
+from app.database import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.notification import Notification  # noqa: E402
+from app.models.project import Project  # noqa: E402
+from app.models.task import Task, TaskStatus  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.utils.security import create_access_token  # noqa: E402
+
+STATUSES = [TaskStatus.IN_PROGRESS.value, TaskStatus.IN_REVIEW.value]
+
+
+def _setup(count: int) -> dict:
+    suffix = uuid.uuid4().hex[:8]
+    actor = User(
+        id=str(uuid.uuid4()), username=f"bench_actor_{suffix}", email=f"actor_{suffix}@bench.local",
+        password_hash="", is_admin=True, is_approved=True, is_pm=False, favorite_project_ids=[],
+    )
+    member = User(
+        id=str(uuid.uuid4()), username=f"bench_member_{suffix}", email=f"member_{suffix}@bench.local",
+        password_hash="", is_admin=False, is_approved=True, is_pm=False, favorite_project_ids=[],
+    )
+    project = Project(
+        id=str(uuid.uuid4()), name=f"bench {suffix}", team_member_ids=[actor.id, member.id],
+        creator_id=actor.id,
+    )
+    tasks = [
+        Task(
+            id=str(uuid.uuid4()), title=f"bench task {i}", project_id=project.id,
+            assigned_member_ids=[member.id], observer_ids=[], comment_ids=[],
+            detail_image_urls=[], document_links=[], site_tags=[], creator_id=actor.id,
+        )
+        for i in range(count)
+    ]
+    db = SessionLocal()
+    try:
+        db.add_all([actor, member, project])
+        db.flush()
+        db.add_all(tasks)
+        db.commit()
+    finally:
+        db.close()
+    return {
+        "actor_id": actor.id,
+        "member_id": member.id,
+        "project_id": project.id,
+        "task_ids": [t.id for t in tasks],
+    }
+
+
+def _cleanup(data: dict) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(delete(Notification).where(or_(
+            Notification.user_id.in_([data["actor_id"], data["member_id"]]),
+            Notification.project_id == data["project_id"],
+        )))
+        db.execute(delete(Task).where(Task.project_id == data["project_id"]))
+        db.execute(delete(Project).where(Project.id == data["project_id"]))
+        db.execute(delete(User).where(User.id.in_([data["actor_id"], data["member_id"]])))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _per_task(client: httpx.AsyncClient, task_ids: list, new_status: str) -> float:
+    started = time.perf_counter()
+    for task_id in task_ids:
+        response = await client.patch(f"/api/tasks/{task_id}", json={"status": new_status})
+        response.raise_for_status()
+    return time.perf_counter() - started
+
+
+async def _bulk(client: httpx.AsyncClient, task_ids: list, new_status: str) -> float:
+    started = time.perf_counter()
+    response = await client.post(
+        "/api/tasks/bulk",
+        json={"updates": [{"id": task_id, "status": new_status} for task_id in task_ids]},
+    )
+    response.raise_for_status()
+    return time.perf_counter() - started
+
+
+async def run(args) -> None:
+    data = _setup(args.tasks)
+    try:
+        token = create_access_token({"sub": data["actor_id"]})
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", headers={"Authorization": f"Bearer {token}"}
+        ) as client:
+            per_task, bulk = [], []
+            for i in range(args.rounds):
+                per_task.append(await _per_task(client, data["task_ids"], STATUSES[i % 2]))
+                bulk.append(await _bulk(client, data["task_ids"], STATUSES[(i + 1) % 2]))
+
+        per_task_s = statistics.median(per_task)
+        bulk_s = statistics.median(bulk)
+        n = args.tasks
+        print()
+        print(f"{'path':<24} {'median (ms)':>12} {'tasks/s':>10}")
+        print(f"{'PATCH /tasks/{id} x N':<24} {per_task_s * 1000:>12.1f} {n / per_task_s:>10.0f}")
+        print(f"{'POST /tasks/bulk':<24} {bulk_s * 1000:>12.1f} {n / bulk_s:>10.0f}")
+        print(f"[bench] {per_task_s / bulk_s if bulk_s else 0:.1f}x (태스크 {n:,}개, {args.rounds}회 중앙값)")
+    finally:
+        _cleanup(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+AI 요약 사전 생성을 지금 한 번 실행한다 (스케줄러와 같은 대상/규칙).
+
+최근 AI_PRECOMPUTE_ACTIVE_DAYS 일 안에 조회된 (사용자, 워크스페이스, 범위) 중 오늘 요약이 없는 것만 만든다.
+--fake 는 Gemini 대신 로컬 가짜 클라이언트를 써서 외부 호출 없이 흐름/소요 시간만 확인한다.
+
+Usage:
+  cd backend
+  python scripts/precompute_ai_summaries.py
+  python scripts/precompute_ai_summaries.py --fake --fake-delay 1.5 --concurrency 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.ai_client import FakeAIClient  # noqa: E402
+from app.utils.ai_summary_scheduler import precompute  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fake", action="store_true", help="Gemini 대신 가짜 클라이언트 사용")
+    parser.add_argument("--fake-delay", type=float, default=0.0, help="가짜 클라이언트 응답 지연 (초)")
+    parser.add_argument("--concurrency", type=int, default=None)
+    args = parser.parse_args()
+
+    client = FakeAIClient(delay=args.fake_delay) if args.fake else None
+    asyncio.run(precompute(client, concurrency=args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+기동(import) 시간 프로파일: `import app.main` 을 새 프로세스에서 실행해 측정한다.
+
+  1) 총 import 시간 (wall clock, --repeat 회 중앙값)
+  2) python -X importtime 결과에서 누적 시간이 큰 모듈 상위 N개
+  3) 기동 시 불필요하게 로드된 무거운 선택 의존성 (Gemini SDK, google-auth 등)
+
+import 만 측정하므로 DB 없이 실행된다. 마이그레이션/시드 시간은 python app/init_db.py 출력([init_db] ready in ...)을,
+워커 startup 훅 시간은 uvicorn 로그의 [startup] ready in ... 를 본다.
+
+Usage:
+  cd backend
+  python scripts/profile_startup.py
+  python scripts/profile_startup.py --top 40 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# 라우트가 처음 쓰일 때 import 해야 하는 무거운 선택 의존성
+LAZY_MODULES = ("google.genai", "google.auth", "google.oauth2", "requests")
+
+TARGET_MS = 1000
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_DIR)}
+    return subprocess.run(
+        [sys.executable, *args], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _wall_ms(repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        _run("-c", "import app.main")
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _importtime() -> list:
+    """(모듈, self_us, cumulative_us) 목록"""
+    rows = []
+    for line in _run("-X", "importtime", "-c", "import app.main").stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run(args) -> None:
+    wall = _wall_ms(args.repeat)
+    rows = _importtime()
+    total_us = next((cum for name, _, cum in rows if name == "app.main"), 0)
+
+    print(f"[profile] python -c 'import app.main': {wall:.0f}ms (median of {args.repeat}, 인터프리터 기동 포함)")
+    print(f"[profile] app.main import (importtime): {total_us / 1000:.0f}ms")
+    print()
+    print(f"{'cumulative (ms)':>16} {'self (ms)':>10}  module")
+    for name, self_us, cum_us in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"{cum_us / 1000:>16.1f} {self_us / 1000:>10.1f}  {name}")
+
+    loaded = sorted({name for name, _, _ in rows if name.startswith(LAZY_MODULES)})
+    print()
+    if loaded:
+        print(f"[profile] 기동 시 로드된 선택 의존성: {', '.join(loaded)}")
+    else:
+        print("[profile] 선택 의존성(Gemini SDK, google-auth) 은 기동 시 로드되지 않음")
+    verdict = "OK" if wall < TARGET_MS else "OVER"
+    print(f"[profile] 목표 {TARGET_MS}ms: {verdict}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=3)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+녹화한 GitHub 웹훅 payload 를 서명해서 다시 보낸다 (웹훅 수신 경로 테스트용).
+
+payload 파일은 둘 중 하나:
+  - GitHub 의 Recent Deliveries 에서 복사한 payload JSON 그대로 (--event 로 이벤트 이름 지정)
+  - {"event": "push", "delivery": "...", "payload": {...}} 형태로 저장한 녹화 파일
+
+서명은 GITHUB_WEBHOOK_SECRET (또는 --secret) 으로 만든다. 같은 delivery 를 두 번 보내면 duplicate 가 돌아와야 한다.
+
+Usage:
+  cd backend
+  python scripts/replay_github_webhook.py recorded/push.json
+  python scripts/replay_github_webhook.py payload.json --event pull_request --url http://localhost:8000/api/github/webhook
+  python scripts/replay_github_webhook.py recorded/*.json --new-delivery
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import httpx
+
+
+def _load(path: Path, event: str | None) -> tuple[str, str | None, dict]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if "payload" in data and "event" in data:
+        return data["event"], data.get("delivery"), data["payload"]
+    if not event:
+        sys.exit(f"{path}: raw payload needs --event")
+    return event, None, data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--event", help="raw payload 의 이벤트 이름 (push, pull_request, ...)")
+    parser.add_argument("--url", default="http://localhost:8000/api/github/webhook")
+    parser.add_argument("--secret", default=os.getenv("GITHUB_WEBHOOK_SECRET", ""))
+    parser.add_argument("--new-delivery", action="store_true", help="녹화된 delivery id 대신 새 id 로 보낸다")
+    args = parser.parse_args()
+    if not args.secret:
+        sys.exit("GITHUB_WEBHOOK_SECRET (or --secret) is required")
+
+    with httpx.Client(timeout=30) as client:
+        for path in args.files:
+            event, delivery, payload = _load(path, args.event)
+            if args.new_delivery or not delivery:
+                delivery = str(uuid.uuid4())
+            body = json.dumps(payload).encode()
+            signature = "sha256=" + hmac.new(args.secret.encode(), body, hashlib.sha256).hexdigest()
+            resp = client.post(
+                args.url,
+                content=body,
+                headers={
+                    "Content-Type": "application/json",
+                    "X-GitHub-Event": event,
+                    "X-GitHub-Delivery": delivery,
+                    "X-Hub-Signature-256": signature,
+                },
+            )
+            print(f"{path.name:<32} {event:<14} {delivery}  {resp.status_code} {resp.text}")
+
+
+if __name__ == "__main__":
+    main()